@@ -0,0 +1,161 @@
+"""
+Throughput benchmark for the AI parsing fallback (ENABLE_AI_PARSING)
+
+Runs synthetic notification pages through parse_with_strategies() with the
+structured parser forced to miss, so every page takes the AI fallback.
+Uses the offline 'local' provider with a simulated latency and failure
+rate; no network access or API keys are needed.
+
+Three measurements:
+1. AI off vs AI on, one page at a time (the cost the fallback adds)
+2. AI on at increasing concurrency (threads), to size CONCURRENT_REQUESTS
+   against provider latency
+3. AI queued (AI_QUEUE_ENABLED): spider callbacks only emit stubs, which
+   AIParsingPipeline answers in the reactor; reports callback pages/s
+   (what the crawl sees) separately from AI answer throughput
+
+ASSUMPTIONS:
+- Run from the project root
+- Simulated latency stands in for a real provider round-trip; pass the
+  p50 you see in ai/latency_ms_avg from a real crawl
+
+USAGE:
+    python benchmarks/bench_ai_fallback.py
+    python benchmarks/bench_ai_fallback.py --pages 200 --latency-ms 800 --failure-rate 0.05
+    python benchmarks/bench_ai_fallback.py --queue-rate 4 --queue-concurrency 8
+
+OUTPUT (per run):
+- pages/sec, p50/p99 per-page latency, failures
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src', 'scrapers'))
+
+CONCURRENCY_LEVELS = (1, 2, 4, 8, 16)
+
+
+def build_pages(count: int):
+    from scrapy.http import HtmlResponse
+
+    pages = []
+    for i in range(count):
+        html = (
+            f"<html><body><h1>Staff Selection Commission</h1>"
+            f"<p>Combined Graduate Level Examination {2000 + i}. Total vacancies: {1000 + i}. "
+            f"Opening date {1 + i % 28:02d}/06/2026, last date {1 + i % 28:02d}/07/2026.</p>"
+            f"</body></html>"
+        )
+        pages.append(HtmlResponse(url=f'https://ssc.nic.in/notice/{i}', body=html.encode('utf-8'),
+                                  encoding='utf-8'))
+    return pages
+
+
+def make_spider(ai_enabled: bool, options: dict, **extra):
+    from scrapy.settings import Settings
+    from ssc_scraper_complete import SSCScraper
+
+    spider = SSCScraper()
+    spider.settings = Settings(dict({
+        'ENABLE_AI_PARSING': ai_enabled,
+        'AI_PROVIDER': 'local',
+        'AI_PROVIDER_OPTIONS': options,
+        'HEURISTIC_PARSING_ENABLED': False,
+    }, **extra))
+    # Force the structured and heuristic strategies to miss so every page falls back
+    spider.parse_notification = lambda response, **kwargs: None
+    return spider
+
+
+def percentile(values, fraction):
+    values = sorted(values) or [0.0]
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def run(name, pages, concurrency, ai_enabled, options):
+    # One spider (and so one AIParser/provider) per worker thread, like
+    # separate in-flight requests each waiting on the provider
+    spiders = [make_spider(ai_enabled, dict(options, seed=i)) for i in range(concurrency)]
+    latencies, failures = [], 0
+
+    def parse(index):
+        spider = spiders[index % concurrency]
+        started = time.perf_counter()
+        data = spider.parse_with_strategies(pages[index])
+        return time.perf_counter() - started, data
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for latency, data in pool.map(parse, range(len(pages))):
+            latencies.append(latency * 1000)
+            failures += data is None
+    wall = time.perf_counter() - started
+
+    print(f"{name:<18} pages/s={len(pages) / wall:8.1f}  p50={percentile(latencies, 0.5):7.1f} ms  "
+          f"p99={percentile(latencies, 0.99):7.1f} ms  failures={failures}")
+
+
+def run_queued(pages, options, concurrency, rate):
+    from types import SimpleNamespace
+    from scrapy.statscollectors import StatsCollector
+    from twisted.internet import defer, reactor
+    from pipelines.ai_pipeline import AIParsingPipeline
+
+    spider = make_spider(True, options, AI_QUEUE_ENABLED=True, AI_QUEUE_CONCURRENCY=concurrency,
+                         AI_QUEUE_RATE=rate, AI_QUEUE_BURST=concurrency, AI_QUEUE_MAX_PENDING=len(pages))
+    crawler = SimpleNamespace(settings=spider.settings)
+    crawler.stats = StatsCollector(crawler)
+    pipeline = AIParsingPipeline(crawler)
+
+    @defer.inlineCallbacks
+    def scenario():
+        pipeline.open_spider(spider)
+        started = time.perf_counter()
+        stubs = [spider.safe_parse_notification(page) for page in pages]
+        callbacks = time.perf_counter() - started
+        items = yield defer.gatherResults([defer.maybeDeferred(pipeline.process_item, stub, spider)
+                                           for stub in stubs])
+        answered = time.perf_counter() - started
+        yield pipeline.close_spider(spider)
+        failures = sum(1 for item in items if item.get('ai_failed'))
+        print(f"{'AI queued':<18} callback pages/s={len(pages) / callbacks:8.0f}  "
+              f"answers/s={len(pages) / answered:6.1f}  failures={failures}  "
+              f"(concurrency={concurrency}, rate={rate:g}/s)")
+
+    def _stop(result):
+        reactor.stop()
+        return result
+
+    reactor.callWhenRunning(lambda: scenario().addBoth(_stop))
+    reactor.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pages', type=int, default=64)
+    parser.add_argument('--latency-ms', type=float, default=200)
+    parser.add_argument('--jitter', type=float, default=0.3)
+    parser.add_argument('--failure-rate', type=float, default=0.02)
+    parser.add_argument('--queue-concurrency', type=int, default=8)
+    parser.add_argument('--queue-rate', type=float, default=0, help='requests/s, 0 = unlimited')
+    args = parser.parse_args()
+
+    options = {'latency_ms': args.latency_ms, 'jitter': args.jitter, 'failure_rate': args.failure_rate}
+    pages = build_pages(args.pages)
+    print(f"{args.pages} pages, local provider latency={args.latency_ms:.0f} ms "
+          f"±{args.jitter:.0%}, failure_rate={args.failure_rate:.0%}")
+
+    run('AI off', pages, 1, False, options)
+    for concurrency in CONCURRENCY_LEVELS:
+        run(f'AI on x{concurrency}', pages, concurrency, True, options)
+    run_queued(pages, options, args.queue_concurrency, args.queue_rate)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Load test for the public read API (/api/)
+
+Fires --requests GETs from --concurrency threads (one keep-alive
+connection each) at a running server, cycling through --paths, and
+reports requests/s and p50/p99/max latency per path. --revalidate sends
+the ETag from the first response as If-None-Match, timing the 304 path a
+CDN or browser takes.
+
+ASSUMPTIONS:
+- A server is running (e.g. cd src/admin_panel && gunicorn
+  admin_panel.wsgi -w 4); manage.py runserver stalls keep-alive
+  responses ~40 ms on delayed ACKs, so use --close against it
+- The first request per path warms the cache; it is not counted
+
+USAGE:
+    python benchmarks/bench_api.py --url http://127.0.0.1:8000
+    python benchmarks/bench_api.py --paths /api/exams/ssc-cgl/ --revalidate --requests 20000
+    python benchmarks/bench_api.py --url http://127.0.0.1:8000 --close   # runserver
+"""
+
+import argparse
+import http.client
+import socket
+import threading
+import time
+from collections import Counter, defaultdict
+from urllib.parse import urlsplit
+
+DEFAULT_PATHS = ('/api/exams/', '/api/exams/?page=2', '/api/deadlines/', '/api/deadlines/?days=7')
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def connect(url):
+    parts = urlsplit(url)
+    cls = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+    conn = cls(parts.hostname, parts.port, timeout=30)
+    conn.connect()
+    # Without this, Nagle + delayed ACK adds ~40 ms to every keep-alive request
+    conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return conn
+
+
+def fetch(conn, path, headers):
+    conn.request('GET', path, headers=headers)
+    response = conn.getresponse()
+    body = response.read()
+    return response.status, response.getheader('ETag'), body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--paths', nargs='+', default=list(DEFAULT_PATHS))
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--revalidate', action='store_true', help='Send If-None-Match (expect 304s)')
+    parser.add_argument('--close', action='store_true',
+                        help='New connection per request (for servers without keep-alive, e.g. runserver)')
+    args = parser.parse_args()
+
+    warm = connect(args.url)
+    etags = {}
+    for path in args.paths:
+        status, etag, body = fetch(warm, path, {})
+        etags[path] = etag
+        print(f"warm {path}: {status}, {len(body):,} bytes, ETag {etag}")
+    warm.close()
+
+    latencies = defaultdict(list)
+    statuses = Counter()
+    lock = threading.Lock()
+    per_thread = args.requests // args.concurrency
+
+    def worker(offset):
+        conn = connect(args.url)
+        local = []
+        for n in range(per_thread):
+            path = args.paths[(offset + n) % len(args.paths)]
+            headers = {'If-None-Match': etags[path]} if args.revalidate and etags[path] else {}
+            t0 = time.perf_counter()
+            try:
+                if args.close:
+                    conn.close()
+                    conn = connect(args.url)
+                status = fetch(conn, path, headers)[0]
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = connect(args.url)
+                status = 'error'
+            local.append((path, status, time.perf_counter() - t0))
+        conn.close()
+        with lock:
+            for path, status, seconds in local:
+                latencies[path].append(seconds)
+                statuses[status] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    total = sum(statuses.values())
+    print(f"\n{total:,} requests in {elapsed:.2f}s: {total / elapsed:,.0f} req/s, "
+          f"concurrency {args.concurrency}, statuses {dict(statuses)}")
+    everything = sorted(s for values in latencies.values() for s in values)
+    for path, values in list(latencies.items()) + [('all', everything)]:
+        values.sort()
+        print(f"{path:<28} p50 {percentile(values, 0.50) * 1e3:7.2f} ms   "
+              f"p99 {percentile(values, 0.99) * 1e3:7.2f} ms   max {values[-1] * 1e3:7.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Per-item vs columnar confidence scoring
+
+Scores N synthetic ExamEvent.details rows two ways and reports rows/s:
+- per-item: validate_data() + calculate_confidence() on a spider, as
+  finalize_notification() does
+- batch: src.utils.batch_scoring.score_records() (NumPy masks)
+
+and checks both produce the same scores.
+
+ASSUMPTIONS:
+- Run from the project root
+- Row mix: ~1/3 complete, ~1/3 partial, rest missing links/dates or blank
+
+USAGE:
+    python benchmarks/bench_batch_scoring.py
+    python benchmarks/bench_batch_scoring.py --rows 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src', 'scrapers'))
+
+
+def make_rows(count: int, seed: int = 1):
+    rng = random.Random(seed)
+    full = {
+        'exam_name': 'Combined Graduate Level Examination 2026',
+        'organization': 'Staff Selection Commission',
+        'notification_date': '2026-06-24',
+        'official_link': 'https://ssc.nic.in/notice/cgl-2026',
+        'application_start': '2026-06-24',
+        'application_end': '2026-07-05',
+        'exam_date': '2026-09-14',
+        'total_vacancies': 17727,
+    }
+    rows = []
+    for _ in range(count):
+        row = dict(full)
+        for field in ('notification_date', 'official_link', 'application_end', 'exam_date', 'organization'):
+            if rng.random() < 0.3:
+                row[field] = rng.choice([None, '', '  ', '/relative.pdf'])
+        rows.append(row)
+    return rows
+
+
+def main():
+    from src.utils.batch_scoring import score_records
+    from ssc_scraper_complete import SSCScraper
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=200_000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    spider = SSCScraper()
+    spider.logger.logger.disabled = True  # validate_data() warns on every bad URL
+
+    started = time.perf_counter()
+    expected = []
+    for row in rows:
+        spider.validate_data(row)
+        expected.append(spider.calculate_confidence(row))
+    per_item = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = score_records(rows)
+    batch = time.perf_counter() - started
+
+    assert result.scores.tolist() == expected, 'batch scores differ from calculate_confidence()'
+    print(f"rows: {args.rows}")
+    print(f"per-item: {args.rows / per_item:>12,.0f} rows/s")
+    print(f"batch:    {args.rows / batch:>12,.0f} rows/s  ({per_item / batch:.1f}x)")
+    print(f"flagged for review: {int(result.review.sum())}")
+
+
+if __name__ == '__main__':
+    main()
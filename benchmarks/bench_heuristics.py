@@ -0,0 +1,96 @@
+"""
+Per-block cost and hit rate of the heuristic parser (Strategy 2)
+
+Runs HeuristicParser over the board fixtures in
+src/scrapers/tests/fixtures/boards/ and reports, per board:
+- blocks: candidate blocks (innermost elements holding a PDF link)
+- extract: µs per block for HeuristicParser.extract() on pre-collected
+  text and links (the pattern work alone)
+- element: µs per block for parse_element() (XPath text/link collection
+  from the parsel Selector + extract)
+- page: µs per parse_page() call (what parse_with_strategies pays)
+- confident: blocks at or above HEURISTIC_MIN_CONFIDENCE, i.e. pages that
+  no longer reach the AI fallback
+
+ASSUMPTIONS:
+- Run from the project root
+- Fixtures are small; --scale repeats every candidate block N times to
+  check per-page cost grows linearly on long listings
+
+USAGE:
+    python benchmarks/bench_heuristics.py
+    python benchmarks/bench_heuristics.py --repeat 2000 --scale 50
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+FIXTURES = os.path.join(PROJECT_ROOT, 'src', 'scrapers', 'tests', 'fixtures', 'boards')
+CANDIDATES = ('//*[self::tr or self::li or self::p or self::div][.//a[contains(@href, ".pdf")]]'
+              '[not(.//*[self::tr or self::li or self::p or self::div][.//a[contains(@href, ".pdf")]])]')
+
+
+def load(path: str, scale: int):
+    from scrapy.http import HtmlResponse
+
+    with open(path, encoding='utf-8') as f:
+        html = f.read()
+    if scale > 1:
+        # Repeat the listing body so long boards (hundreds of rows) are covered
+        html = re.sub(r'(<body[^>]*>)(.*)(</body>)', lambda m: m.group(1) + m.group(2) * scale + m.group(3),
+                      html, flags=re.S)
+    return HtmlResponse(url='https://board.gov.in/', body=html.encode('utf-8'), encoding='utf-8')
+
+
+def per_call_us(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main():
+    from src.utils.heuristic_parser import HeuristicParser
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=500)
+    parser.add_argument('--scale', type=int, default=1)
+    parser.add_argument('--min-confidence', type=int, default=50)
+    args = parser.parse_args()
+
+    heuristics = HeuristicParser()
+    print(f"{'board':<22}{'blocks':>7}{'extract µs':>12}{'element µs':>12}{'page µs':>11}{'confident':>11}")
+    worst = 0.0
+    for path in sorted(glob.glob(os.path.join(FIXTURES, '*.html'))):
+        response = load(path, args.scale)
+        blocks = response.xpath(CANDIDATES) or response.xpath('//body')
+        prepared = [
+            (' '.join(block.xpath('.//text()').getall()),
+             [(' '.join(a.xpath('.//text()').getall()), a.attrib.get('href', '')) for a in block.xpath('.//a[@href]')])
+            for block in blocks
+        ]
+
+        extract_us = per_call_us(lambda: [heuristics.extract(text, links) for text, links in prepared],
+                                 args.repeat) / len(blocks)
+        element_us = per_call_us(lambda: [heuristics.parse_element(block) for block in blocks],
+                                 args.repeat) / len(blocks)
+        page_us = per_call_us(lambda: heuristics.parse_page(response), max(1, args.repeat // 10))
+        results = [heuristics.parse_element(block) for block in blocks]
+        confident = sum(1 for data in results if data and data['heuristic_confidence'] >= args.min_confidence)
+        worst = max(worst, element_us)
+
+        print(f"{os.path.basename(path):<22}{len(blocks):>7}{extract_us:>12.1f}{element_us:>12.1f}"
+              f"{page_us:>11.0f}{confident:>6}/{len(blocks)}")
+
+    print(f"slowest block: {worst:.1f} µs ({'under' if worst < 1000 else 'OVER'} the 1 ms budget)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Reactor latency / throughput benchmark for process-pool parse offload
+
+Parses a synthetic SSC listing with many rows twice inside a running
+Twisted reactor: inline on the reactor thread (the default) and through
+BaseExamScraper.offload_parse(). A 10 ms heartbeat measures how long the
+reactor is blocked; in a real crawl that is how long every download in
+flight stalls.
+
+ASSUMPTIONS:
+- Run from the project root
+- Worker processes are spawned once; the first offloaded parse (cold)
+  includes interpreter + Scrapy import time and is reported separately
+
+USAGE:
+    python benchmarks/bench_offload.py
+    python benchmarks/bench_offload.py --rows 5000 --workers 4
+
+OUTPUT (per mode):
+- wall time, items/sec
+- reactor lag: max and p99 heartbeat delay beyond the 10 ms interval
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src', 'scrapers'))
+
+HEARTBEAT_SECONDS = 0.01
+LISTING_URL = 'https://ssc.nic.in/Portal/LatestNotification'
+
+
+def build_listing(rows: int):
+    from scrapy.http import HtmlResponse
+
+    body = ''.join(
+        f'<tr><td>Exam {i} Recruitment 2026</td><td>{1 + i % 28:02d}/0{1 + i % 9}/2026</td>'
+        f'<td><a href="/notices/exam-{i}.pdf">Exam {i} Recruitment 2026</a></td></tr>'
+        for i in range(rows)
+    )
+    html = f'<html><body><table><tr><th>Exam</th><th>Date</th><th>Link</th></tr>{body}</table></body></html>'
+    return HtmlResponse(url=LISTING_URL, body=html.encode('utf-8'), encoding='utf-8')
+
+
+class Heartbeat:
+    """Record how late each 10 ms tick fires"""
+
+    def __init__(self):
+        from twisted.internet import task
+
+        self.lags = []
+        self.last = None
+        self.loop = task.LoopingCall(self._tick)
+
+    def _tick(self):
+        now = time.perf_counter()
+        if self.last is not None:
+            self.lags.append(max(0.0, now - self.last - HEARTBEAT_SECONDS))
+        self.last = now
+
+    def start(self):
+        self.lags, self.last = [], None
+        self.loop.start(HEARTBEAT_SECONDS)
+
+    def stop(self):
+        self.loop.stop()
+        return self.lags
+
+
+def summarize(name, wall, items, lags):
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(f"{name:<16} wall={wall * 1000:8.1f} ms  items/s={items / wall:8.0f}  "
+          f"reactor lag max={lags_ms[-1]:7.1f} ms  p99={p99:6.1f} ms  median={statistics.median(lags_ms):5.1f} ms")
+
+
+def run(rows: int, workers: int):
+    from twisted.internet import defer, reactor, task
+    from scrapy.settings import Settings
+    from types import SimpleNamespace
+    from ssc_scraper_complete import SSCScraper
+
+    response = build_listing(rows)
+    spider = SSCScraper()
+    spider.crawler = SimpleNamespace(stats=None, settings=Settings({'PARSE_OFFLOAD_WORKERS': workers}))
+    heartbeat = Heartbeat()
+    print(f"{rows} rows, {len(response.body) / 1024:.0f} KiB, {workers} workers")
+
+    @defer.inlineCallbacks
+    def scenario():
+        # Let the heartbeat settle before each measurement
+        heartbeat.start()
+        yield task.deferLater(reactor, 0.1, lambda: None)
+        started = time.perf_counter()
+        items = yield task.deferLater(reactor, 0, lambda: list(spider.parse(response)))
+        wall = time.perf_counter() - started
+        # Give the heartbeat a tick to observe the blocked interval
+        yield task.deferLater(reactor, 0.05, lambda: None)
+        summarize('inline', wall, len(items), heartbeat.stop())
+
+        for name in ('offload (cold)', 'offload (warm)'):
+            heartbeat.start()
+            yield task.deferLater(reactor, 0.1, lambda: None)
+            started = time.perf_counter()
+            result = yield spider.offload_parse(response, 'parse')
+            wall = time.perf_counter() - started
+            yield task.deferLater(reactor, 0.05, lambda: None)
+            summarize(name, wall, len(result['items']), heartbeat.stop())
+
+        spider.closed('benchmark')
+
+    def _stop(result):
+        reactor.stop()
+        return result
+
+    reactor.callWhenRunning(lambda: scenario().addBoth(_stop))
+    reactor.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=3000)
+    parser.add_argument('--workers', type=int, default=2)
+    args = parser.parse_args()
+    run(args.rows, args.workers)
+
+
+if __name__ == '__main__':
+    main()
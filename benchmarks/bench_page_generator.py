@@ -0,0 +1,89 @@
+"""
+Per-page cost of PageGenerator context generation
+
+Generates --pages contexts round-robin over the five page types for
+synthetic exams (five pages per exam and year, as a full-site build
+does) and reports µs per page, per page type and overall. --render also
+times HTML rendering of each context with the compiled Jinja2 templates.
+
+ASSUMPTIONS:
+- Run from the project root
+- No DB: exam/event dicts are built up front, so only generator work
+  is timed
+
+USAGE:
+    python benchmarks/bench_page_generator.py
+    python benchmarks/bench_page_generator.py --pages 100000 --render
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+PAGE_TYPES = ('notification', 'admit_card', 'result', 'answer_key', 'syllabus')
+
+
+def make_inputs(pages: int):
+    exams = []
+    for n in range(pages // len(PAGE_TYPES) + 1):
+        exam = {'name': f'Combined Graduate Level Examination {n}', 'slug': f'ssc-cgl-{n}',
+                'organization': 'Staff Selection Commission'}
+        event = {'year': 2026, 'notification_date': '2026-06-24', 'application_start': '2026-06-24',
+                 'application_end': '2026-07-05', 'exam_date': '2026-09-14', 'total_vacancies': 17727,
+                 'pdf_link': f'https://ssc.nic.in/{n}.pdf', 'official_link': 'https://ssc.nic.in',
+                 'result_date': '2026-12-01', 'release_date': '2026-09-01'}
+        exams.append((exam, event))
+    return exams
+
+
+def main():
+    from src.page_generator.renderer import JinjaRenderer
+    from src.page_generator.template_generator import PageGenerator
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pages', type=int, default=100_000)
+    parser.add_argument('--render', action='store_true', help='Also time Jinja2 rendering')
+    args = parser.parse_args()
+
+    generator = PageGenerator()
+    renderer = JinjaRenderer() if args.render else None
+    calls = {
+        'notification': lambda exam, event: generator.generate_notification_page(exam, event),
+        'admit_card': lambda exam, event: generator.generate_admit_card_page(exam, event),
+        'result': lambda exam, event: generator.generate_result_page(exam, event, {'cutoff_general': 120.5}),
+        'answer_key': lambda exam, event: generator.generate_answer_key_page(exam, event),
+        'syllabus': lambda exam, event: generator.generate_syllabus_page(exam, None),
+    }
+    inputs = make_inputs(args.pages)
+    per_type = {page_type: [0.0, 0] for page_type in PAGE_TYPES}
+    render_seconds = 0.0
+
+    started = time.perf_counter()
+    for index in range(args.pages):
+        exam, event = inputs[index // len(PAGE_TYPES)]
+        page_type = PAGE_TYPES[index % len(PAGE_TYPES)]
+        t0 = time.perf_counter()
+        context = calls[page_type](exam, event)
+        t1 = time.perf_counter()
+        per_type[page_type][0] += t1 - t0
+        per_type[page_type][1] += 1
+        if args.render:
+            renderer.render(context)
+            render_seconds += time.perf_counter() - t1
+    total = time.perf_counter() - started
+
+    generate_seconds = sum(seconds for seconds, _ in per_type.values())
+    for page_type, (seconds, count) in per_type.items():
+        print(f"{page_type:<14}{seconds / count * 1e6:>8.1f} µs/page")
+    print(f"{'generate':<14}{generate_seconds / args.pages * 1e6:>8.1f} µs/page  ({args.pages} pages)")
+    if args.render:
+        print(f"{'render':<14}{render_seconds / args.pages * 1e6:>8.1f} µs/page")
+    print(f"wall: {total:.2f}s ({args.pages / total:,.0f} pages/s)")
+
+
+if __name__ == '__main__':
+    main()
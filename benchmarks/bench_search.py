@@ -0,0 +1,114 @@
+"""
+Typeahead latency of the in-memory PrefixIndex
+
+Builds a PrefixIndex over --exams synthetic exams (organization acronym +
+exam name + post/tier words, as crawled names look) and times --queries
+lookups for prefixes of 1-4 words cut at a random character, reporting
+build time, index memory and p50/p99/max lookup latency. A linear scan
+(what an uncached ILIKE does) is timed on a sample for comparison.
+
+ASSUMPTIONS:
+- Run from the project root
+- No DB: PostgreSQL full-text/trigram search (src/search/queries.py)
+  needs a server and is not timed here
+
+USAGE:
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py --exams 100000 --queries 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+ORGANIZATIONS = ('SSC', 'UPSC', 'IBPS', 'RRB', 'SBI', 'BPSC', 'UPPSC', 'RPSC', 'MPPSC', 'DSSSB', 'NTA', 'HPSC')
+EXAMS = ('Combined Graduate Level', 'Civil Services', 'Probationary Officer', 'Clerk', 'Junior Engineer',
+         'Non Technical Popular Categories', 'Assistant Loco Pilot', 'Staff Nurse', 'Constable',
+         'Stenographer', 'Teacher Eligibility Test', 'Forest Guard', 'Multi Tasking Staff')
+SUFFIXES = ('Examination', 'Recruitment', 'Tier I', 'Tier II', 'Mains', 'Prelims', 'Phase III', '')
+
+
+def make_rows(count: int, seed: int = 1):
+    rng = random.Random(seed)
+    rows = []
+    for exam_id in range(1, count + 1):
+        name = ' '.join(filter(None, (rng.choice(ORGANIZATIONS), rng.choice(EXAMS), rng.choice(SUFFIXES),
+                                      f'Post {exam_id}')))
+        rows.append((exam_id, name.lower().replace(' ', '-'), name))
+    return rows
+
+
+def make_queries(rows, count: int, seed: int = 2):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        words = rng.choice(rows)[2].lower().split()
+        start = rng.randrange(len(words))
+        phrase = ' '.join(words[start:start + rng.randint(1, 4)])
+        queries.append(phrase[:rng.randint(min(2, len(phrase)), len(phrase))])
+    return queries
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main():
+    from src.search.prefix_index import PrefixIndex, normalize
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--exams', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=10_000)
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    rows = make_rows(args.exams)
+    queries = make_queries(rows, args.queries)
+
+    started = time.perf_counter()
+    index = PrefixIndex(rows)
+    build_seconds = time.perf_counter() - started
+
+    # Memory measured on a second, traced build (tracing slows building ~7x)
+    tracemalloc.start()
+    traced = PrefixIndex(rows)
+    index_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del traced
+
+    latencies = []
+    empty = 0
+    for query in queries:
+        t0 = time.perf_counter()
+        suggestions = index.lookup(query, limit=args.limit)
+        latencies.append(time.perf_counter() - t0)
+        empty += not suggestions
+    latencies.sort()
+
+    # Baseline: substring scan over every name (uncached ILIKE '%q%')
+    names = [normalize(name) for _, _, name in rows]
+    sample = queries[:200]
+    t0 = time.perf_counter()
+    for query in sample:
+        needle = normalize(query)
+        [name for name in names if needle in name][:args.limit]
+    scan_ms = (time.perf_counter() - t0) / len(sample) * 1e3
+
+    print(f"exams            {len(index):>10,}")
+    print(f"build            {build_seconds:>10.2f} s")
+    print(f"index memory     {index_bytes / 2**20:>10.1f} MiB (incl. names/slugs)")
+    print(f"lookup p50       {percentile(latencies, 0.50) * 1e6:>10.1f} µs")
+    print(f"lookup p99       {percentile(latencies, 0.99) * 1e6:>10.1f} µs")
+    print(f"lookup max       {latencies[-1] * 1e6:>10.1f} µs")
+    print(f"no suggestions   {empty:>10,} of {len(queries):,}")
+    print(f"linear scan      {scan_ms * 1e3:>10.1f} µs/query (baseline)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Startup-time benchmark for scraper and task modules
+
+Runs each target import in a fresh interpreter with `python -X importtime`,
+parses the cumulative import time of the top-level module and fails if it
+exceeds its budget.
+
+ASSUMPTIONS:
+- Run from the project root (same as `scrapy` commands)
+- Budgets are generous enough for a cold CI runner; tighten locally
+
+USAGE:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 5
+
+EXIT CODE:
+- 0 → all targets within budget
+- 1 → at least one target over budget (or failed to import)
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# module → budget in milliseconds (cumulative import time)
+BUDGETS_MS = {
+    'src.scrapers.settings': 50,
+    'src.scrapers.scheduler.tasks': 400,
+    'src.scrapers.upsc_scraper_complete': 1500,
+    'src.scrapers.ssc_scraper_complete': 1500,
+}
+
+# Modules that must NOT be imported as a side effect of the target.
+# (celery itself imports the top-level `django` package for its fixups,
+# so the ORM/app registry is checked instead.)
+FORBIDDEN_MODULES = {
+    'src.scrapers.settings': ['django', 'scrapy'],
+    'src.scrapers.scheduler.tasks': ['django.db.models', 'core_admin', 'scrapy'],
+    'src.scrapers.upsc_scraper_complete': ['django.db.models', 'core_admin', 'dateutil', 'openai'],
+    'src.scrapers.ssc_scraper_complete': ['django.db.models', 'core_admin', 'dateutil', 'openai'],
+}
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$')
+
+
+def measure_import(module: str):
+    """
+    Import `module` in a fresh interpreter.
+
+    Returns (cumulative_ms, loaded_modules) or raises RuntimeError.
+    """
+    code = (
+        f"import sys; sys.path.insert(0, {PROJECT_ROOT!r}); "
+        f"sys.path.insert(0, {os.path.join(PROJECT_ROOT, 'src', 'scrapers')!r}); "
+        f"import {module}; "
+        f"print('\\n'.join(sorted(sys.modules)))"
+    )
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else 'import failed')
+
+    cumulative_us = None
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match and match.group(4) == module:
+            cumulative_us = int(match.group(2))
+
+    if cumulative_us is None:
+        raise RuntimeError(f"No importtime entry for {module}")
+
+    return cumulative_us / 1000.0, set(proc.stdout.split())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=3, help='fresh interpreters per target')
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"{'module':<40} {'median ms':>10} {'budget ms':>10}  status")
+    for module, budget in BUDGETS_MS.items():
+        try:
+            samples = []
+            loaded = set()
+            for _ in range(args.runs):
+                ms, loaded = measure_import(module)
+                samples.append(ms)
+        except RuntimeError as e:
+            print(f"{module:<40} {'-':>10} {budget:>10}  ERROR ({e})")
+            failed = True
+            continue
+
+        median = statistics.median(samples)
+        leaked = [m for m in FORBIDDEN_MODULES.get(module, []) if m in loaded]
+        status = 'ok'
+        if median > budget:
+            status = 'OVER BUDGET'
+            failed = True
+        if leaked:
+            status += f" (eagerly imports: {', '.join(leaked)})"
+            failed = True
+        print(f"{module:<40} {median:>10.1f} {budget:>10}  {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,7 +2,7 @@
 
 ASSUMPTIONS:
 - PostgreSQL connection string is provided via DATABASE_URL
-- Admin panel is internal-only
+- Admin panel is internal-only; /api/ is the public read API
 """
 import os
 from pathlib import Path
@@ -91,6 +91,27 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Public read API cache (core_admin/api.py): Redis when REDIS_URL is set,
+# else a per-process LRU (LocMemCache evicts least recently used past MAX_ENTRIES)
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": REDIS_URL}}
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        }
+    }
+API_CACHE_TTL = int(os.getenv("API_CACHE_TTL", "300"))
+API_MAX_AGE = int(os.getenv("API_MAX_AGE", "60"))
+
+# Static site build (manage.py build_pages)
+STATIC_SITE_DIR = Path(os.getenv("STATIC_SITE_DIR", BASE_DIR.parent.parent / "site"))
+SITE_BASE_URL = os.getenv("SITE_BASE_URL", "https://examforms.org")
+# Pages rewritten by the last build (slugs + URLs, for targeted CDN purges)
+PAGE_MANIFEST_PATH = Path(os.getenv("PAGE_MANIFEST_PATH", BASE_DIR.parent.parent / "site-changes.json"))
+
 # Admin branding
 ADMIN_SITE_HEADER = "ExamForms Admin"
 ADMIN_SITE_TITLE = "ExamForms Admin"
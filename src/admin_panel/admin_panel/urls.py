@@ -1,6 +1,6 @@
 """URL configuration for admin panel"""
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
 
 admin.site.site_header = "ExamForms Admin"
 admin.site.site_title = "ExamForms Admin"
@@ -8,4 +8,5 @@ admin.site.index_title = "Operational Dashboard"
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("api/", include("core_admin.urls")),
 ]
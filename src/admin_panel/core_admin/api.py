@@ -0,0 +1,181 @@
+"""Payloads and cache for the public read API (views.py, /api/).
+
+Three read-heavy resources: the exam list, one exam with its events, and
+upcoming application deadlines (read from the upcoming_deadlines table,
+see deadlines.py). Each is built with values() queries
+(plain dicts, no model instances), encoded once with orjson and cached
+as (etag, body) bytes, so a cache hit is one cache GET and no encoding.
+
+ASSUMPTIONS:
+- The cache is Django's default cache (settings.CACHES): Redis when
+  REDIS_URL is set, else a per-process LocMemCache (LRU with TTL)
+- DatabasePipeline calls exam_written() after each committed write;
+  deadlines.refresh() callers call deadlines_refreshed()
+
+CONDITIONS:
+- Exam detail entries are rebuilt and stored on write (write-through)
+- Exam list and deadline entries are keyed by a version number that a
+  write (or deadline refresh) bumps, so every page/window is invalidated
+  with one INCR
+- ETag is a hash of the body: equal bodies give equal ETags across
+  processes and rebuilds
+- Entries expire after API_CACHE_TTL, which bounds staleness for writes
+  that bypass the pipeline (admin edits, bulk repairs)
+
+FAILURE MODES:
+- Cache unreachable → exam_written() logs and returns (the pipeline must
+  not fail on it); views raise, as for a DB outage
+- LocMemCache → pipeline writes in another process do not reach the web
+  process; entries there refresh on TTL only
+"""
+
+import hashlib
+import json
+import logging
+from datetime import date
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from core_admin import deadlines as deadline_table
+from core_admin.models import Exam, ExamEvent
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, see dumps()
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "api:v1"
+PAGE_SIZE = 100
+MAX_DEADLINE_DAYS = 90
+MAX_DEADLINES = 500
+
+EXAM_FIELDS = ("slug", "name", "organization", "category", "exam_type", "status")
+EVENT_FIELDS = ("event_type", "year", "event_date", "application_start", "application_end", "exam_date",
+                "status", "official_link", "pdf_link", "download_link", "total_vacancies", "updated_at")
+
+# (etag, body)
+Entry = Tuple[str, bytes]
+
+
+def _json_default(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload: Any) -> bytes:
+    """Compact JSON bytes; dates/datetimes as ISO 8601 either way"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def encode(payload: Any) -> Entry:
+    body = dumps(payload)
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"', body
+
+
+# ============================================================================
+# PAYLOADS (values() queries)
+# ============================================================================
+
+def exam_list_payload(page: int, page_size: int = PAGE_SIZE) -> Dict[str, Any]:
+    exams = Exam.objects.filter(is_active=True)
+    offset = (page - 1) * page_size
+    return {
+        "count": exams.count(),
+        "page": page,
+        "page_size": page_size,
+        "results": list(exams.order_by("name", "pk").values(*EXAM_FIELDS)[offset:offset + page_size]),
+    }
+
+
+def exam_detail_payload(slug: str) -> Optional[Dict[str, Any]]:
+    exam = Exam.objects.filter(slug=slug, is_active=True).values("pk", *EXAM_FIELDS).first()
+    if exam is None:
+        return None
+    exam["events"] = list(ExamEvent.objects.filter(exam_id=exam.pop("pk"))
+                          .order_by("-year", "event_type").values(*EVENT_FIELDS))
+    return exam
+
+
+def deadlines_payload(today: date, days: int, organization: Optional[str] = None) -> Dict[str, Any]:
+    """Application windows closing within `days` of `today`, soonest first"""
+    results = deadline_table.closing_within(today, days, MAX_DEADLINES, organization=organization)
+    return {"from": today, "days": days, "organization": organization, "results": results}
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+def _version(name: str) -> int:
+    return cache.get_or_set(f"{KEY_PREFIX}:{name}:version", 1, timeout=None)
+
+
+def _bump(name: str) -> None:
+    key = f"{KEY_PREFIX}:{name}:version"
+    try:
+        cache.incr(key)
+    except ValueError:  # missing (evicted or never read)
+        cache.set(key, 2, timeout=None)
+
+
+def _cached(key: str, build: Callable[[], Optional[Any]]) -> Optional[Entry]:
+    entry = cache.get(key)
+    if entry is None:
+        payload = build()
+        if payload is None:
+            return None
+        entry = encode(payload)
+        cache.set(key, entry, settings.API_CACHE_TTL)
+    return entry
+
+
+def exam_list(page: int) -> Entry:
+    return _cached(f"{KEY_PREFIX}:exams:{_version('exams')}:{page}", lambda: exam_list_payload(page))
+
+
+def exam_detail(slug: str) -> Optional[Entry]:
+    return _cached(f"{KEY_PREFIX}:exam:{slug}", lambda: exam_detail_payload(slug))
+
+
+def deadlines(days: int, organization: Optional[str] = None, today: Optional[date] = None) -> Entry:
+    today = today or timezone.localdate()
+    digest = hashlib.blake2b((organization or "").encode("utf-8"), digest_size=8).hexdigest()
+    key = f"{KEY_PREFIX}:deadlines:{_version('deadlines')}:{today.isoformat()}:{days}:{digest}"
+    return _cached(key, lambda: deadlines_payload(today, days, organization))
+
+
+def exam_written(slug: str, exam_created: bool = False) -> None:
+    """
+    Refresh the cache after the pipeline wrote an exam's event
+
+    The detail entry is rebuilt now; the exam list is invalidated by a
+    version bump if the exam is new. Deadline windows are not touched:
+    they read the upcoming_deadlines table, which changes on refresh.
+    """
+    try:
+        payload = exam_detail_payload(slug)
+        key = f"{KEY_PREFIX}:exam:{slug}"
+        if payload is None:
+            cache.delete(key)
+        else:
+            cache.set(key, encode(payload), settings.API_CACHE_TTL)
+        if exam_created:
+            _bump("exams")
+    except Exception as e:
+        logger.warning(f"API cache refresh failed for {slug}: {e}")
+
+
+def deadlines_refreshed() -> None:
+    """Invalidate every cached deadline window after deadlines.refresh(); never raises"""
+    try:
+        _bump("deadlines")
+    except Exception as e:
+        logger.warning(f"API cache invalidation failed for deadlines: {e}")
@@ -0,0 +1,72 @@
+"""Upcoming-deadlines table (upcoming_deadlines): refresh and queries.
+
+"Applications closing in the next N days" would otherwise scan
+exam_events on application_end and join exams for every request. The
+UpcomingDeadline table holds one row per open application window with the
+exam's name, slug and organization copied in, so a window query is one
+index range scan on (application_end, event) with no join.
+
+ASSUMPTIONS:
+- refresh() runs after each crawl (scheduler task
+  refresh_upcoming_deadlines) and daily after midnight, so rows are at
+  most one crawl behind exam_events
+- A few thousand open windows at a time: a full rebuild is cheaper and
+  simpler than diffing
+
+CONDITIONS:
+- refresh() swaps the contents in one transaction: readers see the old
+  rows until it commits, never an empty or half-built table
+- On PostgreSQL concurrent refreshes queue on an EXCLUSIVE table lock,
+  which does not block plain SELECTs; SQLite serializes writers anyway
+- Queries filter on application_end, so windows that closed since the
+  last refresh are never returned
+- "Today" is timezone.localdate(): windows follow settings.TIME_ZONE,
+  not the host clock
+
+FAILURE MODES:
+- Refresh fails → transaction rolls back, the previous rows stay served
+- Exam deactivated or renamed between refreshes → old name/row served
+  until the next refresh
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core_admin.models import ExamEvent, UpcomingDeadline
+
+FIELDS = ("exam_slug", "exam_name", "organization", "event_type", "year",
+          "application_start", "application_end", "exam_date", "official_link")
+
+
+def refresh(today: Optional[date] = None) -> int:
+    """Rebuild the table from exam_events; returns the number of open windows"""
+    today = today or timezone.localdate()
+    refreshed_at = timezone.now()
+    open_windows = (ExamEvent.objects
+                    .filter(application_end__gte=today, exam__is_active=True)
+                    .values("exam_id", "event_type", "year", "application_start", "application_end",
+                            "exam_date", "official_link", event_id=F("pk"), exam_slug=F("exam__slug"),
+                            exam_name=F("exam__name"), organization=F("exam__organization")))
+
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(f"LOCK TABLE {UpcomingDeadline._meta.db_table} IN EXCLUSIVE MODE")
+        rows = [UpcomingDeadline(refreshed_at=refreshed_at, **values) for values in open_windows]
+        UpcomingDeadline.objects.all().delete()
+        UpcomingDeadline.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def closing_within(today: date, days: int, limit: int,
+                   organization: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Open windows closing within `days` of `today` (inclusive), soonest first"""
+    deadlines = UpcomingDeadline.objects.filter(application_end__gte=today,
+                                                application_end__lte=today + timedelta(days=days))
+    if organization:
+        deadlines = deadlines.filter(organization=organization)
+    return list(deadlines.order_by("application_end", "event_id").values(*FIELDS)[:limit])
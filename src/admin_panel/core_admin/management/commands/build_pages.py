@@ -0,0 +1,79 @@
+"""Build static pages: flagged pages (default) or the whole site (--all).
+
+ASSUMPTIONS:
+- propagate_status_change() (or an admin edit) flags the pages to rebuild
+- The web server serves STATIC_SITE_DIR/<slug>/index.html
+
+CONDITIONS:
+- Only dirty rows are read, in chunks (see src/page_generator/build.py)
+- Flags are cleared only for pages actually written
+- Safe to run from cron after every crawl: no dirty rows, no work
+- --all renders every exam x year x page type across --workers
+  processes, each with its own DB connection
+- Pages whose content hash is unchanged are not rewritten; the slugs and
+  URLs of pages that were are written to --manifest (PAGE_MANIFEST_PATH)
+  for a targeted CDN purge
+"""
+
+import os
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# core_admin/management/commands → project root (for src.page_generator)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), *[os.pardir] * 5))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.page_generator.build import PageBuilder, build_site, write_manifest  # noqa: E402
+
+
+class Command(BaseCommand):
+    help = "Rebuild static pages whose PageMetadata.needs_regeneration is set, or all pages with --all"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=str(settings.STATIC_SITE_DIR))
+        parser.add_argument("--base-url", default=settings.SITE_BASE_URL)
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument("--limit", type=int, default=None, help="Build at most this many dirty pages")
+        parser.add_argument("--all", action="store_true", help="Full rebuild of every exam's pages")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                            help="Processes for --all; 0 builds in this process")
+        parser.add_argument("--partition-size", type=int, default=200, help="Exams per worker task for --all")
+        parser.add_argument("--manifest", default=str(settings.PAGE_MANIFEST_PATH),
+                            help="Where to write the changed-pages manifest")
+
+    def handle(self, *args, **options):
+        if options["all"]:
+            return self._build_all(options)
+
+        builder = PageBuilder(options["output"], base_url=options["base_url"], chunk_size=options["chunk_size"])
+        started = time.perf_counter()
+        stats = builder.build_dirty(limit=options["limit"])
+        elapsed = time.perf_counter() - started
+        write_manifest(options["manifest"], builder.changed)
+        self.stdout.write(self.style.SUCCESS(
+            f"Built {stats['pages_built']} pages ({stats['bytes_written'] / 1024:.0f} KiB) in {elapsed:.1f}s; "
+            f"{stats['pages_unchanged']} unchanged, {stats['pages_skipped']} skipped, {stats['pages_failed']} failed"
+        ))
+
+    def _build_all(self, options):
+        def progress(totals):
+            self.stdout.write(
+                f"{totals['exams']}/{totals['exams_total']} exams, {totals['pages_built']} pages written, "
+                f"{totals['pages_unchanged']} unchanged, {totals['pages_per_sec']:.0f} pages/s"
+            )
+
+        stats = build_site(options["output"], base_url=options["base_url"], workers=options["workers"],
+                           partition_size=options["partition_size"], chunk_size=min(options["chunk_size"], 100),
+                           progress=progress)
+        write_manifest(options["manifest"], stats["changed"])
+        peak = f"{stats['peak_rss_kb'] / 1024:.0f} MiB" if stats["peak_rss_kb"] else "n/a"
+        self.stdout.write(self.style.SUCCESS(
+            f"Built {stats['pages_built']} pages ({stats['pages_unchanged']} unchanged) "
+            f"for {stats['exams']} exams in {stats['elapsed']:.1f}s "
+            f"({stats['pages_per_sec']:.0f} pages/s, {stats['workers']} workers, peak RSS per process {peak}); "
+            f"{stats['pages_failed']} pages and {stats['exams_failed']} exams failed"
+        ))
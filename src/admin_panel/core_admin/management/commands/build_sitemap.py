@@ -0,0 +1,45 @@
+"""Write sitemap.xml (index) and its gzipped shards into the static site.
+
+ASSUMPTIONS:
+- The web server serves STATIC_SITE_DIR at SITE_BASE_URL, so
+  <base-url>/sitemap.xml is what robots.txt points at
+
+CONDITIONS:
+- Only shards containing added, changed or deleted pages are rewritten
+  (see src/page_generator/sitemap.py); --force rewrites all
+- Safe to run from cron after build_pages: nothing changed, nothing written
+"""
+
+import os
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# core_admin/management/commands → project root (for src.page_generator)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), *[os.pardir] * 5))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.page_generator.sitemap import SHARD_SIZE, generate_sitemaps  # noqa: E402
+
+
+class Command(BaseCommand):
+    help = "Update the sharded sitemap and sitemap index, rewriting only shards with changed pages"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=str(settings.STATIC_SITE_DIR))
+        parser.add_argument("--base-url", default=settings.SITE_BASE_URL)
+        parser.add_argument("--shard-size", type=int, default=SHARD_SIZE, help="URLs per shard (max 50000)")
+        parser.add_argument("--force", action="store_true", help="Rewrite every shard")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        stats = generate_sitemaps(options["output"], base_url=options["base_url"],
+                                  shard_size=min(options["shard_size"], SHARD_SIZE), force=options["force"])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Sitemap: {stats['shards']} shards, {stats['shards_written']} rewritten "
+            f"({stats['urls_written']} URLs), {stats['shards_removed']} removed in {elapsed:.1f}s"
+        ))
@@ -0,0 +1,25 @@
+"""Rebuild the upcoming_deadlines table from exam_events.
+
+CONDITIONS:
+- Same as the scheduler task refresh_upcoming_deadlines: one
+  transaction, readers see the old rows until it commits
+- Cached /api/deadlines/ windows are invalidated afterwards
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from core_admin import api, deadlines
+
+
+class Command(BaseCommand):
+    help = "Rebuild the upcoming_deadlines table (open application windows, exam pre-joined)"
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        count = deadlines.refresh()
+        api.deadlines_refreshed()
+        self.stdout.write(self.style.SUCCESS(
+            f"Upcoming deadlines: {count} open windows in {time.perf_counter() - started:.2f}s"
+        ))
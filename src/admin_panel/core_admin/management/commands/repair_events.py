@@ -0,0 +1,185 @@
+"""Re-run item normalization over stored ExamEvent rows.
+
+ASSUMPTIONS:
+- ExamEvent.details holds the item finalize_notification() produced;
+  src/utils/event_repair.py re-applies the same normalization (dates,
+  vacancies, URLs, text) and mirrors the results onto the event columns
+- Repairs are idempotent, so re-processing rows after a crash is harmless
+
+CONDITIONS:
+- Rows stream in primary-key order with iterator(chunk_size) (a
+  server-side cursor on PostgreSQL); only pk, details and the mirrored
+  columns are read
+- Batches are repaired in a process pool (--workers 0 repairs inline);
+  the main process only reads and writes
+- Results are written in submission order, one bulk_update per batch in
+  a transaction, and the checkpoint (last pk written) is saved after
+  each; --resume continues from it
+- The same transaction bumps the repaired events' updated_at (bulk_update
+  skips auto_now) and flags their exams' pages needs_regeneration, so
+  build_pages and the sitemap pick the repair up
+- Rows whose details are not a JSON object are skipped and counted
+- --dry-run repairs and reports but writes neither rows nor checkpoint
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from core_admin.models import ExamEvent, PageMetadata
+
+# core_admin/management/commands → project root (for src.utils)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), *[os.pardir] * 5))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.utils.event_repair import repair_batch  # noqa: E402
+
+COLUMNS = ("event_date", "application_start", "application_end", "exam_date",
+           "official_link", "pdf_link", "total_vacancies")
+
+
+def _load_checkpoint(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _save_checkpoint(path, state):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def _as_plain(value):
+    """Column value as the worker compares it (dates as YYYY-MM-DD)"""
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+class Command(BaseCommand):
+    help = "Re-normalize ExamEvent.details (dates, vacancies, URLs) in bulk, resumably"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                            help="Repair processes; 0 repairs in this process")
+        parser.add_argument("--checkpoint", default=os.path.join(".checkpoints", "repair_events.json"))
+        parser.add_argument("--resume", action="store_true", help="Continue after the checkpoint's last pk")
+        parser.add_argument("--threshold", type=int, default=None,
+                            help="Review threshold for rescoring (default: batch_scoring.REVIEW_THRESHOLD)")
+        parser.add_argument("--progress-every", type=float, default=10.0, help="Seconds between progress lines")
+        parser.add_argument("--dry-run", action="store_true", help="Repair and report, write nothing")
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.state = {"last_pk": 0, "processed": 0, "changed": 0, "skipped": 0}
+        if options["resume"]:
+            self.state.update(_load_checkpoint(options["checkpoint"]))
+            self.stdout.write(f"Resuming after pk {self.state['last_pk']} "
+                              f"({self.state['processed']} rows already processed)")
+
+        queryset = (ExamEvent.objects.filter(pk__gt=self.state["last_pk"], details__isnull=False)
+                    .order_by("pk").values_list("pk", "details", *COLUMNS))
+        self.total = queryset.count()
+        self.run_processed = 0
+        self.started = self.last_report = time.perf_counter()
+
+        workers = options["workers"]
+        pool = (ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+                if workers > 0 else None)
+        pending = deque()
+        try:
+            batch = []
+            for row in queryset.iterator(chunk_size=options["batch_size"]):
+                batch.append(row)
+                if len(batch) >= options["batch_size"]:
+                    pending.append(self._submit(pool, batch))
+                    batch = []
+                    # Bounded in flight; write finished batches in order
+                    while pending and (len(pending) > 2 * max(workers, 1) or pending[0][2].done()):
+                        self._write(*pending.popleft())
+            if batch:
+                pending.append(self._submit(pool, batch))
+            while pending:
+                self._write(*pending.popleft())
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        elapsed = time.perf_counter() - self.started
+        verb = "Would repair" if options["dry_run"] else "Repaired"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {self.state['changed']} of {self.state['processed']} events "
+            f"({self.run_processed / elapsed if elapsed else 0:.0f} rows/s this run)"
+        ))
+        if self.state["skipped"]:
+            self.stdout.write(self.style.WARNING(
+                f"Skipped {self.state['skipped']} events whose details are not a JSON object"
+            ))
+
+    def _submit(self, pool, batch):
+        rows = [(row[0], row[1], {column: _as_plain(value) for column, value in zip(COLUMNS, row[2:])})
+                for row in batch]
+        if pool is not None:
+            future = pool.submit(repair_batch, rows, self.options["threshold"])
+        else:
+            future = Future()
+            future.set_result(repair_batch(rows, self.options["threshold"]))
+        return batch[-1][0], batch, future
+
+    def _write(self, last_pk, batch, future):
+        changes = future.result()
+        if changes and not self.options["dry_run"]:
+            current = {row[0]: row for row in batch}
+            now = timezone.now()
+            fields = {"updated_at"}
+            events = []
+            for pk, details, columns in changes:
+                row = current[pk]
+                # Unchanged columns keep their read values, so one field list fits the whole batch
+                event = ExamEvent(pk=pk, details=details if details is not None else row[1],
+                                  updated_at=now, **dict(zip(COLUMNS, row[2:])))
+                for column, value in columns.items():
+                    setattr(event, column, value)
+                fields.update(columns)
+                if details is not None:
+                    fields.add("details")
+                events.append(event)
+            with transaction.atomic():
+                ExamEvent.objects.bulk_update(events, sorted(fields))
+                exam_ids = ExamEvent.objects.filter(pk__in=[event.pk for event in events]).values("exam_id")
+                PageMetadata.objects.filter(exam_id__in=exam_ids).update(needs_regeneration=True, updated_at=Now())
+
+        self.state["last_pk"] = last_pk
+        self.state["processed"] += len(batch)
+        self.state["changed"] += len(changes)
+        self.state["skipped"] += sum(not isinstance(row[1], dict) for row in batch)
+        self.run_processed += len(batch)
+        if not self.options["dry_run"]:
+            _save_checkpoint(self.options["checkpoint"], self.state)
+        self._report()
+
+    def _report(self):
+        now = time.perf_counter()
+        if now - self.last_report < self.options["progress_every"] and self.run_processed < self.total:
+            return
+        self.last_report = now
+        rate = self.run_processed / (now - self.started) if now > self.started else 0.0
+        eta = (self.total - self.run_processed) / rate if rate else 0.0
+        self.stdout.write(
+            f"{self.run_processed}/{self.total} rows ({100.0 * self.run_processed / max(self.total, 1):.1f}%), "
+            f"{self.state['changed']} changed, {rate:.0f} rows/s, eta {eta:.0f}s"
+        )
@@ -0,0 +1,98 @@
+"""Re-score stored ExamEvent details and refresh requires_manual_review.
+
+ASSUMPTIONS:
+- ExamEvent.details holds the item finalize_notification() produced
+- Scoring matches BaseExamScraper.calculate_confidence() (see
+  src/utils/batch_scoring.py), so re-running after a weight or threshold
+  change is the only reason scores move
+
+CONDITIONS:
+- Rows are streamed in primary-key order (iterator(chunk_size)), scored
+  per batch with NumPy masks, and only rows whose confidence_score or
+  requires_manual_review changed are written (one bulk_update per batch)
+- Idempotent: a second run writes nothing
+- updated_at is NOT touched (bulk_update skips auto_now), so pages are
+  not regenerated for a score change
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from core_admin.models import ExamEvent
+
+# core_admin/management/commands → project root (for src.utils)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), *[os.pardir] * 5))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.utils.batch_scoring import REVIEW_THRESHOLD, score_records  # noqa: E402
+
+
+def _stored_score(details) -> int:
+    """Current confidence_score, -1 when missing or not an int"""
+    value = details.get("confidence_score") if isinstance(details, dict) else None
+    return value if isinstance(value, int) and not isinstance(value, bool) else -1
+
+
+class Command(BaseCommand):
+    help = "Re-score ExamEvent.details in bulk and update requires_manual_review"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--threshold", type=int, default=REVIEW_THRESHOLD,
+                            help="Scores below this are flagged for manual review")
+        parser.add_argument("--dry-run", action="store_true", help="Score and report, write nothing")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = ExamEvent.objects.filter(details__isnull=False).only("id", "details").order_by("pk")
+
+        totals = {"scanned": 0, "changed": 0, "flagged": 0, "cleared": 0}
+        started = time.perf_counter()
+        batch = []
+        for event in queryset.iterator(chunk_size=batch_size):
+            batch.append(event)
+            if len(batch) >= batch_size:
+                self._rescore(batch, options, totals)
+                batch = []
+        if batch:
+            self._rescore(batch, options, totals)
+
+        elapsed = time.perf_counter() - started
+        rate = totals["scanned"] / elapsed if elapsed else 0.0
+        verb = "Would update" if options["dry_run"] else "Updated"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {totals['changed']} of {totals['scanned']} events "
+            f"({totals['flagged']} flagged, {totals['cleared']} cleared) in {elapsed:.1f}s ({rate:.0f} rows/s)"
+        ))
+
+    def _rescore(self, batch, options, totals):
+        details = [event.details for event in batch]
+        result = score_records(details, options["threshold"])
+
+        old_scores = np.fromiter((_stored_score(row) for row in details), dtype=np.int32, count=len(details))
+        old_review = np.fromiter(
+            (bool(row.get("requires_manual_review")) if isinstance(row, dict) else False for row in details),
+            dtype=bool, count=len(details))
+        changed = np.flatnonzero((old_scores != result.scores) | (old_review != result.review))
+
+        updated = []
+        for index in changed.tolist():
+            event = batch[index]
+            data = event.details
+            if not isinstance(data, dict):
+                continue
+            data["confidence_score"] = int(result.scores[index])
+            data["requires_manual_review"] = bool(result.review[index])
+            updated.append(event)
+
+        totals["scanned"] += len(batch)
+        totals["changed"] += len(updated)
+        totals["flagged"] += int((result.review & ~old_review).sum())
+        totals["cleared"] += int((old_review & ~result.review).sum())
+        if updated and not options["dry_run"]:
+            ExamEvent.objects.bulk_update(updated, ["details"], batch_size=options["batch_size"])
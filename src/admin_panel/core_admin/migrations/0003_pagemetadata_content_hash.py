@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 15:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_admin', '0002_scraperlog_examevent_details_examevent_download_link_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pagemetadata',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-19 15:52
+
+from django.db import migrations, models
+
+# PostgreSQL only (src/search/queries.py); other backends skip these.
+# The tsvector expression must match queries.EXAM_DOCUMENT_SQL exactly.
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS exams_search_fts_gin ON exams USING gin ("
+    "to_tsvector('simple', coalesce(exams.name, '') || ' ' || coalesce(exams.organization, '') "
+    "|| ' ' || replace(exams.slug, '-', ' ')))",
+    "CREATE INDEX IF NOT EXISTS exams_name_trgm_gin ON exams USING gin (name gin_trgm_ops)",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS exams_name_trgm_gin",
+    "DROP INDEX IF EXISTS exams_search_fts_gin",
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_admin', '0003_pagemetadata_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='examevent',
+            index=models.Index(fields=['exam', 'event_type', 'year'], name='exam_events_exam_type_year'),
+        ),
+        migrations.RunPython(_run_on_postgres(POSTGRES_FORWARD), _run_on_postgres(POSTGRES_BACKWARD)),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.30 on 2026-10-19 16:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_admin', '0004_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UpcomingDeadline',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('exam_slug', models.CharField(max_length=500)),
+                ('exam_name', models.CharField(max_length=500)),
+                ('organization', models.CharField(blank=True, max_length=255, null=True)),
+                ('event_type', models.CharField(max_length=50)),
+                ('year', models.IntegerField()),
+                ('application_start', models.DateField(blank=True, null=True)),
+                ('application_end', models.DateField()),
+                ('exam_date', models.DateField(blank=True, null=True)),
+                ('official_link', models.TextField(blank=True, null=True)),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'upcoming_deadlines',
+                'managed': True,
+            },
+        ),
+        migrations.AddIndex(
+            model_name='examevent',
+            index=models.Index(fields=['application_end'], name='exam_events_application_end'),
+        ),
+        migrations.AddField(
+            model_name='upcomingdeadline',
+            name='event',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='deadline', to='core_admin.examevent'),
+        ),
+        migrations.AddField(
+            model_name='upcomingdeadline',
+            name='exam',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deadlines', to='core_admin.exam'),
+        ),
+        migrations.AddIndex(
+            model_name='upcomingdeadline',
+            index=models.Index(fields=['application_end', 'event'], name='upcoming_deadlines_end'),
+        ),
+        migrations.AddIndex(
+            model_name='upcomingdeadline',
+            index=models.Index(fields=['organization', 'application_end'], name='upcoming_deadlines_org_end'),
+        ),
+    ]
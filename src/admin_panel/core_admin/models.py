@@ -52,6 +52,12 @@ class ExamEvent(models.Model):
     class Meta:
         managed = True
         db_table = "exam_events"
+        indexes = [
+            # Search and page build: an exam's events by type and year
+            models.Index(fields=["exam", "event_type", "year"], name="exam_events_exam_type_year"),
+            # Deadline refresh: open application windows
+            models.Index(fields=["application_end"], name="exam_events_application_end"),
+        ]
 
     def __str__(self):
         return f"{self.exam.name} {self.year} {self.event_type}"
@@ -147,6 +153,8 @@ class PageMetadata(models.Model):
     last_crawled = models.DateTimeField(null=True, blank=True)
     
     needs_regeneration = models.BooleanField(default=False)
+    # SHA-256 of the last rendered context + templates (page build skips unchanged pages)
+    content_hash = models.CharField(max_length=64, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -158,6 +166,36 @@ class PageMetadata(models.Model):
         return self.slug
 
 
+class UpcomingDeadline(models.Model):
+    """Open application windows with their exam pre-joined (core_admin/deadlines.py rebuilds it)"""
+    event = models.OneToOneField(ExamEvent, on_delete=models.CASCADE, related_name='deadline')
+    exam = models.ForeignKey(Exam, on_delete=models.CASCADE, related_name='deadlines')
+
+    exam_slug = models.CharField(max_length=500)
+    exam_name = models.CharField(max_length=500)
+    organization = models.CharField(max_length=255, null=True, blank=True)
+
+    event_type = models.CharField(max_length=50)
+    year = models.IntegerField()
+    application_start = models.DateField(null=True, blank=True)
+    application_end = models.DateField()
+    exam_date = models.DateField(null=True, blank=True)
+    official_link = models.TextField(null=True, blank=True)
+
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        managed = True
+        db_table = "upcoming_deadlines"
+        indexes = [
+            models.Index(fields=["application_end", "event"], name="upcoming_deadlines_end"),
+            models.Index(fields=["organization", "application_end"], name="upcoming_deadlines_org_end"),
+        ]
+
+    def __str__(self):
+        return f"{self.exam_name} {self.year} {self.event_type} (closes {self.application_end})"
+
+
 class StatusChangeEvent(models.Model):
     exam = models.ForeignKey(Exam, on_delete=models.CASCADE)
     old_status = models.CharField(max_length=50)
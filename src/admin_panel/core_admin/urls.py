@@ -0,0 +1,10 @@
+"""Public read API routes (mounted at /api/)"""
+from django.urls import path
+
+from core_admin import views
+
+urlpatterns = [
+    path("exams/", views.exam_list, name="api-exam-list"),
+    path("exams/<slug:slug>/", views.exam_detail, name="api-exam-detail"),
+    path("deadlines/", views.upcoming_deadlines, name="api-deadlines"),
+]
@@ -0,0 +1,68 @@
+"""Public read API: exam list, exam detail, upcoming deadlines (JSON).
+
+CONDITIONS:
+- Bodies come pre-encoded from the cache (api.py); a view only parses
+  its parameters and copies bytes
+- If-None-Match matching the entry's ETag → 304 with no body; the
+  comparison is weak (RFC 9110 §13.1.2), so W/"…" validators from
+  GZipMiddleware or a CDN match too
+- Responses are public and cacheable for API_MAX_AGE seconds, so a CDN
+  or browser revalidates with the ETag
+"""
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse
+from django.utils.http import parse_etags
+from django.views.decorators.http import require_GET
+
+from core_admin import api
+
+
+def _opaque_tag(etag):
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _respond(request, entry):
+    etag, body = entry
+    if_none_match = request.headers.get("If-None-Match")
+    validators = {_opaque_tag(tag) for tag in parse_etags(if_none_match)} if if_none_match else set()
+    if "*" in validators or etag in validators:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    response["Cache-Control"] = f"public, max-age={settings.API_MAX_AGE}"
+    return response
+
+
+def _int_param(request, name, default, minimum, maximum):
+    try:
+        value = int(request.GET.get(name, default))
+    except ValueError:
+        return None
+    return value if minimum <= value <= maximum else None
+
+
+@require_GET
+def exam_list(request):
+    page = _int_param(request, "page", 1, 1, 10_000)
+    if page is None:
+        return JsonResponse({"error": "page must be an integer from 1"}, status=400)
+    return _respond(request, api.exam_list(page))
+
+
+@require_GET
+def exam_detail(request, slug):
+    entry = api.exam_detail(slug)
+    if entry is None:
+        return JsonResponse({"error": "exam not found"}, status=404)
+    return _respond(request, entry)
+
+
+@require_GET
+def upcoming_deadlines(request):
+    days = _int_param(request, "days", 30, 1, api.MAX_DEADLINE_DAYS)
+    if days is None:
+        return JsonResponse({"error": f"days must be an integer from 1 to {api.MAX_DEADLINE_DAYS}"}, status=400)
+    organization = request.GET.get("organization") or None
+    return _respond(request, api.deadlines(days, organization=organization))
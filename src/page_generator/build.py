@@ -0,0 +1,465 @@
+"""
+Static page build: PageMetadata rows → PageGenerator contexts → HTML files
+
+The incremental path (build_dirty) only touches rows flagged with
+needs_regeneration (set by propagate_status_change), so a status change
+rebuilds that exam's handful of pages instead of the whole site. The full
+path (build_site) renders every exam x year x page type, with exams
+partitioned across worker processes.
+
+ASSUMPTIONS:
+- Django is set up (management command, Celery task); models are
+  imported lazily so importing this module stays cheap
+- page_type is one of PAGE_TYPES; notification/admit_card/result/
+  answer_key pages read the ExamEvent with the same event_type and year
+- Exam/ExamEvent.updated_at move only on real changes (DatabasePipeline
+  does not re-save an event for an identical re-crawl); they become the
+  pages' last_updated/dateModified, so unchanged pages hash identically
+
+CONDITIONS:
+- Dirty rows are read in pk-ordered chunks (keyset, so rows cleared
+  meanwhile never shift the window); per chunk, pages and exams come from
+  one select_related query and events/results/patterns from one
+  prefetch_related query each
+- Pages are rendered with compiled Jinja2 templates (renderer.py) and
+  streamed atomically (temp file + os.replace) to
+  <output_dir>/<slug>/index.html, so a web server never serves half a page
+- Per chunk, title/meta/canonical/schema/content_hash are saved with one
+  bulk_update and flags cleared with one UPDATE, only for rows not
+  re-flagged since they were read
+- Each context is hashed (with the renderer's template fingerprint); a
+  page whose hash matches PageMetadata.content_hash and whose file exists
+  is not rendered or written, so its mtime/ETag stay put. Pages actually
+  written are collected in `changed` for a CDN purge manifest
+  (write_manifest)
+
+FAILURE MODES:
+- Page without exam, unknown page_type or missing event → skipped, flag
+  kept (stays visible on the dashboard)
+- Render or write error → logged, flag kept, build continues
+- build_site worker crash → that partition's exams are reported as
+  failed, other partitions finish
+"""
+
+import hashlib
+import json
+import logging
+import os
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, see context_hash()
+    orjson = None
+
+from src.page_generator.renderer import JinjaRenderer, write_atomic
+from src.page_generator.template_generator import PageGenerator
+
+logger = logging.getLogger(__name__)
+
+# page_type → (ExamEvent.event_type or None, PageGenerator method)
+PAGE_TYPES = {
+    'notification': ('notification', 'generate_notification_page'),
+    'admit_card': ('admit_card', 'generate_admit_card_page'),
+    'result': ('result', 'generate_result_page'),
+    'answer_key': ('answer_key', 'generate_answer_key_page'),
+    'syllabus': (None, 'generate_syllabus_page'),
+}
+
+EVENT_COLUMNS = ('application_start', 'application_end', 'exam_date', 'official_link',
+                 'pdf_link', 'download_link', 'total_vacancies')
+CUTOFF_FIELDS = ('cutoff_general', 'cutoff_obc', 'cutoff_sc', 'cutoff_st', 'cutoff_ews')
+
+
+# ============================================================================
+# ORM ROWS → GENERATOR INPUT
+# ============================================================================
+
+def _plain(value):
+    """JSON-friendly column value (dates as YYYY-MM-DD, decimals as float)"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return float(value)
+
+
+def _timestamp(value) -> Optional[str]:
+    """updated_at as an ISO string to the second (what pages show as last updated)"""
+    return value.replace(microsecond=0).isoformat() if value is not None else None
+
+
+def exam_data(exam) -> Dict[str, Any]:
+    return {'name': exam.name, 'slug': exam.slug, 'organization': exam.organization,
+            'updated_at': _timestamp(exam.updated_at)}
+
+
+def event_data(event) -> Dict[str, Any]:
+    """
+    Generator input for one ExamEvent: the stored item (details) overlaid
+    with the event's columns, which repairs and admin edits keep current
+    """
+    data = dict(event.details) if isinstance(event.details, dict) else {}
+    data['year'] = event.year
+    data['updated_at'] = _timestamp(event.updated_at)
+    for column in EVENT_COLUMNS:
+        value = getattr(event, column)
+        if value is not None:
+            data[column] = _plain(value)
+    if event.event_date is not None:
+        # event_date is the notification/release/result date depending on event_type
+        date = _plain(event.event_date)
+        data['notification_date'] = date
+        data['release_date'] = date
+        data['result_date'] = date
+    return data
+
+
+def result_data(result) -> Dict[str, Any]:
+    data = {field: _plain(getattr(result, field)) for field in CUTOFF_FIELDS
+            if getattr(result, field) is not None}
+    if result.additional_cutoffs:
+        data['additional'] = result.additional_cutoffs
+    return data
+
+
+def pattern_data(pattern) -> Dict[str, Any]:
+    data = {
+        'year': pattern.year,
+        'total_marks': pattern.total_marks,
+        'duration_minutes': pattern.duration_minutes,
+        'sections': pattern.sections or [],
+        'negative_marking': pattern.negative_marking,
+        'negative_marking_details': pattern.negative_marking_details,
+        'exam_mode': pattern.exam_mode,
+    }
+    if pattern.pattern_details:
+        data['details'] = pattern.pattern_details
+    return data
+
+
+def page_path(output_dir: str, slug: str) -> str:
+    return os.path.join(output_dir, slug, 'index.html')
+
+
+def context_hash(context: Dict[str, Any], fingerprint: str = '') -> str:
+    """SHA-256 of a context (keys sorted) prefixed with the template fingerprint"""
+    if orjson is not None:
+        data = orjson.dumps(context, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(context, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(fingerprint.encode('utf-8') + data).hexdigest()
+
+
+def write_manifest(path: str, changed: List[Tuple[str, str]]) -> None:
+    """JSON list of the pages a build rewrote (slugs and URLs to purge)"""
+    manifest = {
+        'generated_at': datetime.now().isoformat(),
+        'count': len(changed),
+        'slugs': [slug for slug, _ in changed],
+        'urls': [url for _, url in changed],
+    }
+    write_atomic(path, json.dumps(manifest, indent=1))
+
+
+# ============================================================================
+# BUILDER
+# ============================================================================
+
+class PageBuilder:
+    """
+    Builds pages for PageMetadata rows
+
+    `renderer` writes a context to a file (default: a JinjaRenderer); its
+    `fingerprint`, if any, is part of every content hash. `changed` holds
+    (slug, canonical_url) for each page written.
+    """
+
+    def __init__(self, output_dir: str, base_url: str = 'https://examforms.org', chunk_size: int = 500,
+                 renderer: Optional[JinjaRenderer] = None):
+        self.output_dir = output_dir
+        self.chunk_size = chunk_size
+        self.generator = PageGenerator(base_url=base_url)
+        self.renderer = renderer or JinjaRenderer()
+        self.fingerprint = getattr(self.renderer, 'fingerprint', '')
+        self.stats = {'pages_built': 0, 'pages_unchanged': 0, 'pages_skipped': 0, 'pages_failed': 0,
+                      'bytes_written': 0}
+        self.changed: List[Tuple[str, str]] = []
+
+    def context_for(self, page_type: str, exam, year: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        Generator context for one page from a prefetched Exam
+
+        `exam.events` / `exam.patterns` must be prefetched (see
+        _load_exams); filtering happens in Python, so no query is issued.
+        """
+        if page_type not in PAGE_TYPES:
+            return None
+        event_type, method = PAGE_TYPES[page_type]
+        generate = getattr(self.generator, method)
+        exam_dict = exam_data(exam)
+
+        if event_type is None:
+            patterns = sorted(exam.patterns.all(), key=lambda p: p.year or 0, reverse=True)
+            if year is not None:
+                patterns = [p for p in patterns if p.year == year] or patterns
+            return generate(exam_dict, pattern_data(patterns[0]) if patterns else None)
+
+        events = [event for event in exam.events.all()
+                  if event.event_type == event_type and (year is None or event.year == year)]
+        if not events:
+            return None
+        event = max(events, key=lambda ev: ev.year)
+        data = event_data(event)
+        data.setdefault('organization', exam.organization)
+        if page_type == 'result':
+            results = list(event.results.all())
+            return generate(exam_dict, data, result_data(results[0]) if results else None)
+        return generate(exam_dict, data)
+
+    def write_page(self, context: Dict[str, Any], previous_hash: Optional[str] = None) -> str:
+        """Render and write a page unless it is unchanged since `previous_hash`; returns its hash"""
+        digest = context_hash(context, self.fingerprint)
+        path = page_path(self.output_dir, context['slug'])
+        if digest == previous_hash and os.path.exists(path):
+            self.stats['pages_unchanged'] += 1
+            return digest
+        written = self.renderer.render_to_file(context, path)
+        self.stats['pages_built'] += 1
+        self.stats['bytes_written'] += written
+        self.changed.append((context['slug'], context['canonical_url']))
+        return digest
+
+    def pages_for_exam(self, exam) -> Iterator[Dict[str, Any]]:
+        """Every page of a prefetched exam: one per event type and year, plus syllabus"""
+        for page_type, (event_type, _) in PAGE_TYPES.items():
+            if event_type is None:
+                yield self.context_for(page_type, exam, None)
+                continue
+            for year in sorted({event.year for event in exam.events.all() if event.event_type == event_type}):
+                yield self.context_for(page_type, exam, year)
+
+    def build_exams(self, exam_ids: List[int]) -> Dict[str, int]:
+        """
+        Write every page of `exam_ids`, chunk_size exams per query batch
+
+        Pages with a PageMetadata row are compared against (and update)
+        its content_hash; pages without one are written and get a row
+        (with their hash), so the next build can skip them.
+        """
+        from core_admin.models import PageMetadata
+
+        for start in range(0, len(exam_ids), self.chunk_size):
+            chunk = exam_ids[start:start + self.chunk_size]
+            exams = self._load_exams(chunk, None)
+            known = {slug: (pk, content_hash) for pk, slug, content_hash in
+                     PageMetadata.objects.filter(exam_id__in=chunk).values_list('pk', 'slug', 'content_hash')}
+            rehashed = []
+            created = []
+            for exam in exams.values():
+                for context in self.pages_for_exam(exam):
+                    if context is None:
+                        continue
+                    pk, previous_hash = known.get(context['slug'], (None, None))
+                    try:
+                        digest = self.write_page(context, previous_hash)
+                    except Exception as e:
+                        logger.error(f"Failed to build page {context['slug']}: {e}")
+                        self.stats['pages_failed'] += 1
+                        continue
+                    if pk is None:
+                        page = PageMetadata(slug=context['slug'], exam_id=exam.pk, page_type=context['page_type'],
+                                            year=context.get('year'), content_hash=digest)
+                        created.append(self.apply_metadata(page, context))
+                    elif digest != previous_hash:
+                        rehashed.append(PageMetadata(pk=pk, content_hash=digest))
+            if rehashed:
+                PageMetadata.objects.bulk_update(rehashed, ['content_hash'])
+            if created:
+                # A concurrent build may have created the same slug; its row wins
+                PageMetadata.objects.bulk_create(created, ignore_conflicts=True)
+        return self.stats
+
+    @staticmethod
+    def apply_metadata(page, context: Dict[str, Any]):
+        """Copy a built context's title, description, URL and schema onto a PageMetadata"""
+        page.title = context['title'][:255]
+        page.meta_description = context['meta_description']
+        page.canonical_url = context['canonical_url']
+        page.schema_markup = json.loads(context['schema_markup']) if context.get('schema_markup') else None
+        return page
+
+    def build_dirty(self, limit: Optional[int] = None) -> Dict[str, int]:
+        """Build every page flagged needs_regeneration, chunk by chunk"""
+        from django.utils import timezone
+        from core_admin.models import PageMetadata
+
+        last_pk = 0
+        seen = 0
+        while limit is None or seen < limit:
+            size = self.chunk_size if limit is None else min(self.chunk_size, limit - seen)
+            read_at = timezone.now()
+            pages = list(PageMetadata.objects.select_related('exam')
+                         .filter(needs_regeneration=True, pk__gt=last_pk).order_by('pk')[:size])
+            if not pages:
+                break
+            last_pk = pages[-1].pk
+            seen += len(pages)
+
+            built = self.build_pages(pages)
+            if built:
+                PageMetadata.objects.bulk_update(
+                    built, ['title', 'meta_description', 'canonical_url', 'schema_markup', 'content_hash'])
+                # A row re-flagged after read_at keeps its flag for the next build
+                PageMetadata.objects.filter(pk__in=[page.pk for page in built], updated_at__lte=read_at) \
+                    .update(needs_regeneration=False)
+            logger.info(f"Built {len(built)}/{len(pages)} pages (up to pk {last_pk})")
+        return self.stats
+
+    def build_pages(self, pages: List) -> List:
+        """
+        Render and write `pages` (PageMetadata with exam); returns the ones
+        built or found unchanged, with metadata and content_hash updated
+        """
+        years = {page.year for page in pages}
+        exams = self._load_exams({page.exam_id for page in pages if page.exam_id},
+                                 None if None in years else years)
+        built = []
+        for page in pages:
+            exam = exams.get(page.exam_id)
+            context = self.context_for(page.page_type, exam, page.year) if exam else None
+            if context is None:
+                logger.warning(f"No data to build page {page.slug} ({page.page_type})")
+                self.stats['pages_skipped'] += 1
+                continue
+            try:
+                page.content_hash = self.write_page(context, page.content_hash)
+            except Exception as e:
+                logger.error(f"Failed to build page {page.slug}: {e}")
+                self.stats['pages_failed'] += 1
+                continue
+            built.append(self.apply_metadata(page, context))
+        return built
+
+    @staticmethod
+    def _load_exams(exam_ids: Iterable[int], years: Optional[Iterable[int]]) -> Dict[int, Any]:
+        """Exams with their events (for `years`, None = all), results and patterns: 4 queries"""
+        from django.db.models import Prefetch
+        from core_admin.models import Exam, ExamEvent
+
+        exam_ids = list(exam_ids)
+        if not exam_ids:
+            return {}
+        events = ExamEvent.objects.prefetch_related('results')
+        if years is not None:
+            events = events.filter(year__in=list(years))
+        exams = Exam.objects.filter(pk__in=exam_ids).prefetch_related(Prefetch('events', queryset=events), 'patterns')
+        return {exam.pk: exam for exam in exams}
+
+
+# ============================================================================
+# FULL-SITE BUILD (process pool)
+# ============================================================================
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident memory of this process in KiB (None where unsupported)"""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _init_worker():
+    """Each worker sets up Django itself and so opens its own DB connection"""
+    from src.utils.django_setup import setup_django
+
+    setup_django()
+
+
+def build_partition(exam_ids: List[int], output_dir: str, base_url: str, chunk_size: int,
+                    started_at=None) -> Dict[str, Any]:
+    """
+    Build every page of one partition of exams (runs in a worker)
+
+    Flags on these exams' pages are cleared if they were set before
+    `started_at` (the build start), since the pages were just rebuilt.
+    """
+    from core_admin.models import PageMetadata
+
+    builder = PageBuilder(output_dir, base_url=base_url, chunk_size=chunk_size)
+    builder.build_exams(exam_ids)
+    if started_at is not None:
+        PageMetadata.objects.filter(exam_id__in=exam_ids, needs_regeneration=True,
+                                    updated_at__lte=started_at).update(needs_regeneration=False)
+    stats = dict(builder.stats)
+    stats['changed'] = builder.changed
+    stats['exams'] = len(exam_ids)
+    stats['peak_rss_kb'] = peak_rss_kb()
+    return stats
+
+
+def build_site(output_dir: str, base_url: str = 'https://examforms.org', workers: int = 4,
+               partition_size: int = 200, chunk_size: int = 100,
+               progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Build every page of every active exam
+
+    Exams are split into partitions of `partition_size`, handed to
+    `workers` spawned processes as they free up (workers=0 builds
+    in-process). Pages stream to disk as they render; only per-partition
+    counters and the changed (slug, url) pairs come back. `progress` gets
+    the running totals after each partition.
+    """
+    from django.db import connections
+    from django.utils import timezone
+    from core_admin.models import Exam
+
+    started_at = timezone.now()
+    started = time.perf_counter()
+    exam_ids = list(Exam.objects.filter(is_active=True).order_by('pk').values_list('pk', flat=True))
+    partitions = [exam_ids[i:i + partition_size] for i in range(0, len(exam_ids), partition_size)]
+    totals = {'exams': 0, 'exams_failed': 0, 'pages_built': 0, 'pages_unchanged': 0, 'pages_skipped': 0,
+              'pages_failed': 0, 'bytes_written': 0, 'peak_rss_kb': peak_rss_kb(), 'workers': workers,
+              'changed': []}
+
+    def merge(stats):
+        for key in ('exams', 'pages_built', 'pages_unchanged', 'pages_skipped', 'pages_failed', 'bytes_written'):
+            totals[key] += stats[key]
+        totals['changed'].extend(stats['changed'])
+        if stats.get('peak_rss_kb') and (totals['peak_rss_kb'] or 0) < stats['peak_rss_kb']:
+            totals['peak_rss_kb'] = stats['peak_rss_kb']
+        totals['elapsed'] = time.perf_counter() - started
+        done = totals['pages_built'] + totals['pages_unchanged']
+        totals['pages_per_sec'] = done / totals['elapsed'] if totals['elapsed'] else 0.0
+        if progress:
+            progress(dict(totals, exams_total=len(exam_ids), changed=len(totals['changed'])))
+
+    if workers <= 0:
+        for partition in partitions:
+            merge(build_partition(partition, output_dir, base_url, chunk_size, started_at))
+    else:
+        # Children open their own connections; never share the parent's socket
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker) as pool:
+            futures = {pool.submit(build_partition, partition, output_dir, base_url, chunk_size, started_at):
+                       partition for partition in partitions}
+            for future in as_completed(futures):
+                try:
+                    merge(future.result())
+                except Exception as e:
+                    logger.error(f"Partition of {len(futures[future])} exams failed: {e}")
+                    totals['exams_failed'] += len(futures[future])
+
+    totals['elapsed'] = time.perf_counter() - started
+    done = totals['pages_built'] + totals['pages_unchanged']
+    totals['pages_per_sec'] = done / totals['elapsed'] if totals['elapsed'] else 0.0
+    return totals
@@ -0,0 +1,122 @@
+"""
+Compiled Jinja2 rendering for generated pages
+
+Turns PageGenerator contexts into HTML without Django's template engine:
+one Environment per process, the five page templates (templates/, all
+extending base.html) compiled once up front, compiled bytecode shared
+between processes and runs through a FileSystemBytecodeCache, and pages
+rendered as a stream of chunks straight into the output file.
+
+ASSUMPTIONS:
+- context['page_type'] names a template: notification, admit_card,
+  result, answer_key or syllabus (.html)
+- Templates never change while a build runs (auto_reload is off)
+
+CONDITIONS:
+- Autoescaping is on; JSON-LD is emitted |safe with "</" escaped so it
+  cannot close its <script>
+- render_to_file() streams template.generate() into a temp file and
+  renames it into place, so readers never see half a page
+- `fingerprint` hashes every template source, so a template edit changes
+  the content hash of every page the build compares (see build.py)
+
+FAILURE MODES:
+- Unknown page_type → KeyError
+- Bytecode cache dir not writable → Jinja2 silently compiles in memory
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Any, Dict, Iterable, Optional, Union
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+TEMPLATES = {
+    'notification': 'notification.html',
+    'admit_card': 'admit_card.html',
+    'result': 'result.html',
+    'answer_key': 'answer_key.html',
+    'syllabus': 'syllabus.html',
+}
+DEFAULT_BYTECODE_DIR = os.path.join(tempfile.gettempdir(), 'examforms-jinja-cache')
+
+
+def write_atomic(path: str, content: Union[str, Iterable[str]]) -> int:
+    """
+    Write text (or a stream of text chunks) via a temp file in the same
+    directory + os.replace; returns bytes written
+    """
+    chunks = (content,) if isinstance(content, str) else content
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    written = 0
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                data = chunk.encode('utf-8')
+                f.write(data)
+                written += len(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return written
+
+
+def template_fingerprint(template_dir: str = TEMPLATE_DIR) -> str:
+    """SHA-256 over every template's name and source"""
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(template_dir)):
+        if name.endswith('.html'):
+            digest.update(name.encode('utf-8') + b'\0')
+            with open(os.path.join(template_dir, name), 'rb') as f:
+                digest.update(f.read() + b'\0')
+    return digest.hexdigest()
+
+
+class JinjaRenderer:
+    """
+    Renders page contexts with precompiled templates
+
+    `bytecode_cache_dir=None` uses DEFAULT_BYTECODE_DIR; pass False to
+    disable the on-disk cache. Fields a context lacks render empty.
+    """
+
+    def __init__(self, template_dir: str = TEMPLATE_DIR, bytecode_cache_dir=None):
+        bytecode_cache = None
+        if bytecode_cache_dir is not False:
+            cache_dir = bytecode_cache_dir or DEFAULT_BYTECODE_DIR
+            os.makedirs(cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+        self.env = Environment(
+            loader=FileSystemLoader(template_dir),
+            bytecode_cache=bytecode_cache,
+            autoescape=True,
+            auto_reload=False,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        # Compile every page template once; rendering never touches the loader
+        self.templates = {page_type: self.env.get_template(name) for page_type, name in TEMPLATES.items()}
+        self.fingerprint = template_fingerprint(template_dir)
+
+    def render(self, context: Dict[str, Any]) -> str:
+        return self.templates[context['page_type']].render(context)
+
+    def render_to_file(self, context: Dict[str, Any], path: str, buffer_size: Optional[int] = 16) -> int:
+        """
+        Stream one page into `path`; returns bytes written
+
+        Chunks are grouped `buffer_size` at a time (Jinja2 yields one per
+        template fragment), keeping memory flat for large pages.
+        """
+        stream = self.templates[context['page_type']].stream(context)
+        if buffer_size:
+            stream.enable_buffering(buffer_size)
+        return write_atomic(path, stream)
@@ -0,0 +1,173 @@
+"""
+Sharded, gzipped sitemaps for PageMetadata pages, rewritten incrementally
+
+Writes <output_dir>/sitemap.xml (a sitemap index) pointing at
+sitemap-00000.xml.gz, sitemap-00001.xml.gz, ... with one <url> per
+PageMetadata row and <lastmod> from its updated_at.
+
+ASSUMPTIONS:
+- updated_at moves whenever a page changes (auto_now on save;
+  propagate_status_change sets it together with needs_regeneration)
+- Pages are served at canonical_url, or <base_url>/<slug> before their
+  first build
+
+CONDITIONS:
+- A page's shard is fixed by its primary key (pk // shard_size), so new
+  pages only ever land in the last shard and an edit touches one shard;
+  each shard holds at most shard_size (default 50,000) URLs, the
+  sitemap protocol's limit
+- Per-shard signatures (URL count, max updated_at at full precision,
+  sum of pks) come from one GROUP BY query and are kept in sitemap-state.json; only shards whose
+  signature changed (or whose file is missing) are re-queried and
+  rewritten, and shards that became empty are deleted; only <lastmod>
+  is truncated to the second, so an edit within the same second as the
+  previous newest one still changes the signature
+- Shards stream from an iterator() straight into gzip; gzip mtime is 0,
+  so an unchanged shard rewrites byte-identically
+- Every file is written to a temp file and renamed into place
+
+FAILURE MODES:
+- Missing or unreadable state file → every shard is rewritten
+- base_url or shard_size changed → every shard is rewritten
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+from xml.sax.saxutils import escape
+
+SHARD_SIZE = 50_000
+INDEX_FILE = 'sitemap.xml'
+STATE_FILE = 'sitemap-state.json'
+SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+# (slug, canonical_url, updated_at)
+Row = Tuple[str, Optional[str], Any]
+
+
+def shard_name(shard: int) -> str:
+    return f'sitemap-{shard:05d}.xml.gz'
+
+
+def w3c_datetime(value) -> str:
+    """<lastmod> value: ISO 8601 to the second"""
+    return value.replace(microsecond=0).isoformat()
+
+
+def _write_atomic_bytes(path: str, write) -> None:
+    """Call write(fileobj) on a temp file next to `path`, then rename it into place"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_shard(path: str, rows: Iterable[Row], base_url: str) -> int:
+    """Stream `rows` into a gzipped <urlset>; returns the number of URLs"""
+    count = 0
+
+    def write(f):
+        nonlocal count
+        with gzip.GzipFile(fileobj=f, mode='wb', filename='', mtime=0) as gz:
+            gz.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n'.encode('utf-8'))
+            for slug, canonical_url, updated_at in rows:
+                loc = canonical_url or f'{base_url}/{slug}'
+                lastmod = f'<lastmod>{w3c_datetime(updated_at)}</lastmod>' if updated_at else ''
+                gz.write(f'<url><loc>{escape(loc)}</loc>{lastmod}</url>\n'.encode('utf-8'))
+                count += 1
+            gz.write(b'</urlset>\n')
+
+    _write_atomic_bytes(path, write)
+    return count
+
+
+def write_index(path: str, shards: Dict[int, Dict[str, Any]], base_url: str) -> None:
+    lines = [f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{SITEMAP_NS}">\n']
+    for shard in sorted(shards):
+        last_updated = shards[shard]['last_updated']
+        lastmod = w3c_datetime(datetime.fromisoformat(last_updated)) if last_updated else None
+        lines.append(f'<sitemap><loc>{escape(base_url)}/{shard_name(shard)}</loc>'
+                     + (f'<lastmod>{lastmod}</lastmod>' if lastmod else '') + '</sitemap>\n')
+    lines.append('</sitemapindex>\n')
+    _write_atomic_bytes(path, lambda f: f.write(''.join(lines).encode('utf-8')))
+
+
+def _load_state(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def shard_signatures(shard_size: int = SHARD_SIZE) -> Dict[int, Dict[str, Any]]:
+    """{shard: {'count', 'last_updated', 'pk_sum'}} for every non-empty shard, in one query"""
+    from django.db.models import Count, F, Max, Sum
+    from core_admin.models import PageMetadata
+
+    rows = (PageMetadata.objects.annotate(shard=F('pk') / shard_size).values('shard')
+            .annotate(count=Count('pk'), last_updated=Max('updated_at'), pk_sum=Sum('pk')).order_by('shard'))
+    return {
+        row['shard']: {
+            'count': row['count'],
+            'last_updated': row['last_updated'].isoformat() if row['last_updated'] else None,
+            'pk_sum': row['pk_sum'],
+        }
+        for row in rows
+    }
+
+
+def shard_rows(shard: int, shard_size: int = SHARD_SIZE, chunk_size: int = 5000) -> Iterable[Row]:
+    from core_admin.models import PageMetadata
+
+    return (PageMetadata.objects.filter(pk__gte=shard * shard_size, pk__lt=(shard + 1) * shard_size)
+            .order_by('pk').values_list('slug', 'canonical_url', 'updated_at').iterator(chunk_size=chunk_size))
+
+
+def generate_sitemaps(output_dir: str, base_url: str = 'https://examforms.org', shard_size: int = SHARD_SIZE,
+                      force: bool = False) -> Dict[str, int]:
+    """
+    Bring the sitemap shards and index in `output_dir` up to date
+
+    Returns {'shards', 'shards_written', 'shards_removed', 'urls_written'}.
+    """
+    base_url = base_url.rstrip('/')
+    state_path = os.path.join(output_dir, STATE_FILE)
+    state = {} if force else _load_state(state_path)
+    if state.get('base_url') != base_url or state.get('shard_size') != shard_size:
+        state = {}
+    previous = {int(shard): signature for shard, signature in state.get('shards', {}).items()}
+
+    current = shard_signatures(shard_size)
+    stats = {'shards': len(current), 'shards_written': 0, 'shards_removed': 0, 'urls_written': 0}
+
+    for shard, signature in current.items():
+        path = os.path.join(output_dir, shard_name(shard))
+        if previous.get(shard) == signature and os.path.exists(path):
+            continue
+        stats['urls_written'] += write_shard(path, shard_rows(shard, shard_size), base_url)
+        stats['shards_written'] += 1
+
+    for shard in set(previous) - set(current):
+        path = os.path.join(output_dir, shard_name(shard))
+        if os.path.exists(path):
+            os.unlink(path)
+        stats['shards_removed'] += 1
+
+    if stats['shards_written'] or stats['shards_removed'] or not os.path.exists(os.path.join(output_dir, INDEX_FILE)):
+        write_index(os.path.join(output_dir, INDEX_FILE), current, base_url)
+    # State goes last: a crash before this point just rewrites the same shards next run
+    new_state = {'base_url': base_url, 'shard_size': shard_size, 'shards': current}
+    _write_atomic_bytes(state_path, lambda f: f.write(json.dumps(new_state).encode('utf-8')))
+    return stats
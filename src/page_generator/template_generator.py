@@ -1,12 +1,181 @@
 """
 Page Template Generator for ExamForms.org
 Generates SEO-optimized pages from database data
+
+PERFORMANCE:
+- Text that does not depend on the exam (instructions, most steps and
+  FAQs, JSON-LD sub-objects) is built once at import and shared by every
+  context; treat context lists/dicts as read-only
+- Related links depend only on (slug, name, year), so the five pages of
+  an exam share one cached set
+- JSON-LD is encoded with orjson when installed, else with json using the
+  same compact separators, so output is identical either way
+
+DETERMINISM:
+- Contexts depend only on their inputs, never on the clock: last_updated
+  and JSON-LD dateModified come from the source rows' `updated_at`
+  (exam_data / event_data / pattern_data, ISO strings), falling back to
+  the event's own date; with neither they are left out. Rebuilding an
+  unchanged page therefore yields the same bytes (see build.py)
 """
 
-from typing import Dict, Any, List
-from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 import json
 
+try:
+    import orjson
+except ImportError:  # optional speed-up, see dumps_schema()
+    orjson = None
+
+
+# page_type → slug suffix; syllabus pages are per exam, the rest per exam and year
+PAGE_SLUG_SUFFIXES = {
+    'notification': 'notification',
+    'admit_card': 'admit-card',
+    'result': 'result',
+    'answer_key': 'answer-key',
+    'syllabus': 'syllabus',
+}
+
+
+def page_slug(exam_slug: str, page_type: str, year: Optional[int] = None) -> str:
+    """Slug of a generated page, e.g. ssc-cgl-2026-admit-card"""
+    suffix = PAGE_SLUG_SUFFIXES[page_type]
+    if page_type == 'syllabus' or year is None:
+        return f"{exam_slug}-{suffix}"
+    return f"{exam_slug}-{year}-{suffix}"
+
+
+def last_modified(*sources: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Latest `updated_at` among the source dicts (ISO strings), or None"""
+    stamps = [source['updated_at'] for source in sources if source and source.get('updated_at')]
+    return max(stamps) if stamps else None
+
+
+def dumps_schema(schema: Dict[str, Any]) -> str:
+    """Compact JSON for JSON-LD; orjson and json produce the same text"""
+    if orjson is not None:
+        return orjson.dumps(schema).decode('utf-8')
+    return json.dumps(schema, separators=(',', ':'), ensure_ascii=False)
+
+
+# ============================================================================
+# STATIC FRAGMENTS (built once, shared by every page)
+# ============================================================================
+
+SCHEMA_AUTHOR = {"@type": "Organization", "name": "ExamForms.org"}
+SCHEMA_EXAM_CENTERS = {"@type": "Place", "name": "Multiple Exam Centers"}
+
+ADMIT_CARD_INSTRUCTIONS = [
+    "Carry original photo ID proof with admit card",
+    "Reach exam center 30 minutes before reporting time",
+    "No candidate will be allowed without valid admit card",
+    "Verify exam date, time, and center address carefully",
+    "Keep 2 passport size photographs ready",
+    "Electronic devices are not allowed in exam hall",
+    "Read all instructions on admit card carefully"
+]
+
+# Steps after "Visit the official {exam_name} website"
+ADMIT_CARD_STEPS = (
+    "Click on 'Download Admit Card' or similar link",
+    "Enter your Registration Number and Date of Birth",
+    "Submit and download your admit card",
+    "Take printout on A4 size paper",
+    "Verify all details carefully"
+)
+RESULT_CHECK_STEPS = (
+    "Click on 'Result' or 'Check Result' link",
+    "Enter your Roll Number or Registration Number",
+    "Enter Date of Birth if required",
+    "Submit and view your result",
+    "Download score card for future reference"
+)
+
+ADMIT_CARD_DETAILS_ANSWER = ("Admit card contains exam date, time, exam center address, candidate details, "
+                             "instructions, and reporting time.")
+ADMIT_CARD_FAQS = (
+    {
+        'question': "What documents to carry with admit card?",
+        'answer': "Carry original photo ID proof (Aadhaar/PAN/Driving License), admit card printout, and passport size photographs."
+    },
+    {
+        'question': "What if there is an error on admit card?",
+        'answer': "Contact the exam conducting authority immediately if you find any error in name, photograph, or other details."
+    }
+)
+RESULT_CUTOFF_ANSWER = ("Expected cutoff marks vary by category and are based on exam difficulty and number of "
+                        "candidates. Check category-wise cutoffs on this page.")
+RESULT_FAQS = (
+    {
+        'question': "What is the next step after result declaration?",
+        'answer': "Qualified candidates need to appear for the next stage (document verification/interview/skill test) as per exam pattern."
+    },
+)
+ANSWER_KEY_DOWNLOAD_ANSWER = ("Download the official answer key PDF from the link provided on this page or from "
+                              "the official website.")
+ANSWER_KEY_FAQS = (
+    {
+        'question': "Can I raise objections against answer key?",
+        'answer': "Yes, candidates can raise objections during the objection window (usually 3-5 days) by paying a nominal fee."
+    },
+    {
+        'question': "How to calculate score using answer key?",
+        'answer': "Match your responses with the answer key. Add 1 mark for each correct answer and deduct marks for wrong answers as per negative marking scheme."
+    }
+)
+SYLLABUS_DOWNLOAD_ANSWER = ("Download the complete syllabus PDF from the official website or from the link "
+                            "provided on this page.")
+SYLLABUS_FAQS = (
+    {
+        'question': "Is the syllabus same every year?",
+        'answer': "Generally the syllabus remains same, but candidates should check the official notification for any changes."
+    },
+)
+
+
+@lru_cache(maxsize=4096)
+def _related_links(slug: str, exam_name: str, year: int) -> Tuple[Dict[str, str], ...]:
+    """Related links for one exam and year (shared by all of its pages)"""
+    return (
+        {
+            'url': f"/{slug}-{year}-notification",
+            'title': f"{exam_name} {year} Notification",
+            'type': 'notification'
+        },
+        {
+            'url': f"/{slug}-{year}-application-form",
+            'title': f"{exam_name} {year} Application Form",
+            'type': 'application'
+        },
+        {
+            'url': f"/{slug}-{year}-admit-card",
+            'title': f"{exam_name} {year} Admit Card",
+            'type': 'admit_card'
+        },
+        {
+            'url': f"/{slug}-{year}-answer-key",
+            'title': f"{exam_name} {year} Answer Key",
+            'type': 'answer_key'
+        },
+        {
+            'url': f"/{slug}-{year}-result",
+            'title': f"{exam_name} {year} Result",
+            'type': 'result'
+        },
+        {
+            'url': f"/{slug}-syllabus",
+            'title': f"{exam_name} Syllabus",
+            'type': 'syllabus'
+        },
+        {
+            'url': f"/{slug}-exam-pattern",
+            'title': f"{exam_name} Exam Pattern",
+            'type': 'pattern'
+        }
+    )
+
 
 class PageGenerator:
     """
@@ -22,7 +191,8 @@ class PageGenerator:
         """
         exam_name = exam_data['name']
         year = event_data['year']
-        slug = f"{exam_data['slug']}-{year}-notification"
+        slug = page_slug(exam_data['slug'], 'notification', year)
+        modified = last_modified(exam_data, event_data) or event_data.get('notification_date')
         
         context = {
             'page_type': 'notification',
@@ -53,10 +223,10 @@ class PageGenerator:
             'faqs': self._generate_notification_faqs(exam_name, year, event_data),
             
             # Schema markup
-            'schema_markup': self._generate_schema_notification(exam_name, year, event_data),
+            'schema_markup': self._generate_schema_notification(exam_name, year, event_data, modified),
             
             # Last updated
-            'last_updated': datetime.now().isoformat()
+            'last_updated': modified
         }
         
         return context
@@ -67,7 +237,8 @@ class PageGenerator:
         """
         exam_name = exam_data['name']
         year = event_data['year']
-        slug = f"{exam_data['slug']}-{year}-admit-card"
+        slug = page_slug(exam_data['slug'], 'admit_card', year)
+        modified = last_modified(exam_data, event_data) or event_data.get('release_date')
         
         context = {
             'page_type': 'admit_card',
@@ -103,7 +274,7 @@ class PageGenerator:
             # Schema markup
             'schema_markup': self._generate_schema_event(exam_name, year, event_data),
             
-            'last_updated': datetime.now().isoformat()
+            'last_updated': modified
         }
         
         return context
@@ -114,7 +285,8 @@ class PageGenerator:
         """
         exam_name = exam_data['name']
         year = event_data['year']
-        slug = f"{exam_data['slug']}-{year}-result"
+        slug = page_slug(exam_data['slug'], 'result', year)
+        modified = last_modified(exam_data, event_data) or event_data.get('result_date')
         
         context = {
             'page_type': 'result',
@@ -147,9 +319,9 @@ class PageGenerator:
             'faqs': self._generate_result_faqs(exam_name, year),
             
             # Schema markup
-            'schema_markup': self._generate_schema_result(exam_name, year, event_data),
+            'schema_markup': self._generate_schema_result(exam_name, year, event_data, modified),
             
-            'last_updated': datetime.now().isoformat()
+            'last_updated': modified
         }
         
         return context
@@ -160,7 +332,8 @@ class PageGenerator:
         """
         exam_name = exam_data['name']
         year = event_data['year']
-        slug = f"{exam_data['slug']}-{year}-answer-key"
+        slug = page_slug(exam_data['slug'], 'answer_key', year)
+        modified = last_modified(exam_data, event_data) or event_data.get('release_date')
         
         context = {
             'page_type': 'answer_key',
@@ -187,7 +360,7 @@ class PageGenerator:
             # FAQs
             'faqs': self._generate_answer_key_faqs(exam_name, year),
             
-            'last_updated': datetime.now().isoformat()
+            'last_updated': modified
         }
         
         return context
@@ -197,7 +370,7 @@ class PageGenerator:
         Generate syllabus page data
         """
         exam_name = exam_data['name']
-        slug = f"{exam_data['slug']}-syllabus"
+        slug = page_slug(exam_data['slug'], 'syllabus')
         
         context = {
             'page_type': 'syllabus',
@@ -220,55 +393,16 @@ class PageGenerator:
             # FAQs
             'faqs': self._generate_syllabus_faqs(exam_name),
             
-            'last_updated': datetime.now().isoformat()
+            'last_updated': last_modified(exam_data, pattern_data)
         }
         
         return context
     
     def _generate_related_links(self, exam_data: Dict[str, Any], year: int) -> List[Dict[str, str]]:
         """
-        Generate related page links
+        Generate related page links (cached per exam and year)
         """
-        slug = exam_data['slug']
-        exam_name = exam_data['name']
-        
-        return [
-            {
-                'url': f"/{slug}-{year}-notification",
-                'title': f"{exam_name} {year} Notification",
-                'type': 'notification'
-            },
-            {
-                'url': f"/{slug}-{year}-application-form",
-                'title': f"{exam_name} {year} Application Form",
-                'type': 'application'
-            },
-            {
-                'url': f"/{slug}-{year}-admit-card",
-                'title': f"{exam_name} {year} Admit Card",
-                'type': 'admit_card'
-            },
-            {
-                'url': f"/{slug}-{year}-answer-key",
-                'title': f"{exam_name} {year} Answer Key",
-                'type': 'answer_key'
-            },
-            {
-                'url': f"/{slug}-{year}-result",
-                'title': f"{exam_name} {year} Result",
-                'type': 'result'
-            },
-            {
-                'url': f"/{slug}-syllabus",
-                'title': f"{exam_name} Syllabus",
-                'type': 'syllabus'
-            },
-            {
-                'url': f"/{slug}-exam-pattern",
-                'title': f"{exam_name} Exam Pattern",
-                'type': 'pattern'
-            }
-        ]
+        return list(_related_links(exam_data['slug'], exam_data['name'], year))
     
     def _generate_notification_faqs(self, exam_name: str, year: int, event_data: Dict) -> List[Dict[str, str]]:
         """
@@ -304,16 +438,9 @@ class PageGenerator:
             },
             {
                 'question': f"What details are mentioned on {exam_name} admit card?",
-                'answer': "Admit card contains exam date, time, exam center address, candidate details, instructions, and reporting time."
+                'answer': ADMIT_CARD_DETAILS_ANSWER
             },
-            {
-                'question': "What documents to carry with admit card?",
-                'answer': "Carry original photo ID proof (Aadhaar/PAN/Driving License), admit card printout, and passport size photographs."
-            },
-            {
-                'question': "What if there is an error on admit card?",
-                'answer': "Contact the exam conducting authority immediately if you find any error in name, photograph, or other details."
-            }
+            *ADMIT_CARD_FAQS
         ]
     
     def _generate_result_faqs(self, exam_name: str, year: int) -> List[Dict[str, str]]:
@@ -327,12 +454,9 @@ class PageGenerator:
             },
             {
                 'question': f"What is the expected cutoff for {exam_name} {year}?",
-                'answer': "Expected cutoff marks vary by category and are based on exam difficulty and number of candidates. Check category-wise cutoffs on this page."
+                'answer': RESULT_CUTOFF_ANSWER
             },
-            {
-                'question': "What is the next step after result declaration?",
-                'answer': "Qualified candidates need to appear for the next stage (document verification/interview/skill test) as per exam pattern."
-            }
+            *RESULT_FAQS
         ]
     
     def _generate_answer_key_faqs(self, exam_name: str, year: int) -> List[Dict[str, str]]:
@@ -342,16 +466,9 @@ class PageGenerator:
         return [
             {
                 'question': f"How to download {exam_name} {year} answer key?",
-                'answer': "Download the official answer key PDF from the link provided on this page or from the official website."
-            },
-            {
-                'question': "Can I raise objections against answer key?",
-                'answer': "Yes, candidates can raise objections during the objection window (usually 3-5 days) by paying a nominal fee."
+                'answer': ANSWER_KEY_DOWNLOAD_ANSWER
             },
-            {
-                'question': "How to calculate score using answer key?",
-                'answer': "Match your responses with the answer key. Add 1 mark for each correct answer and deduct marks for wrong answers as per negative marking scheme."
-            }
+            *ANSWER_KEY_FAQS
         ]
     
     def _generate_syllabus_faqs(self, exam_name: str) -> List[Dict[str, str]]:
@@ -361,71 +478,44 @@ class PageGenerator:
         return [
             {
                 'question': f"Where can I download {exam_name} syllabus PDF?",
-                'answer': "Download the complete syllabus PDF from the official website or from the link provided on this page."
+                'answer': SYLLABUS_DOWNLOAD_ANSWER
             },
-            {
-                'question': "Is the syllabus same every year?",
-                'answer': "Generally the syllabus remains same, but candidates should check the official notification for any changes."
-            }
+            *SYLLABUS_FAQS
         ]
     
     def _generate_download_steps(self, exam_name: str) -> List[str]:
         """
         Generate step-by-step download instructions
         """
-        return [
-            f"Visit the official {exam_name} website",
-            "Click on 'Download Admit Card' or similar link",
-            "Enter your Registration Number and Date of Birth",
-            "Submit and download your admit card",
-            "Take printout on A4 size paper",
-            "Verify all details carefully"
-        ]
+        return [f"Visit the official {exam_name} website", *ADMIT_CARD_STEPS]
     
     def _generate_result_check_steps(self, exam_name: str) -> List[str]:
         """
         Generate result checking steps
         """
-        return [
-            f"Visit the official {exam_name} website",
-            "Click on 'Result' or 'Check Result' link",
-            "Enter your Roll Number or Registration Number",
-            "Enter Date of Birth if required",
-            "Submit and view your result",
-            "Download score card for future reference"
-        ]
+        return [f"Visit the official {exam_name} website", *RESULT_CHECK_STEPS]
     
     def _generate_admit_card_instructions(self) -> List[str]:
         """
-        Generate important instructions for admit card
+        Generate important instructions for admit card (shared list)
         """
-        return [
-            "Carry original photo ID proof with admit card",
-            "Reach exam center 30 minutes before reporting time",
-            "No candidate will be allowed without valid admit card",
-            "Verify exam date, time, and center address carefully",
-            "Keep 2 passport size photographs ready",
-            "Electronic devices are not allowed in exam hall",
-            "Read all instructions on admit card carefully"
-        ]
+        return ADMIT_CARD_INSTRUCTIONS
     
-    def _generate_schema_notification(self, exam_name: str, year: int, event_data: Dict) -> str:
+    def _generate_schema_notification(self, exam_name: str, year: int, event_data: Dict,
+                                      modified: Optional[str] = None) -> str:
         """
-        Generate JSON-LD schema for notification page
+        Generate JSON-LD schema for notification page (dates omitted when unknown)
         """
         schema = {
             "@context": "https://schema.org",
             "@type": "Article",
             "headline": f"{exam_name} {year} Notification Released",
             "description": f"Download {exam_name} {year} notification PDF and check important dates",
-            "datePublished": event_data.get('notification_date', datetime.now().isoformat()),
-            "dateModified": datetime.now().isoformat(),
-            "author": {
-                "@type": "Organization",
-                "name": "ExamForms.org"
-            }
+            "datePublished": event_data.get('notification_date') or modified,
+            "dateModified": modified,
+            "author": SCHEMA_AUTHOR
         }
-        return json.dumps(schema)
+        return dumps_schema({key: value for key, value in schema.items() if value is not None})
     
     def _generate_schema_event(self, exam_name: str, year: int, event_data: Dict) -> str:
         """
@@ -442,26 +532,22 @@ class PageGenerator:
                 "@type": "Organization",
                 "name": event_data.get('organization', exam_name)
             },
-            "location": {
-                "@type": "Place",
-                "name": "Multiple Exam Centers"
-            }
+            "location": SCHEMA_EXAM_CENTERS
         }
-        return json.dumps(schema)
+        return dumps_schema(schema)
     
-    def _generate_schema_result(self, exam_name: str, year: int, event_data: Dict) -> str:
+    def _generate_schema_result(self, exam_name: str, year: int, event_data: Dict,
+                                modified: Optional[str] = None) -> str:
         """
-        Generate JSON-LD schema for result page
+        Generate JSON-LD schema for result page (dates omitted when unknown)
         """
         schema = {
             "@context": "https://schema.org",
             "@type": "Article",
             "headline": f"{exam_name} {year} Result Declared",
             "description": f"Check {exam_name} {year} result and cutoff marks",
-            "datePublished": event_data.get('result_date', datetime.now().isoformat()),
-            "author": {
-                "@type": "Organization",
-                "name": "ExamForms.org"
-            }
+            "datePublished": event_data.get('result_date') or modified,
+            "dateModified": modified,
+            "author": SCHEMA_AUTHOR
         }
-        return json.dumps(schema)
+        return dumps_schema({key: value for key, value in schema.items() if value is not None})
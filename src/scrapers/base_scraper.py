@@ -36,9 +36,6 @@ import logging
 import re
 from decimal import Decimal
 
-# Date parsing
-from dateutil import parser as date_parser
-
 # Text cleaning
 import html
 import unicodedata
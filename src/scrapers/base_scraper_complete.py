@@ -5,8 +5,10 @@ PRODUCTION-READY with comprehensive error handling.
 """
 
 import scrapy
+import os
 import time
 import hashlib
+import importlib
 import json
 from datetime import datetime, date
 from typing import Dict, Any, Optional, List, Tuple
@@ -14,9 +16,10 @@ from urllib.parse import urljoin, urlparse
 import logging
 import re
 from decimal import Decimal
+from types import SimpleNamespace
 
-# Date parsing
-from dateutil import parser as date_parser
+# Date parsing: dateutil is imported lazily in extract_date() to keep
+# spider import (`scrapy list`, Celery worker boot) cheap
 
 # Text cleaning
 import html as html_lib
@@ -55,6 +58,9 @@ class BaseExamScraper(scrapy.Spider):
     exam_organization = 'Unknown'
     exam_category = 'Unknown'
     
+    # DOWNLOAD_DELAY / CONCURRENT_REQUESTS_PER_DOMAIN are only the fallback
+    # when POLITENESS_ENABLED is off; otherwise each domain's slot is driven
+    # by its profile in politeness_profiles.json
     custom_settings = {
         'DOWNLOAD_DELAY': 5,
         'CONCURRENT_REQUESTS_PER_DOMAIN': 1,
@@ -77,6 +83,15 @@ class BaseExamScraper(scrapy.Spider):
             'errors': [],
             'start_time': datetime.now()
         }
+        # Incremental crawl state, loaded lazily (needs crawler settings)
+        self._incremental = None
+        self._incremental_run_keys = {}
+        # Process pool for offloaded parsing, created on first use
+        self._parse_pool = None
+        # One AIParser (client + response cache) per spider, see get_ai_parser()
+        self._ai_parser = None
+        # Stateless HeuristicParser, built on first use (Strategy 2)
+        self._heuristic_parser = None
     
     # ========================================================================
     # TEXT CLEANING UTILITIES
@@ -180,6 +195,8 @@ class BaseExamScraper(scrapy.Spider):
             return None
         
         try:
+            from dateutil import parser as date_parser
+
             # Clean the string
             date_string = self.clean_text(date_string)
             
@@ -333,7 +350,7 @@ class BaseExamScraper(scrapy.Spider):
         """
         Try to parse data using multiple strategies in order:
         1. Specific Selectors (Child Class implementation)
-        2. Heuristics (Generic patterns)
+        2. Heuristics (Generic patterns, HEURISTIC_MIN_CONFIDENCE)
         3. AI Parsing (LLM Fallback)
         """
         # Strategy 1: Specific Selectors
@@ -355,31 +372,30 @@ class BaseExamScraper(scrapy.Spider):
             self.logger.warning(f"Standard parsing failed: {e}")
 
         # Strategy 2: Heuristics
-        # TODO: Implement generic heuristic parser here
-        # data = self.parse_heuristic(response)
-        # if data: return data
+        try:
+            data = self.parse_heuristic(response, **kwargs)
+            if data:
+                return data
+        except Exception as e:
+            self.logger.warning(f"Heuristic parsing failed: {e}")
 
         # Strategy 3: AI Parsing (Fallback)
         # Only if confidence is critical or specific flag is set
         try:
-            if hasattr(self, 'crawler') and getattr(self, 'crawler', None) and hasattr(self.crawler, 'settings') and self.crawler.settings:
-                enable_ai = self.crawler.settings.getbool('ENABLE_AI_PARSING', False)
-                provider = self.crawler.settings.get('AI_PROVIDER', 'openai')
-            elif getattr(self, 'settings', None):
-                # Fallback implementation if crawler is not set but settings are injected
-                enable_ai = self.settings.getbool('ENABLE_AI_PARSING', False)
-                provider = self.settings.get('AI_PROVIDER', 'openai')
-            else:
-                 self.logger.warning("Could not find settings in BaseExamScraper")
-                 enable_ai = False
-            
-            if enable_ai:
-                self.logger.info("Attempting AI parsing...")
-                from src.utils.ai_parser import AIParser
-                ai_parser = AIParser(provider=provider)
+            ai_parser = self.get_ai_parser()
+            if ai_parser is not None:
+                # One line per block element, scored and windowed by AIParser
+                from src.utils.text_window import html_text_blocks
+                text_content = html_text_blocks(response)
                 
-                # Extract text content (simplified)
-                text_content = " ".join(response.css('body ::text').getall())
+                if self._ai_queue_enabled():
+                    # Answered later by AIParsingPipeline, off the reactor
+                    cached = ai_parser.cached(text_content)
+                    if cached is None:
+                        return {'ai_pending': True, 'ai_text': text_content, 'parsing_method': 'ai_fallback'}
+                    return dict(cached, parsing_method='ai_fallback')
+                
+                self.logger.info("Attempting AI parsing...")
                 data = ai_parser.parse_notification(text_content)
                 
                 if data:
@@ -390,6 +406,92 @@ class BaseExamScraper(scrapy.Spider):
 
         return None
 
+    def parse_heuristic(self, response, **metadata) -> Optional[Dict]:
+        """
+        Generic pattern-based extraction (see src/utils/heuristic_parser.py)
+        
+        Returns None below HEURISTIC_MIN_CONFIDENCE so the AI fallback (or
+        nothing) takes over. Non-empty metadata from the listing row wins
+        over heuristic guesses.
+        """
+        settings = self._setting_source()
+        if settings and not settings.getbool('HEURISTIC_PARSING_ENABLED', True):
+            return None
+        
+        from src.utils.heuristic_parser import HeuristicParser
+        if self._heuristic_parser is None:
+            self._heuristic_parser = HeuristicParser()
+        data = self._heuristic_parser.parse_page(response, pdf_link=metadata.get('pdf_link'))
+        if not data:
+            return None
+        
+        threshold = settings.getint('HEURISTIC_MIN_CONFIDENCE', 50) if settings else 50
+        if data['heuristic_confidence'] < threshold:
+            self.logger.debug(f"Heuristic confidence {data['heuristic_confidence']} < {threshold} for {response.url}")
+            return None
+        
+        data.update({key: value for key, value in metadata.items() if value})
+        data.setdefault('organization', self.exam_organization)
+        data['parsing_method'] = 'heuristic'
+        return data
+    
+    def _setting_source(self):
+        """Crawler settings, or settings injected directly (tests / ad-hoc use)"""
+        crawler = getattr(self, 'crawler', None)
+        if crawler is not None and getattr(crawler, 'settings', None):
+            return crawler.settings
+        return getattr(self, 'settings', None)
+    
+    def _ai_queue_enabled(self) -> bool:
+        """AI fallback goes through AIParsingPipeline instead of running inline"""
+        settings = self._setting_source()
+        return bool(settings) and settings.getbool('AI_QUEUE_ENABLED', False)
+    
+    def get_ai_parser(self):
+        """
+        Long-lived AIParser for this spider, or None if AI parsing is off
+        
+        Built once on first use: one client and one response cache
+        (AI_CACHE_PATH) shared by every page of the crawl.
+        """
+        if self._ai_parser is not None:
+            return self._ai_parser
+        
+        settings = self._setting_source()
+        if not settings:
+            self.logger.warning("Could not find settings in BaseExamScraper")
+            return None
+        if not settings.getbool('ENABLE_AI_PARSING', False):
+            return None
+        
+        from src.utils.ai_parser import AIParser
+        self._ai_parser = AIParser(
+            provider=settings.get('AI_PROVIDER', 'openai'),
+            model=settings.get('AI_MODEL') or None,
+            cache_path=settings.get('AI_CACHE_PATH') or None,
+            provider_options=settings.getdict('AI_PROVIDER_OPTIONS'),
+            max_input_tokens=settings.getint('AI_MAX_INPUT_TOKENS', 1000),
+        )
+        return self._ai_parser
+    
+    def _report_ai_stats(self):
+        """Copy AIParser counters into crawler stats (ai/*) and close it"""
+        ai_parser = getattr(self, '_ai_parser', None)
+        if ai_parser is None:
+            return
+        crawler = getattr(self, 'crawler', None)
+        if crawler is not None and crawler.stats:
+            for key, value in ai_parser.stats.items():
+                crawler.stats.set_value(f"ai/{key}", round(value, 6) if isinstance(value, float) else value)
+        saved = ai_parser.stats['input_tokens_raw'] - ai_parser.stats['input_tokens_sent']
+        self.logger.info(
+            f"AI: {ai_parser.stats['requests']} requests, {ai_parser.stats['cache_hits']} cache hits, "
+            f"${ai_parser.stats['cost_usd']:.4f}, {ai_parser.stats['latency_ms']:.0f} ms, "
+            f"~{saved} input tokens saved by windowing"
+        )
+        ai_parser.close()
+        self._ai_parser = None
+    
     def safe_parse_notification(self, response, **metadata) -> Optional[Dict]:
         """
         Safely parse notification with full error handling and auto-recovery
@@ -406,50 +508,11 @@ class BaseExamScraper(scrapy.Spider):
             data['scraped_at'] = datetime.now().isoformat()
             data['source_url'] = response.url
             
-            # Clean text fields
-            for field in ['exam_name', 'organization', 'description']:
-                if field in data and data[field]:
-                    data[field] = self.clean_text(data[field])
-            
-            # Parse dates
-            date_fields = ['notification_date', 'application_start', 
-                          'application_end', 'exam_date']
-            for field in date_fields:
-                if field in data and data[field]:
-                    data[field] = self.extract_date(data[field])
-            
-            # Make URLs absolute
-            url_fields = ['official_link', 'pdf_link', 'apply_link']
-            for field in url_fields:
-                if field in data and data[field]:
-                    data[field] = self.make_absolute_url(data[field], response)
-            
-            # Extract numbers
-            if data.get('total_vacancies') and isinstance(data['total_vacancies'], str):
-                data['total_vacancies'] = self.extract_number(data['total_vacancies'])
-            
-            # Validate
-            is_valid, missing = self.validate_data(data)
-            if not is_valid:
-                # If AI parsed it, we might be more lenient, or require re-parsing
-                self.logger.warning(f"Validation failed. Missing: {missing}")
-                self.stats['items_invalid'] += 1
-                data['validation_failed'] = True
-                data['missing_fields'] = missing
+            if data.get('ai_pending'):
+                # Finalized by AIParsingPipeline once the AI answer is in
                 return data
             
-            # Calculate confidence
-            confidence = self.calculate_confidence(data)
-            data['confidence_score'] = confidence
-            
-            if confidence < 70:
-                self.logger.warning(f"Low confidence: {confidence}. Flagging for review.")
-                data['requires_manual_review'] = True
-            
-            self.stats['items_extracted'] += 1
-            self.stats['items_valid'] += 1
-            
-            return data
+            return self.finalize_notification(data, response)
             
         except Exception as e:
             self.logger.error(f"Error parsing notification from {response.url}: {e}")
@@ -460,6 +523,283 @@ class BaseExamScraper(scrapy.Spider):
             })
             return None
     
+    def finalize_notification(self, data: Dict[str, Any], response) -> Dict[str, Any]:
+        """
+        Normalize, validate and score parsed notification data
+        
+        `response` only needs .urljoin(); AIParsingPipeline passes a bare
+        Response for the item's source_url.
+        """
+        # Clean text fields
+        for field in ['exam_name', 'organization', 'description']:
+            if field in data and data[field]:
+                data[field] = self.clean_text(data[field])
+        
+        # Parse dates
+        date_fields = ['notification_date', 'application_start', 
+                      'application_end', 'exam_date']
+        for field in date_fields:
+            if field in data and data[field]:
+                data[field] = self.extract_date(data[field])
+        
+        # Make URLs absolute
+        url_fields = ['official_link', 'pdf_link', 'apply_link']
+        for field in url_fields:
+            if field in data and data[field]:
+                data[field] = self.make_absolute_url(data[field], response)
+        
+        # Extract numbers
+        if data.get('total_vacancies') and isinstance(data['total_vacancies'], str):
+            data['total_vacancies'] = self.extract_number(data['total_vacancies'])
+        
+        # Validate
+        is_valid, missing = self.validate_data(data)
+        if not is_valid:
+            # If AI parsed it, we might be more lenient, or require re-parsing
+            self.logger.warning(f"Validation failed. Missing: {missing}")
+            self.stats['items_invalid'] += 1
+            data['validation_failed'] = True
+            data['missing_fields'] = missing
+            return data
+        
+        # Calculate confidence
+        confidence = self.calculate_confidence(data)
+        data['confidence_score'] = confidence
+        
+        if confidence < 70:
+            self.logger.warning(f"Low confidence: {confidence}. Flagging for review.")
+            data['requires_manual_review'] = True
+        
+        self.stats['items_extracted'] += 1
+        self.stats['items_valid'] += 1
+        
+        return data
+        
+    # ========================================================================
+    # INCREMENTAL CRAWL
+    # ========================================================================
+    
+    # Newest row keys remembered per listing URL. Matching any of them (not
+    # just the newest) keeps working when a board deletes its top notice.
+    INCREMENTAL_KEYS_PER_LISTING = 20
+    
+    def listing_row_key(self, title: str, link: Optional[str]) -> str:
+        """Stable key for a listing row: hash of normalized title + link"""
+        raw = f"{self.clean_text(title).lower()}|{(link or '').strip()}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+    
+    def _incremental_state(self) -> Dict[str, Any]:
+        """
+        Load incremental state for this spider (once)
+        
+        Disabled (never stops early) when:
+        - Spider runs without a crawler (unit tests, ad-hoc use)
+        - INCREMENTAL_CRAWL_ENABLED is off
+        - State file is missing or unreadable (first run = full sweep)
+        """
+        if self._incremental is not None:
+            return self._incremental
+        
+        crawler = getattr(self, 'crawler', None)
+        settings = getattr(crawler, 'settings', None) if crawler else None
+        if not settings or not settings.getbool('INCREMENTAL_CRAWL_ENABLED', False):
+            self._incremental = {'enabled': False, 'listings': {}}
+            return self._incremental
+        
+        state_dir = settings.get('INCREMENTAL_STATE_DIR', '.scrapy/incremental')
+        path = os.path.join(state_dir, f"{self.name}.json")
+        listings = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                listings = json.load(f).get('listings', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read incremental state {path}: {e}")
+        
+        self._incremental = {
+            'enabled': True,
+            'path': path,
+            'listings': listings,
+            # `scrapy crawl upsc -a mode=full` forces a full sweep
+            'force_full': getattr(self, 'mode', 'incremental') == 'full',
+            'full_sweep_seconds': settings.getfloat('INCREMENTAL_FULL_SWEEP_HOURS', 168) * 3600,
+        }
+        return self._incremental
+    
+    def _is_full_sweep(self, listing_url: str) -> bool:
+        """Full sweep if forced, first time seen, or last full sweep is too old"""
+        state = self._incremental_state()
+        listing = state['listings'].get(listing_url)
+        if state['force_full'] or not listing:
+            return True
+        return time.time() - listing.get('last_full_sweep', 0) >= state['full_sweep_seconds']
+    
+    def listing_row_seen(self, listing_url: str, title: str, link: Optional[str]) -> bool:
+        """
+        Record a listing row; True if it was already seen in a previous run
+        
+        Listing pages are reverse-chronological, so the caller should stop
+        processing the page at the first row for which this returns True.
+        
+        ALWAYS False during a full sweep (catches edits to older rows).
+        """
+        state = self._incremental_state()
+        if not state['enabled']:
+            return False
+        
+        key = self.listing_row_key(title, link)
+        run_keys = self._incremental_run_keys.setdefault(listing_url, [])
+        if len(run_keys) < self.INCREMENTAL_KEYS_PER_LISTING:
+            run_keys.append(key)
+        
+        if self._is_full_sweep(listing_url):
+            return False
+        
+        if key in state['listings'][listing_url].get('keys', []):
+            self.logger.info(f"Incremental: reached already-seen row on {listing_url}, stopping")
+            crawler = getattr(self, 'crawler', None)
+            if crawler is not None and crawler.stats:
+                crawler.stats.inc_value('incremental/stopped_early')
+            return True
+        return False
+    
+    def _save_incremental_state(self):
+        """Persist newest row keys per listing (only after a finished crawl)"""
+        state = self._incremental
+        if not state or not state['enabled'] or not self._incremental_run_keys:
+            return
+        
+        now = time.time()
+        for url, run_keys in self._incremental_run_keys.items():
+            previous = state['listings'].get(url, {})
+            merged = list(dict.fromkeys(run_keys + previous.get('keys', [])))
+            state['listings'][url] = {
+                'keys': merged[:self.INCREMENTAL_KEYS_PER_LISTING],
+                'last_full_sweep': now if self._is_full_sweep(url) else previous.get('last_full_sweep', 0),
+            }
+        
+        try:
+            os.makedirs(os.path.dirname(state['path']) or '.', exist_ok=True)
+            tmp_path = state['path'] + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'listings': state['listings']}, f)
+            os.replace(tmp_path, state['path'])
+        except OSError as e:
+            self.logger.error(f"Could not save incremental state: {e}")
+    
+    # ========================================================================
+    # PROCESS-POOL OFFLOAD
+    # ========================================================================
+    
+    # Crawler settings a worker's parse reads; other settings (AI parsing
+    # included) keep their defaults in workers
+    OFFLOAD_SETTINGS = ('HEURISTIC_PARSING_ENABLED', 'HEURISTIC_MIN_CONFIDENCE')
+    
+    def _offload_enabled(self) -> bool:
+        """
+        Opt-in: PARSE_OFFLOAD_ENABLED setting or `scrapy crawl ssc -a offload=1`
+        """
+        if str(getattr(self, 'offload', '')).lower() in ('1', 'true', 'yes'):
+            return True
+        crawler = getattr(self, 'crawler', None)
+        return bool(crawler and crawler.settings.getbool('PARSE_OFFLOAD_ENABLED', False))
+    
+    def start_requests(self):
+        callback = self.parse_offloaded if self._offload_enabled() else None
+        for url in self.start_urls:
+            yield scrapy.Request(url, callback=callback, dont_filter=True)
+
+    async def start(self):
+        # Scrapy >= 2.13 entry point; older versions call start_requests()
+        for request in self.start_requests():
+            yield request
+
+    async def parse_offloaded(self, response, method: str = 'parse'):
+        """
+        Run `self.<method>(response)` in a worker process and yield its items
+        
+        The reactor thread only ships the raw body over and merges results,
+        so a 5,000-row listing no longer stalls downloads in flight.
+        
+        DOES NOT support callbacks that yield Requests (not picklable);
+        those must stay on the reactor. The worker sees OFFLOAD_SETTINGS
+        from the crawler; every other setting has its default there.
+        """
+        from scrapy.utils.defer import maybe_deferred_to_future
+        
+        result = await maybe_deferred_to_future(self.offload_parse(response, method))
+        self._merge_offload_result(result)
+        for item in result['items']:
+            yield item
+    
+    def offload_parse(self, response, method: str = 'parse'):
+        """Submit a parse to the process pool; returns a Deferred of the worker result"""
+        from twisted.internet import defer, reactor
+        
+        if self._parse_pool is None:
+            crawler = getattr(self, 'crawler', None)
+            workers = crawler.settings.getint('PARSE_OFFLOAD_WORKERS', 2) if crawler else 2
+            self._parse_pool = _make_parse_pool(workers)
+        
+        future = self._parse_pool.submit(
+            _parse_in_worker,
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            method,
+            response.url,
+            response.body,
+            response.encoding,
+            self._incremental_snapshot(response.url),
+            self._offload_settings(),
+        )
+        
+        dfd = defer.Deferred()
+        
+        def _done(fut):
+            if fut.exception() is not None:
+                reactor.callFromThread(dfd.errback, fut.exception())
+            else:
+                reactor.callFromThread(dfd.callback, fut.result())
+        
+        future.add_done_callback(_done)
+        return dfd
+    
+    def _offload_settings(self) -> Dict[str, Any]:
+        """OFFLOAD_SETTINGS as a plain (picklable) dict"""
+        settings = self._setting_source()
+        if not settings:
+            return {}
+        return {key: settings.get(key) for key in self.OFFLOAD_SETTINGS if settings.get(key) is not None}
+    
+    def _incremental_snapshot(self, listing_url: str) -> Dict[str, Any]:
+        """The slice of incremental state a worker needs for one listing"""
+        state = self._incremental_state()
+        if not state['enabled']:
+            return state
+        listing = state['listings'].get(listing_url)
+        return {
+            'enabled': True,
+            'listings': {listing_url: listing} if listing else {},
+            'force_full': state['force_full'],
+            'full_sweep_seconds': state['full_sweep_seconds'],
+        }
+    
+    def _merge_offload_result(self, result: Dict[str, Any]):
+        """Fold worker-side counters and incremental keys back into this spider"""
+        for key in ('pages_scraped', 'items_extracted', 'items_valid', 'items_invalid'):
+            self.stats[key] += result['stats'].get(key, 0)
+        self.stats['errors'].extend(result['stats'].get('errors', []))
+        
+        for url, keys in result['run_keys'].items():
+            run_keys = self._incremental_run_keys.setdefault(url, [])
+            run_keys.extend(keys[:self.INCREMENTAL_KEYS_PER_LISTING - len(run_keys)])
+        
+        crawler = getattr(self, 'crawler', None)
+        if crawler is not None and crawler.stats:
+            for key, value in result['crawler_stats'].items():
+                crawler.stats.inc_value(key, value)
+            crawler.stats.inc_value('offload/parses')
+    
     # ========================================================================
     # METHODS TO OVERRIDE IN CHILD CLASSES
     # ========================================================================
@@ -531,6 +871,81 @@ class BaseExamScraper(scrapy.Spider):
         self.logger.info(f"Valid items: {self.stats['items_valid']}")
         self.logger.info(f"Invalid items: {self.stats['items_invalid']}")
         self.logger.info(f"Errors: {len(self.stats['errors'])}")
+        
+        if reason == 'finished':
+            self._save_incremental_state()
+        
+        self._report_ai_stats()
+        
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False)
+            self._parse_pool = None
+
+
+# ============================================================================
+# OFFLOAD WORKER (runs in child processes)
+# ============================================================================
+
+def _make_parse_pool(workers: int):
+    """'spawn' context: forking a process that runs reactor threads is unsafe"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+class _WorkerStats:
+    """Stand-in for the crawler stats collector inside a worker"""
+    
+    def __init__(self):
+        self.values = {}
+    
+    def inc_value(self, key, count=1, start=0):
+        self.values[key] = self.values.get(key, start) + count
+
+
+# One spider instance per worker process and spider class
+_WORKER_SPIDERS = {}
+
+
+def _parse_in_worker(spider_path: str, method: str, url: str, body: bytes, encoding: str,
+                     incremental: Dict[str, Any], settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Rebuild the response, run the spider callback, return picklable results
+    
+    `settings` (BaseExamScraper.OFFLOAD_SETTINGS values) overrides Scrapy's
+    defaults for the worker spider's crawler settings.
+    
+    Returns: {'items', 'stats' (spider counters), 'crawler_stats', 'run_keys'}
+    """
+    from scrapy.http import HtmlResponse
+    from scrapy.settings import Settings
+    
+    spider = _WORKER_SPIDERS.get(spider_path)
+    if spider is None:
+        module_name, _, class_name = spider_path.rpartition('.')
+        spider = getattr(importlib.import_module(module_name), class_name)()
+        _WORKER_SPIDERS[spider_path] = spider
+    
+    spider.stats = {'pages_scraped': 0, 'items_extracted': 0, 'items_valid': 0,
+                    'items_invalid': 0, 'errors': []}
+    spider.crawler = SimpleNamespace(stats=_WorkerStats(), settings=Settings(settings or {}))
+    spider._incremental = incremental
+    spider._incremental_run_keys = {}
+    
+    response = HtmlResponse(url=url, body=body, encoding=encoding)
+    items = []
+    for result in getattr(spider, method)(response) or []:
+        if not isinstance(result, dict):
+            raise TypeError(f"Offloaded callback {method} yielded {type(result).__name__}; only items are supported")
+        items.append(result)
+    
+    return {
+        'items': items,
+        'stats': spider.stats,
+        'crawler_stats': spider.crawler.stats.values,
+        'run_keys': spider._incremental_run_keys,
+    }
 
 
 # Example usage in child class:
@@ -0,0 +1,222 @@
+"""
+Persistent crawl frontier: request fingerprints remembered across runs
+
+Each scheduled crawl used to start with an empty dupe filter, so detail
+pages already processed last run were requested again. PersistentDupeFilter
+keeps Scrapy 2.7 request fingerprints (20-byte SHA1 digests) in a small
+SQLite file per spider and skips requests fetched within their URL class's
+recrawl interval.
+
+ASSUMPTIONS:
+- REQUEST_FINGERPRINTER_IMPLEMENTATION = '2.7' (fingerprints are bytes)
+- Listing pages change every run and must always be refreshed (interval 0)
+- Detail pages / PDFs rarely change once published
+- Only successful (200) responses are remembered: a failed fetch is retried
+  next run instead of being skipped for a whole interval
+
+URL CLASSES (FRONTIER_RECRAWL_INTERVALS, first match wins):
+- request.meta['url_class'] overrides pattern matching
+- interval 0 → never skipped across runs (still deduplicated within a run)
+
+COMPACTION:
+- On open, fingerprints older than the largest recrawl interval are
+  deleted: no class would skip them any more, so the store only holds
+  URLs that can still be skipped
+
+STATS:
+- frontier/pruned          (expired fingerprints deleted on open)
+- frontier/skipped_recent  (seen in a previous run, within interval)
+- frontier/recorded        (fingerprints written this run)
+- frontier/store_size      (fingerprints in store at close)
+
+FAILURE MODES:
+- Store cannot be opened → logged, behaves like a plain in-memory dupe filter
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import time
+from typing import List, Optional, Tuple
+
+from scrapy import signals
+from scrapy.dupefilters import BaseDupeFilter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECRAWL_INTERVALS = [
+    # (url_class, regex, interval_seconds)
+    ('listing', r'(LatestNotification|AdmitCard|Results|current-examinations|admit-cards|/results)', 0),
+    ('pdf', r'\.pdf($|\?)', 30 * 24 * 3600),
+    ('detail', r'.*', 7 * 24 * 3600),
+]
+
+
+class FingerprintStore:
+    """
+    Disk-backed set of request fingerprints with last-fetched timestamps
+
+    One row per fingerprint (BLOB primary key, WITHOUT ROWID) keeps the
+    file close to 20 bytes + timestamp per URL.
+    """
+
+    # Commit every N marks so a crashed crawl keeps most of its progress
+    COMMIT_EVERY = 100
+
+    def __init__(self, path: str):
+        self.path = path
+        self._pending = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            " fp BLOB PRIMARY KEY,"
+            " fetched_at INTEGER NOT NULL,"
+            " url_class TEXT"
+            ") WITHOUT ROWID"
+        )
+        self.conn.commit()
+
+    def last_fetched(self, fp: bytes) -> Optional[int]:
+        row = self.conn.execute("SELECT fetched_at FROM fingerprints WHERE fp = ?", (fp,)).fetchone()
+        return row[0] if row else None
+
+    def mark(self, fp: bytes, url_class: str, fetched_at: Optional[int] = None):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO fingerprints (fp, fetched_at, url_class) VALUES (?, ?, ?)",
+            (fp, int(fetched_at if fetched_at is not None else time.time()), url_class),
+        )
+        self._pending += 1
+        if self._pending >= self.COMMIT_EVERY:
+            self.conn.commit()
+            self._pending = 0
+
+    def prune(self, older_than: int) -> int:
+        """Delete fingerprints fetched before `older_than` (unix time)"""
+        cursor = self.conn.execute("DELETE FROM fingerprints WHERE fetched_at < ?", (older_than,))
+        self.conn.commit()
+        return cursor.rowcount
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+class RecrawlPolicy:
+    """Map a request to (url_class, recrawl interval in seconds)"""
+
+    def __init__(self, intervals: List[Tuple[str, str, int]]):
+        self.rules = [(name, re.compile(pattern), int(seconds)) for name, pattern, seconds in intervals]
+        self.by_name = {name: seconds for name, _, seconds in self.rules}
+        self.max_interval = max(self.by_name.values(), default=0)
+
+    def classify(self, request) -> Tuple[str, int]:
+        url_class = request.meta.get('url_class')
+        if url_class in self.by_name:
+            return url_class, self.by_name[url_class]
+
+        for name, pattern, seconds in self.rules:
+            if pattern.search(request.url):
+                return name, seconds
+        return 'default', 0
+
+
+class PersistentDupeFilter(BaseDupeFilter):
+    """
+    Dupe filter backed by FingerprintStore
+
+    Enable with:
+        DUPEFILTER_CLASS = 'src.scrapers.extensions.frontier.PersistentDupeFilter'
+        FRONTIER_STORE_DIR = '.scrapy/frontier'   # one <spider>.sqlite3 per spider
+        FRONTIER_RECRAWL_INTERVALS = [('pdf', r'\\.pdf$', 2592000), ...]
+    """
+
+    def __init__(self, crawler, store_dir: str, policy: RecrawlPolicy, debug: bool = False):
+        self.crawler = crawler
+        self.store_dir = store_dir
+        self.policy = policy
+        self.debug = debug
+        self.fingerprinter = crawler.request_fingerprinter
+        self.store = None
+        self.fingerprints = set()
+        self.logdupes = True
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        intervals = settings.getlist('FRONTIER_RECRAWL_INTERVALS') or DEFAULT_RECRAWL_INTERVALS
+        df = cls(
+            crawler,
+            store_dir=settings.get('FRONTIER_STORE_DIR', '.scrapy/frontier'),
+            policy=RecrawlPolicy(intervals),
+            debug=settings.getbool('DUPEFILTER_DEBUG'),
+        )
+        crawler.signals.connect(df.response_received, signal=signals.response_received)
+        return df
+
+    def open(self):
+        spider = getattr(self.crawler, 'spider', None)
+        name = spider.name if spider else 'default'
+        path = os.path.join(self.store_dir, f"{name}.sqlite3")
+        try:
+            self.store = FingerprintStore(path)
+            pruned = self.store.prune(older_than=int(time.time()) - self.policy.max_interval)
+        except sqlite3.Error as e:
+            logger.error(f"Could not open frontier store {path}: {e}. Falling back to in-memory dedup.")
+            self.store = None
+            return
+        self.crawler.stats.set_value('frontier/pruned', pruned)
+
+    def close(self, reason):
+        if self.store is None:
+            return
+        self.crawler.stats.set_value('frontier/store_size', len(self.store))
+        self.store.close()
+        self.store = None
+
+    def request_seen(self, request) -> bool:
+        fp = self.fingerprinter.fingerprint(request)
+        if fp in self.fingerprints:
+            return True
+        self.fingerprints.add(fp)
+
+        if self.store is None:
+            return False
+
+        _, interval = self.policy.classify(request)
+        if interval <= 0:
+            return False
+
+        fetched_at = self.store.last_fetched(fp)
+        if fetched_at is not None and time.time() - fetched_at < interval:
+            self.crawler.stats.inc_value('frontier/skipped_recent')
+            return True
+        return False
+
+    def response_received(self, response, request, spider):
+        """Remember successfully fetched requests for the next run"""
+        if self.store is None or response.status != 200:
+            return
+        url_class, interval = self.policy.classify(request)
+        if interval <= 0:
+            return
+        self.store.mark(self.fingerprinter.fingerprint(request), url_class)
+        self.crawler.stats.inc_value('frontier/recorded')
+
+    def log(self, request, spider):
+        if self.debug:
+            logger.debug(f"Filtered duplicate/recent request: {request}", extra={'spider': spider})
+        elif self.logdupes:
+            logger.debug(
+                f"Filtered duplicate/recent request: {request} - no more duplicates will be shown "
+                f"(see DUPEFILTER_DEBUG to show all duplicates)",
+                extra={'spider': spider},
+            )
+            self.logdupes = False
+        self.crawler.stats.inc_value('dupefilter/filtered')
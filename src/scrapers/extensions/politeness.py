@@ -0,0 +1,274 @@
+"""
+Per-domain politeness profiles (latency-driven throttle + back-off)
+
+Replaces the single DOWNLOAD_DELAY / CONCURRENT_REQUESTS_PER_DOMAIN pair
+with a profile per domain, loaded from POLITENESS_PROFILES_FILE.
+
+ASSUMPTIONS:
+- Downloader slots are keyed by hostname (Scrapy default)
+- A profile for "nic.in" also applies to "ssc.nic.in" (longest suffix wins)
+- Government sites signal overload with 429/503, sometimes with Retry-After
+- Scrapy's own AutoThrottle is disabled (both would fight over slot.delay)
+
+POLICY (per slot):
+- First request: concurrency and delay set from the domain profile
+- 2xx/3xx response: delay moves towards latency / target_concurrency,
+  clamped to [min_delay, max_delay] (same rule as Scrapy AutoThrottle)
+- 429/503 response: delay = max(delay * backoff_factor, Retry-After),
+  capped at max_backoff; never decreased by that response
+
+STATS (per domain):
+- politeness/<domain>/responses
+- politeness/<domain>/backoffs
+- politeness/<domain>/delay               (final slot delay, seconds)
+- politeness/<domain>/requests_per_minute (achieved rate)
+
+FAILURE MODES:
+- Profile file missing/invalid → logged, built-in default profile used
+- Malformed Retry-After → ignored, plain exponential back-off
+"""
+
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILES_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'politeness_profiles.json',
+)
+
+DEFAULT_PROFILE = {
+    'start_delay': 5.0,
+    'min_delay': 2.0,
+    'max_delay': 60.0,
+    'target_concurrency': 1.0,
+    'concurrency': 1,
+    'backoff_factor': 2.0,
+    'max_backoff': 300.0,
+}
+
+BACKOFF_HTTP_CODES = (429, 503)
+
+
+def load_profiles(path: str) -> Dict[str, Any]:
+    """
+    Load profile config: {"default": {...}, "domains": {"host": {...}}}
+
+    Domain profiles are merged over the default profile, which is merged
+    over DEFAULT_PROFILE, so every resolved profile has every key.
+    """
+    config = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        logger.warning(f"Politeness profiles file not found: {path}, using defaults")
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not load politeness profiles from {path}: {e}")
+
+    default = {**DEFAULT_PROFILE, **config.get('default', {})}
+    domains = {
+        domain.lower().lstrip('.'): {**default, **profile}
+        for domain, profile in config.get('domains', {}).items()
+    }
+    return {'default': default, 'domains': domains}
+
+
+def resolve_profile(profiles: Dict[str, Any], host: Optional[str]) -> Dict[str, Any]:
+    """
+    Return the profile for host, matching the longest configured domain suffix.
+
+    EXAMPLES:
+    "www.upsc.gov.in" → profile for "upsc.gov.in"
+    "sscner.nic.in"   → profile for "nic.in" (if configured)
+    "example.com"     → default profile
+    """
+    if not host:
+        return profiles['default']
+
+    labels = host.lower().split('.')
+    for i in range(len(labels) - 1):
+        profile = profiles['domains'].get('.'.join(labels[i:]))
+        if profile:
+            return profile
+    return profiles['default']
+
+
+def parse_retry_after(value, now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds
+
+    HANDLES:
+    - Delay-seconds: "120" → 120.0
+    - HTTP-date: "Wed, 21 Oct 2026 07:28:00 GMT" → seconds until then
+    - Dates in the past → 0.0
+    - Bytes (raw Scrapy header values)
+    - Garbage / None → None
+    """
+    if not value:
+        return None
+    if isinstance(value, bytes):
+        value = value.decode('latin-1')
+    value = value.strip()
+
+    if value.isdigit():
+        return float(value)
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class DomainPolitenessThrottle:
+    """
+    Scrapy extension applying per-domain politeness profiles to downloader slots
+
+    Enable with:
+        EXTENSIONS = {'src.scrapers.extensions.politeness.DomainPolitenessThrottle': 0}
+        POLITENESS_ENABLED = True
+        POLITENESS_PROFILES_FILE = '/path/to/politeness_profiles.json'  # optional
+    """
+
+    def __init__(self, crawler, profiles: Dict[str, Any]):
+        self.crawler = crawler
+        self.profiles = profiles
+        self.debug = crawler.settings.getbool('POLITENESS_DEBUG')
+        # slot key → {'profile', 'responses', 'backoffs', 'first_seen', 'last_seen'}
+        self.domains: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool('POLITENESS_ENABLED'):
+            raise NotConfigured
+        if settings.getbool('AUTOTHROTTLE_ENABLED'):
+            logger.warning("AUTOTHROTTLE_ENABLED and POLITENESS_ENABLED are both set; "
+                           "disabling politeness profiles")
+            raise NotConfigured
+
+        path = settings.get('POLITENESS_PROFILES_FILE') or DEFAULT_PROFILES_FILE
+        ext = cls(crawler, load_profiles(path))
+
+        crawler.signals.connect(ext.request_reached_downloader, signal=signals.request_reached_downloader)
+        crawler.signals.connect(ext.response_downloaded, signal=signals.response_downloaded)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def _get_slot(self, request):
+        key = request.meta.get('download_slot')
+        if key is None:
+            return None, None
+        return key, self.crawler.engine.downloader.slots.get(key)
+
+    # ========================================================================
+    # SIGNAL HANDLERS
+    # ========================================================================
+
+    def request_reached_downloader(self, request, spider):
+        """Apply the domain profile the first time a slot is seen"""
+        key, slot = self._get_slot(request)
+        if slot is None or key in self.domains:
+            return
+
+        profile = resolve_profile(self.profiles, key)
+        slot.concurrency = int(profile['concurrency'])
+        slot.delay = max(float(profile['start_delay']), float(profile['min_delay']))
+        self.domains[key] = {
+            'profile': profile,
+            'responses': 0,
+            'backoffs': 0,
+            'first_seen': time.monotonic(),
+            'last_seen': time.monotonic(),
+        }
+
+    def response_downloaded(self, response, request, spider):
+        key, slot = self._get_slot(request)
+        state = self.domains.get(key)
+        if slot is None or state is None:
+            return
+
+        state['responses'] += 1
+        state['last_seen'] = time.monotonic()
+        old_delay = slot.delay
+
+        if response.status in BACKOFF_HTTP_CODES:
+            state['backoffs'] += 1
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            slot.delay = self.backoff_delay(slot.delay, state['profile'], retry_after)
+        else:
+            latency = request.meta.get('download_latency')
+            if latency is not None:
+                slot.delay = self.adjust_delay(slot.delay, latency, response.status, state['profile'])
+
+        if self.debug:
+            logger.info(
+                f"slot: {key} | status: {response.status} | "
+                f"delay: {slot.delay * 1000:.0f} ms ({(slot.delay - old_delay) * 1000:+.0f})",
+                extra={'spider': spider},
+            )
+
+    def spider_closed(self, spider):
+        """Publish achieved per-domain request rate to crawler stats"""
+        stats = self.crawler.stats
+        for key, state in self.domains.items():
+            prefix = f"politeness/{key}"
+            elapsed = max(state['last_seen'] - state['first_seen'], 1e-6)
+            stats.set_value(f"{prefix}/responses", state['responses'], spider=spider)
+            stats.set_value(f"{prefix}/backoffs", state['backoffs'], spider=spider)
+            slot = self.crawler.engine.downloader.slots.get(key)
+            if slot is not None:
+                stats.set_value(f"{prefix}/delay", round(slot.delay, 3), spider=spider)
+            if state['responses']:
+                rate = state['responses'] / elapsed * 60.0
+                stats.set_value(f"{prefix}/requests_per_minute", round(rate, 2), spider=spider)
+
+    # ========================================================================
+    # DELAY POLICY
+    # ========================================================================
+
+    @staticmethod
+    def adjust_delay(delay: float, latency: float, status: int, profile: Dict[str, Any]) -> float:
+        """
+        Move delay towards latency / target_concurrency (Scrapy AutoThrottle rule)
+
+        Non-200 responses never decrease the delay: error pages are small and
+        fast, and would otherwise speed up a crawl against a struggling site.
+        """
+        target_delay = latency / float(profile['target_concurrency'])
+        new_delay = max(target_delay, (delay + target_delay) / 2.0)
+        new_delay = min(max(float(profile['min_delay']), new_delay), float(profile['max_delay']))
+
+        if status != 200 and new_delay <= delay:
+            return delay
+        return new_delay
+
+    @staticmethod
+    def backoff_delay(delay: float, profile: Dict[str, Any], retry_after: Optional[float] = None) -> float:
+        """
+        Back off after 429/503: exponential, but never shorter than Retry-After
+
+        Capped at max_backoff (not max_delay): a server that explicitly asks
+        for a long pause gets it.
+        """
+        # Floor at 1s so a zero-delay CDN profile still backs off
+        new_delay = max(delay, float(profile['min_delay']), 1.0) * float(profile['backoff_factor'])
+        if retry_after is not None:
+            new_delay = max(new_delay, retry_after)
+        return min(new_delay, float(profile['max_backoff']))
@@ -0,0 +1,153 @@
+import logging
+from typing import Any, Dict
+
+from scrapy.exceptions import DropItem, NotConfigured
+from scrapy.http import Response
+from twisted.internet import reactor
+from twisted.internet.threads import deferToThread, deferToThreadPool
+from twisted.python.threadpool import ThreadPool
+
+from .ai_queue import AIWorkQueue, JobTimeout, QueueFull
+
+logger = logging.getLogger(__name__)
+
+
+class AIParsingPipeline:
+    """
+    Pipeline that answers AI fallback requests off the crawl path.
+
+    With AI_QUEUE_ENABLED, parse_with_strategies() no longer calls the LLM
+    inside the spider callback: it yields a stub item (ai_pending=True,
+    ai_text=page text). This pipeline queues the stub on an AIWorkQueue,
+    runs the provider call in a dedicated thread pool and, once the answer
+    is in, merges it into the item and finalizes it with
+    spider.finalize_notification() before later pipelines see it.
+
+    Crawling keeps going while items wait, so crawl throughput does not
+    depend on provider latency. Limits (settings):
+    - AI_QUEUE_CONCURRENCY: provider calls in flight
+    - AI_QUEUE_RATE / AI_QUEUE_BURST: token bucket, requests per second
+    - AI_QUEUE_MAX_PENDING: queued stubs before overflow
+    - AI_QUEUE_TIMEOUT: seconds from queueing before an item stops
+      waiting (queued or in flight)
+    - AI_QUEUE_BATCH_SIZE: queued stubs sent in one
+      parse_notifications_batch() call when the provider supports
+      batching (only a backlog is batched; 1 disables)
+    - AI_QUEUE_OVERFLOW: 'skip' (item continues without AI data) or
+      'celery' (item handed to the parse_notification_with_ai task)
+
+    A failed, timed out or skipped AI call never drops the item: it is
+    finalized without AI data (and so usually flagged validation_failed).
+    """
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+        settings = crawler.settings
+        self.concurrency = settings.getint('AI_QUEUE_CONCURRENCY', 4)
+        self.rate = settings.getfloat('AI_QUEUE_RATE', 2.0)
+        self.burst = settings.getfloat('AI_QUEUE_BURST', self.concurrency)
+        self.max_pending = settings.getint('AI_QUEUE_MAX_PENDING', 200)
+        self.timeout = settings.getfloat('AI_QUEUE_TIMEOUT', 60) or None
+        self.overflow = settings.get('AI_QUEUE_OVERFLOW', 'skip')
+        self.batch_size = settings.getint('AI_QUEUE_BATCH_SIZE', 5)
+        self.threadpool = None
+        self.queue = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not (settings.getbool('ENABLE_AI_PARSING', False) and settings.getbool('AI_QUEUE_ENABLED', False)):
+            raise NotConfigured
+        return cls(crawler)
+
+    def open_spider(self, spider=None):
+        self.threadpool = ThreadPool(minthreads=0, maxthreads=self.concurrency, name='ai-parsing')
+        self.threadpool.start()
+        self.queue = AIWorkQueue(
+            self._call_provider, reactor,
+            concurrency=self.concurrency, rate=self.rate, burst=self.burst,
+            max_pending=self.max_pending, timeout=self.timeout,
+            call_batch=self._call_provider_batch, batch_size=self.batch_size, batch_key=self._batch_key,
+        )
+
+    def close_spider(self, spider=None):
+        def _shutdown(_):
+            for key, value in self.queue.stats.items():
+                self.crawler.stats.set_value(f"ai_queue/{key}", round(value, 3) if isinstance(value, float) else value)
+            self.queue.close()
+            self.threadpool.stop()
+
+        return self.queue.drain().addBoth(_shutdown)
+
+    def _call_provider(self, ai_parser, text: str):
+        return deferToThreadPool(reactor, self.threadpool, ai_parser.parse_notification, text)
+
+    @staticmethod
+    def _batch_key(ai_parser, text: str):
+        """Stubs for the same batching-capable parser can share a call"""
+        return id(ai_parser) if ai_parser.supports_batch else None
+
+    def _call_provider_batch(self, args_list):
+        ai_parser = args_list[0][0]
+        texts = [text for _, text in args_list]
+        return deferToThreadPool(reactor, self.threadpool, ai_parser.parse_notifications_batch, texts)
+
+    def process_item(self, item: Dict[str, Any], spider=None):
+        if not item or not item.get('ai_pending'):
+            return item
+
+        text = item.pop('ai_text', '')
+        item.pop('ai_pending')
+        ai_parser = spider.get_ai_parser()
+        if ai_parser is None:
+            return self._finalize(item, None, spider)
+
+        # Same page text parsed while this stub was being crawled
+        cached = ai_parser.cached(text)
+        if cached is not None:
+            return self._finalize(item, cached, spider)
+
+        try:
+            dfd = self.queue.submit(ai_parser, text)
+        except QueueFull:
+            self.crawler.stats.inc_value('ai_queue/overflow')
+            if self.overflow == 'celery':
+                return self._hand_to_celery(item, text, spider)
+            logger.warning(f"AI queue full, {item.get('source_url')} continues without AI data")
+            return self._finalize(item, None, spider)
+
+        def _failed(failure):
+            if failure.check(JobTimeout):
+                logger.warning(f"AI parsing timed out for {item.get('source_url')}")
+            else:
+                logger.error(f"AI parsing failed for {item.get('source_url')}: {failure.value}")
+            return None
+
+        dfd.addErrback(_failed)
+        dfd.addCallback(lambda data: self._finalize(item, data, spider))
+        return dfd
+
+    def _finalize(self, item, data, spider):
+        if data:
+            for key, value in data.items():
+                item.setdefault(key, value)
+        else:
+            item['ai_failed'] = True
+        return spider.finalize_notification(item, Response(url=item.get('source_url') or 'about:blank'))
+
+    def _hand_to_celery(self, item, text, spider):
+        """Queue the stub as a Celery task (broker call off the reactor), then drop it here"""
+        from src.scrapers.scheduler.tasks import parse_notification_with_ai
+
+        payload = dict(item, ai_text=text)
+        dfd = deferToThread(parse_notification_with_ai.delay, payload, spider.name)
+
+        def _sent(_):
+            self.crawler.stats.inc_value('ai_queue/celery')
+            raise DropItem(f"AI parsing deferred to Celery for {item.get('source_url')}")
+
+        def _not_sent(failure):
+            logger.error(f"Could not queue Celery AI task: {failure.value}")
+            return self._finalize(item, None, spider)
+
+        return dfd.addCallbacks(_sent, _not_sent)
@@ -0,0 +1,233 @@
+"""
+Bounded, rate-limited work queue for AI parsing requests
+
+Runs on the Twisted reactor. Callers submit() work and get a Deferred;
+jobs are started in FIFO order as long as:
+- fewer than `concurrency` jobs are in flight, and
+- the token bucket has a token (sustained `rate` per second, bursts up
+  to `burst`)
+
+BATCHING (optional, `call_batch` + `batch_size` > 1):
+- When a job starts, the jobs queued right behind it with the same
+  batch_key(*args) (None = never batched) join it, up to batch_size;
+  the group is one call_batch([args, ...]) and takes one concurrency slot
+  and one token. Jobs never wait for a batch to fill: batches only form
+  from a backlog, so an idle queue adds no latency
+- call_batch returns one result per job, in order; each job gets its own
+
+ASSUMPTIONS:
+- `call(*args)` and `call_batch(list_of_args)` return Deferreds (e.g.
+  deferToThreadPool around a blocking provider call)
+- All queue methods are called from the reactor thread
+
+FAILURE MODES:
+- Queue full (max_pending waiting jobs) → submit() raises QueueFull
+- Job not answered within `timeout` of submit() → its Deferred errbacks
+  with JobTimeout. The deadline covers time spent queued: a job still
+  waiting for a slot or token is removed and never started. A running
+  job's concurrency slot is only freed when the underlying call really
+  ends, so hung provider calls cannot pile up beyond `concurrency`
+- Job raising → its Deferred errbacks with that failure (a failed or
+  misaligned batch call errbacks every job in the batch)
+"""
+
+import time
+from collections import deque
+from typing import Callable, Dict, Hashable, List, Optional
+
+from twisted.internet import defer
+from twisted.python.failure import Failure
+
+
+class QueueFull(Exception):
+    """No room for another pending job"""
+
+
+class JobTimeout(Exception):
+    """Job did not finish within the queue timeout"""
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter
+
+    `rate` tokens are added per second up to `capacity`. take() consumes a
+    token and returns 0, or returns how many seconds to wait for the next one.
+    rate <= 0 means unlimited.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated = clock()
+
+    def take(self) -> float:
+        if self.rate <= 0:
+            return 0.0
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class _Job:
+    __slots__ = ('args', 'deferred', 'queued_at', 'timer')
+
+    def __init__(self, args, deferred, queued_at):
+        self.args = args
+        self.deferred = deferred
+        self.queued_at = queued_at
+        self.timer = None
+
+
+class AIWorkQueue:
+    """
+    FIFO of pending calls with concurrency, rate and timeout limits
+
+    Counters in self.stats: submitted, completed, failed, timeouts
+    (queued_timeouts of them never started), rejected, max_pending,
+    wait_ms (total time started jobs spent queued), batches (batch calls
+    of more than one job).
+    """
+
+    def __init__(self, call: Callable[..., defer.Deferred], reactor, concurrency: int = 4,
+                 rate: float = 0, burst: float = 1, max_pending: int = 100,
+                 timeout: Optional[float] = None,
+                 call_batch: Optional[Callable[[List[tuple]], defer.Deferred]] = None, batch_size: int = 1, batch_key: Optional[Callable[..., Hashable]] = None):
+        self.call = call
+        self.call_batch = call_batch
+        self.batch_size = max(1, batch_size) if call_batch is not None else 1
+        self.batch_key = batch_key or (lambda *args: None)
+        self.reactor = reactor
+        self.concurrency = max(1, concurrency)
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate, burst, clock=reactor.seconds)
+        self.pending = deque()
+        self.active = 0
+        self._wakeup = None
+        self._idle_waiters = []
+        self.stats: Dict[str, float] = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'timeouts': 0,
+            'queued_timeouts': 0,
+            'rejected': 0,
+            'max_pending': 0,
+            'wait_ms': 0.0,
+            'batches': 0,
+        }
+
+    def __len__(self):
+        return len(self.pending)
+
+    def submit(self, *args) -> defer.Deferred:
+        if len(self.pending) >= self.max_pending:
+            self.stats['rejected'] += 1
+            raise QueueFull(f"{len(self.pending)} AI jobs already pending")
+
+        job = _Job(args, defer.Deferred(), self.reactor.seconds())
+        if self.timeout:
+            job.timer = self.reactor.callLater(self.timeout, self._timed_out, job)
+        self.pending.append(job)
+        self.stats['submitted'] += 1
+        self.stats['max_pending'] = max(self.stats['max_pending'], len(self.pending))
+        self._pump()
+        return job.deferred
+
+    def drain(self) -> defer.Deferred:
+        """Deferred firing once nothing is pending or in flight"""
+        if not self.pending and not self.active:
+            return defer.succeed(None)
+        waiter = defer.Deferred()
+        self._idle_waiters.append(waiter)
+        return waiter
+
+    def _pump(self):
+        while self.pending and self.active < self.concurrency:
+            if self._wakeup is not None:
+                return  # already waiting for a token
+            wait = self.bucket.take()
+            if wait > 0:
+                self._wakeup = self.reactor.callLater(wait, self._wake)
+                return
+            self._start(self._take_batch())
+
+    def _take_batch(self) -> List[_Job]:
+        """Next job plus the queued jobs right behind it that can share its call"""
+        jobs = [self.pending.popleft()]
+        key = self.batch_key(*jobs[0].args) if self.batch_size > 1 else None
+        while key is not None and self.pending and len(jobs) < self.batch_size \
+                and self.batch_key(*self.pending[0].args) == key:
+            jobs.append(self.pending.popleft())
+        return jobs
+
+    def _wake(self):
+        self._wakeup = None
+        self._pump()
+
+    def _start(self, jobs: List[_Job]):
+        self.active += 1
+        now = self.reactor.seconds()
+        for job in jobs:
+            self.stats['wait_ms'] += (now - job.queued_at) * 1000
+
+        def _finished(result):
+            self.active -= 1
+            if not isinstance(result, Failure) and len(jobs) > 1 \
+                    and (not isinstance(result, list) or len(result) != len(jobs)):
+                result = Failure(ValueError(f"Batch call returned {len(result) if isinstance(result, list) else result!r} "
+                                            f"results for {len(jobs)} jobs"))
+            for index, job in enumerate(jobs):
+                if job.timer is not None and job.timer.active():
+                    job.timer.cancel()
+                if job.deferred.called:
+                    continue
+                if isinstance(result, Failure):
+                    self.stats['failed'] += 1
+                    job.deferred.errback(result)
+                else:
+                    self.stats['completed'] += 1
+                    job.deferred.callback(result[index] if len(jobs) > 1 else result)
+            self._pump()
+            self._notify_idle()
+
+        if len(jobs) > 1:
+            self.stats['batches'] += 1
+            dfd = defer.maybeDeferred(self.call_batch, [job.args for job in jobs])
+        else:
+            dfd = defer.maybeDeferred(self.call, *jobs[0].args)
+        dfd.addBoth(_finished)
+
+    def _timed_out(self, job: _Job):
+        if job.deferred.called:
+            return
+        self.stats['timeouts'] += 1
+        if job in self.pending:
+            self.pending.remove(job)
+            self.stats['queued_timeouts'] += 1
+            job.deferred.errback(JobTimeout(f"AI job still queued after {self.timeout}s"))
+            self._notify_idle()
+        else:
+            job.deferred.errback(JobTimeout(f"AI job exceeded {self.timeout}s"))
+
+    def _notify_idle(self):
+        if self.pending or self.active:
+            return
+        waiters, self._idle_waiters = self._idle_waiters, []
+        for waiter in waiters:
+            waiter.callback(None)
+
+    def close(self):
+        if self._wakeup is not None and self._wakeup.active():
+            self._wakeup.cancel()
+        self._wakeup = None
+        for job in self.pending:
+            if job.timer is not None and job.timer.active():
+                job.timer.cancel()
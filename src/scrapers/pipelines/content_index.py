@@ -0,0 +1,139 @@
+"""
+Content-addressed media index: URL → content hash, hash → stored object
+
+The same notification PDF is linked from notification, admit-card and
+result pages (and is often re-linked under a new URL). Storing by URL
+filename downloaded and stored it once per link, while two different
+files named notice.pdf overwrote each other. Objects are now stored once
+under their SHA-256 and this index maps every source URL onto them.
+
+ASSUMPTIONS:
+- One index per FILES_STORE, kept next to the crawl state (SQLite)
+- A reference is one source URL pointing at an object; an object with
+  refcount 0 is no longer linked by any known URL (candidate for GC)
+- Validators (ETag / Last-Modified) belong to the URL, not the content
+
+FAILURE MODES:
+- Index lost → every URL is re-downloaded once, objects are re-used by hash
+- Object deleted from storage behind our back → stat miss, re-downloaded
+"""
+
+import os
+import sqlite3
+import time
+from typing import List, NamedTuple, Optional
+
+CONTENT_PREFIX = 'pdf'
+
+
+def content_path(sha256: str) -> str:
+    """Storage path for a content hash: pdf/ab/ab12....pdf"""
+    return f"{CONTENT_PREFIX}/{sha256[:2]}/{sha256}.pdf"
+
+
+class UrlEntry(NamedTuple):
+    url: str
+    sha256: str
+    path: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    checked_at: int
+
+    def matches(self, etag: Optional[str], last_modified: Optional[str]) -> bool:
+        """
+        True if fresh HEAD validators show the URL unchanged
+
+        ETag wins when both sides have one; a validator missing on either
+        side never counts as a match.
+        """
+        if self.etag and etag:
+            return self.etag == etag
+        if self.last_modified and last_modified:
+            return self.last_modified == last_modified
+        return False
+
+
+class ContentIndex:
+    """SQLite-backed URL → hash index with per-object reference counts"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS objects ("
+            " sha256 TEXT PRIMARY KEY,"
+            " path TEXT NOT NULL,"
+            " size INTEGER,"
+            " refcount INTEGER NOT NULL DEFAULT 0"
+            ") WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS urls ("
+            " url TEXT PRIMARY KEY,"
+            " sha256 TEXT NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " checked_at INTEGER NOT NULL"
+            ") WITHOUT ROWID;"
+        )
+        self.conn.commit()
+
+    def lookup(self, url: str) -> Optional[UrlEntry]:
+        row = self.conn.execute(
+            "SELECT u.url, u.sha256, o.path, u.etag, u.last_modified, u.checked_at"
+            " FROM urls u JOIN objects o ON o.sha256 = u.sha256 WHERE u.url = ?",
+            (url,),
+        ).fetchone()
+        return UrlEntry(*row) if row else None
+
+    def has_object(self, sha256: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM objects WHERE sha256 = ?", (sha256,)).fetchone() is not None
+
+    def refcount(self, sha256: str) -> int:
+        row = self.conn.execute("SELECT refcount FROM objects WHERE sha256 = ?", (sha256,)).fetchone()
+        return row[0] if row else 0
+
+    def record(self, url: str, sha256: str, path: str, size: int,
+               etag: Optional[str] = None, last_modified: Optional[str] = None) -> bool:
+        """
+        Point `url` at `sha256`, adjusting reference counts
+
+        Returns: True if the object is new to the index (must be stored)
+        """
+        now = int(time.time())
+        with self.conn:
+            is_new = not self.has_object(sha256)
+            if is_new:
+                self.conn.execute(
+                    "INSERT INTO objects (sha256, path, size, refcount) VALUES (?, ?, ?, 0)",
+                    (sha256, path, size),
+                )
+
+            previous = self.conn.execute("SELECT sha256 FROM urls WHERE url = ?", (url,)).fetchone()
+            if previous is None or previous[0] != sha256:
+                if previous is not None:
+                    self.conn.execute(
+                        "UPDATE objects SET refcount = refcount - 1 WHERE sha256 = ? AND refcount > 0",
+                        (previous[0],),
+                    )
+                self.conn.execute("UPDATE objects SET refcount = refcount + 1 WHERE sha256 = ?", (sha256,))
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO urls (url, sha256, etag, last_modified, checked_at) VALUES (?, ?, ?, ?, ?)",
+                (url, sha256, etag, last_modified, now),
+            )
+        return is_new
+
+    def touch(self, url: str):
+        """Mark `url` as verified unchanged now"""
+        with self.conn:
+            self.conn.execute("UPDATE urls SET checked_at = ? WHERE url = ?", (int(time.time()), url))
+
+    def orphans(self) -> List[str]:
+        """Paths of stored objects no URL references any more"""
+        return [row[0] for row in self.conn.execute("SELECT path FROM objects WHERE refcount <= 0")]
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
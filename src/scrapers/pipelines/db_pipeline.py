@@ -3,14 +3,53 @@ import os
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
-# Django Setup (if needed, though usually handled by runner)
-import django
 from django.utils.text import slugify
 from django.db import transaction, IntegrityError
 
-from core_admin.models import Exam, ExamEvent, ScraperLog
+from src.utils.django_setup import setup_django
+
+# ORM models are bound in open_spider() once Django is set up.
+# Importing core_admin.models at module level would force django.setup()
+# on anything that merely imports this module.
+Exam = ExamEvent = ScraperLog = None
+
+# Item fields that differ on every crawl without the notification changing
+VOLATILE_ITEM_FIELDS = ('scraped_at',)
+# Per-file keys compared in item['files']; 'status' flips between
+# 'downloaded' and 'uptodate' (media_pipeline.py) for the same file
+STABLE_FILE_FIELDS = ('url', 'path', 'checksum')
+
+
+def _comparable(details: Dict[str, Any]) -> Dict[str, Any]:
+    comparable = {k: v for k, v in details.items() if k not in VOLATILE_ITEM_FIELDS}
+    files = comparable.get('files')
+    if isinstance(files, list):
+        comparable['files'] = [{k: f.get(k) for k in STABLE_FILE_FIELDS} if isinstance(f, dict) else f
+                               for f in files]
+    return comparable
+
+
+def same_item(stored: Any, item: Dict[str, Any]) -> bool:
+    """True if a stored ExamEvent.details matches `item` apart from VOLATILE_ITEM_FIELDS and file status"""
+    if not isinstance(stored, dict):
+        return False
+    return _comparable(stored) == _comparable(item)
+
+
+def _refresh_api_cache(slug: str, exam_created: bool):
+    """Write-through to the public API cache (core_admin/api.py); never raises"""
+    from core_admin.api import exam_written
+
+    exam_written(slug, exam_created=exam_created)
+
+
+def _load_models():
+    """Bind ORM models to module globals (Django must already be set up)."""
+    global Exam, ExamEvent, ScraperLog
+    if Exam is None:
+        from core_admin.models import Exam, ExamEvent, ScraperLog
 
 
 class DatabasePipeline:
@@ -21,13 +60,6 @@ class DatabasePipeline:
     
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        # Ensure Django is initialized if running standalone
-        if not os.environ.get('DJANGO_SETTINGS_MODULE'):
-            os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'admin_panel.settings')
-            try:
-                django.setup()
-            except Exception as e:
-                self.logger.error(f"Django setup failed: {e}")
 
     def process_item(self, item: Dict[str, Any], spider=None):
         """
@@ -47,7 +79,15 @@ class DatabasePipeline:
                 year = self._infer_year(item)
 
                 # Get or create Exam
-                exam = self._get_or_create_exam(item)
+                exam, exam_created = self._get_or_create_exam(item)
+
+                # An identical re-crawl leaves the row (and its updated_at, which
+                # generated pages show as last updated) untouched
+                existing = ExamEvent.objects.filter(exam=exam, year=year, event_type=event_type) \
+                    .only('details').first()
+                if existing is not None and same_item(existing.details, item):
+                    self.logger.debug(f"Unchanged {event_type} for {exam.name} ({year})")
+                    return item
 
                 # Get or create ExamEvent (duplicate detection based on exam, year, type)
                 event, created = ExamEvent.objects.update_or_create(
@@ -73,6 +113,9 @@ class DatabasePipeline:
                 else:
                     self.logger.info(f"Updated existing {event_type} for {exam.name} ({year})")
 
+                # Refresh the read API cache once the write is visible
+                transaction.on_commit(lambda: _refresh_api_cache(exam.slug, exam_created))
+
             return item
 
         except IntegrityError as e:
@@ -98,8 +141,8 @@ class DatabasePipeline:
                     return int(match.group(0))
         return datetime.now().year
 
-    def _get_or_create_exam(self, item: Dict[str, Any]) -> Exam:
-        """Get existing exam or create a new one using Django ORM."""
+    def _get_or_create_exam(self, item: Dict[str, Any]) -> Tuple[Exam, bool]:
+        """Get existing exam or create a new one using Django ORM; returns (exam, created)."""
         exam_name = item['exam_name'].strip()
         organization = item['organization'].strip()
         slug = slugify(exam_name)
@@ -114,7 +157,7 @@ class DatabasePipeline:
                 'is_active': True
             }
         )
-        return exam
+        return exam, created
 
     def _save_backup(self, item: Dict[str, Any], reason: str):
         """Save failed item to disk for recovery."""
@@ -131,7 +174,16 @@ class DatabasePipeline:
             self.logger.error(f"Failed to write backup file: {e}")
 
     def open_spider(self, spider):
-        """Log start of scraping"""
+        """Set up Django lazily and log start of scraping"""
+        settings_module = 'admin_panel.settings'
+        crawler = getattr(spider, 'crawler', None)
+        if crawler is not None:
+            settings_module = crawler.settings.get('DJANGO_SETTINGS_MODULE', settings_module)
+
+        if setup_django(settings_module):
+            _load_models()
+        else:
+            self.logger.error("Django setup failed, items will be backed up to disk only")
         self.logger.info(f"Spider opened: {spider.name}")
 
     def close_spider(self, spider):
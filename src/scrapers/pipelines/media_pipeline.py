@@ -1,37 +1,340 @@
 import os
-from scrapy.pipelines.files import FilesPipeline
+import time
+import uuid
+import hashlib
+import logging
+from scrapy.pipelines.files import FilesPipeline, FSFilesStore, S3FilesStore
 from scrapy import Request
+from twisted.internet.defer import maybeDeferred
+from twisted.internet.threads import deferToThread
+
+from .content_index import ContentIndex, content_path
+from .pdf_stream import stream_pdf, probe_validators, RejectedMedia, FileSink, S3MultipartSink
+from .slot_gate import SlotGate
+
+logger = logging.getLogger(__name__)
+
 
 class S3MediaPipeline(FilesPipeline):
     """
     Pipeline to download files to S3 (or local if configured).
     It expects 'file_urls' or maps specific fields like 'pdf_link' to it.
+
+    With MEDIA_STREAMING_ENABLED (default), files missing from the store are
+    streamed straight from the source into storage in chunks (S3 multipart
+    upload / local file) instead of being buffered whole by Scrapy's
+    downloader. Non-PDF content and files over MEDIA_MAX_FILE_SIZE are
+    rejected before (or as soon as) their bytes arrive.
+
+    With MEDIA_CONTENT_ADDRESSED (default), objects are stored once under
+    their SHA-256 (pdf/ab/ab12....pdf) and a URL → hash index
+    (ContentIndex) decides whether a URL needs downloading at all:
+    - URL verified within FILES_EXPIRES days → up to date, no request
+    - older → HEAD; unchanged ETag / Last-Modified → up to date
+    - otherwise downloaded; if the hash is already stored, the new copy is
+      discarded and the URL just gains a reference to the existing object
+
+    Streamed downloads and HEAD probes use `requests`, not Scrapy's
+    downloader, so downloader middlewares (RETRY, proxy, headers) do not
+    apply to them. They do wait on the domain's downloader slot (delay and
+    concurrency, see slot_gate.py), so politeness profiles still hold.
     """
 
+    DEFAULT_MAX_FILE_SIZE = 50 * 1024 * 1024
+    DEFAULT_PART_SIZE = 8 * 1024 * 1024
+    STAGING_PREFIX = '_staging'
+
+    def _setting(self, name, default, getter='getint'):
+        crawler = getattr(self, 'crawler', None)
+        if crawler is None:
+            return default
+        return getattr(crawler.settings, getter)(name, default)
+
+    def _inc_status(self, status):
+        stats = self.crawler.stats
+        stats.inc_value('file_count')
+        stats.inc_value(f"file_status_count/{status}")
+
+    @property
+    def content_addressed(self):
+        return self._setting('MEDIA_CONTENT_ADDRESSED', True, getter='getbool')
+
+    @property
+    def index(self):
+        if getattr(self, '_index', None) is None:
+            path = self._setting('MEDIA_INDEX_PATH', '.scrapy/media_index.sqlite3', getter='get')
+            self._index = ContentIndex(path)
+        return self._index
+
+    @property
+    def gate(self):
+        if getattr(self, '_gate', None) is None:
+            engine = getattr(getattr(self, 'crawler', None), 'engine', None)
+            self._gate = SlotGate(
+                downloader=getattr(engine, 'downloader', None),
+                default_delay=self._setting('DOWNLOAD_DELAY', 0.0, getter='getfloat'),
+                default_concurrency=self._setting('CONCURRENT_REQUESTS_PER_DOMAIN', 8),
+            )
+        return self._gate
+
+    def close_spider(self, spider=None):
+        if getattr(self, '_index', None) is not None:
+            self._index.close()
+            self._index = None
+
     def get_media_requests(self, item, info):
         urls = []
         if item.get('pdf_link'):
             urls.append(item['pdf_link'])
         if item.get('download_link'):
             urls.append(item['download_link'])
-        
+
         # Also check standard file_urls
         if item.get('file_urls'):
             urls.extend(item['file_urls'])
-            
-        return [Request(u) for u in urls]
+
+        # pdf_link and download_link/result_link are often the same URL
+        urls = list(dict.fromkeys(urls))
+
+        # download_maxsize caps the non-streaming (Scrapy downloader) path too
+        max_size = self._setting('MEDIA_MAX_FILE_SIZE', self.DEFAULT_MAX_FILE_SIZE)
+        return [Request(u, meta={'download_maxsize': max_size}) for u in urls]
+
+    def media_to_download(self, request, info, *, item=None):
+        if not self.content_addressed:
+            dfd = super().media_to_download(request, info, item=item)
+            if not self._streaming_enabled():
+                return dfd
+            return dfd.addCallback(self._stream_if_missing, request, info, item)
+
+        entry = self.index.lookup(request.url)
+        if entry is None:
+            return self._download(request)
+
+        dfd = maybeDeferred(self.store.stat_file, entry.path, info)
+        dfd.addErrback(lambda _: {})
+        dfd.addCallback(self._check_indexed, entry, request)
+        return dfd
+
+    def _streaming_enabled(self):
+        return self._setting('MEDIA_STREAMING_ENABLED', True, getter='getbool')
+
+    # ========================================================================
+    # CONTENT-ADDRESSED PATH
+    # ========================================================================
+
+    def _check_indexed(self, stat, entry, request):
+        """Decide whether an indexed URL needs a fresh download"""
+        if not stat or not stat.get('last_modified'):
+            return self._download(request)  # object gone from storage
+
+        age_days = (time.time() - entry.checked_at) / 86400
+        if age_days <= self.expires:
+            return self._uptodate(request, entry, stat)
+
+        if not (entry.etag or entry.last_modified):
+            return self._download(request)
+
+        def _compare(validators):
+            if entry.matches(*validators):
+                self.crawler.stats.inc_value('media/dedup/head_unchanged')
+                self.index.touch(request.url)
+                return self._uptodate(request, entry, stat)
+            return self._download(request)
+
+        dfd = self.gate.run(
+            request.url, deferToThread, probe_validators, request.url,
+            timeout=self._setting('DOWNLOAD_TIMEOUT', 60),
+            headers=self._request_headers(request),
+        )
+        dfd.addCallbacks(_compare, lambda _: self._download(request))
+        return dfd
+
+    def _uptodate(self, request, entry, stat):
+        self._inc_status('uptodate')
+        return {
+            'url': request.url,
+            'path': entry.path,
+            'checksum': stat.get('checksum'),
+            'status': 'uptodate',
+        }
+
+    def _download(self, request):
+        """Stream into a staging object, then move it to its content address"""
+        if not self._streaming_enabled():
+            return None
+        staging = f"{self.STAGING_PREFIX}/{uuid.uuid4().hex}.pdf"
+        sink_factory = self._sink_factory(staging)
+        if sink_factory is None:
+            return None  # unsupported store → regular Scrapy download, see file_downloaded
+
+        dfd = self.gate.run(
+            request.url,
+            deferToThread,
+            stream_pdf,
+            request.url,
+            sink_factory(),
+            max_size=self._setting('MEDIA_MAX_FILE_SIZE', self.DEFAULT_MAX_FILE_SIZE),
+            timeout=self._setting('DOWNLOAD_TIMEOUT', 60),
+            headers=self._request_headers(request),
+        )
+        dfd.addCallback(self._store_content, request, staging)
+        dfd.addErrback(self._stream_failed, request)
+        return dfd
+
+    def _store_content(self, result, request, staging):
+        path = content_path(result.sha256)
+        if not self.index.has_object(result.sha256):
+            dfd = deferToThread(self._promote, staging, path)
+        else:
+            # Known hash: keep the stored object (unless it vanished from storage)
+            dfd = maybeDeferred(self.store.stat_file, path, None)
+            dfd.addErrback(lambda _: {})
+            dfd.addCallback(lambda stat: deferToThread(
+                self._discard if stat and stat.get('last_modified') else self._promote, staging, path
+            ))
+
+        def _record(_):
+            is_new = self.index.record(request.url, result.sha256, path, result.size,
+                                       etag=result.etag, last_modified=result.last_modified)
+            if not is_new:
+                self.crawler.stats.inc_value('media/dedup/hits')
+                self.crawler.stats.inc_value('media/dedup/bytes_saved', result.size)
+            return self._stream_succeeded(result, request, path)
+
+        return dfd.addCallback(_record)
+
+    def _promote(self, staging, path):
+        """Move a staged object to its content address (blocking; runs in a thread)"""
+        store = self.store
+        if isinstance(store, S3FilesStore):
+            extra_args = self._s3_extra_args(store)
+            store.s3_client.copy_object(
+                Bucket=store.bucket, Key=f"{store.prefix}{path}",
+                CopySource={'Bucket': store.bucket, 'Key': f"{store.prefix}{staging}"},
+                MetadataDirective='REPLACE', **extra_args,
+            )
+            store.s3_client.delete_object(Bucket=store.bucket, Key=f"{store.prefix}{staging}")
+        else:
+            target = os.path.join(str(store.basedir), path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(os.path.join(str(store.basedir), staging), target)
+
+    def _discard(self, staging, path=None):
+        store = self.store
+        if isinstance(store, S3FilesStore):
+            store.s3_client.delete_object(Bucket=store.bucket, Key=f"{store.prefix}{staging}")
+        else:
+            os.remove(os.path.join(str(store.basedir), staging))
+
+    def file_downloaded(self, response, request, info, *, item=None):
+        """Non-streaming path: skip persisting content the store already has"""
+        if not self.content_addressed:
+            return super().file_downloaded(response, request, info, item=item)
+
+        sha256 = hashlib.sha256(response.body).hexdigest()
+        is_new = self.index.record(
+            request.url, sha256, content_path(sha256), len(response.body),
+            etag=self._header(response, 'ETag'),
+            last_modified=self._header(response, 'Last-Modified'),
+        )
+        if is_new:
+            return super().file_downloaded(response, request, info, item=item)
+
+        self.crawler.stats.inc_value('media/dedup/hits')
+        self.crawler.stats.inc_value('media/dedup/bytes_saved', len(response.body))
+        return hashlib.md5(response.body).hexdigest()
+
+    @staticmethod
+    def _header(response, name):
+        value = response.headers.get(name)
+        return value.decode('latin-1') if value else None
+
+    # ========================================================================
+    # STREAMING PATH
+    # ========================================================================
+
+    def _stream_if_missing(self, result, request, info, item):
+        """Stream the file into storage unless the store already has it"""
+        if result is not None:
+            return result  # up to date in store
+
+        path = self.file_path(request, info=info, item=item)
+        sink_factory = self._sink_factory(path)
+        if sink_factory is None:
+            return None  # unsupported store (GCS/FTP) → regular Scrapy download
+
+        dfd = self.gate.run(
+            request.url,
+            deferToThread,
+            stream_pdf,
+            request.url,
+            sink_factory(),
+            max_size=self._setting('MEDIA_MAX_FILE_SIZE', self.DEFAULT_MAX_FILE_SIZE),
+            timeout=self._setting('DOWNLOAD_TIMEOUT', 60),
+            headers=self._request_headers(request),
+        )
+        dfd.addCallback(self._stream_succeeded, request, path)
+        dfd.addErrback(self._stream_failed, request)
+        return dfd
+
+    @staticmethod
+    def _s3_extra_args(store):
+        extra_args = {'ContentType': 'application/pdf', 'CacheControl': S3FilesStore.HEADERS['Cache-Control']}
+        if store.POLICY:
+            extra_args['ACL'] = store.POLICY
+        return extra_args
+
+    def _sink_factory(self, path):
+        store = self.store
+        if isinstance(store, S3FilesStore):
+            part_size = self._setting('MEDIA_STREAM_PART_SIZE', self.DEFAULT_PART_SIZE)
+            return lambda: S3MultipartSink(
+                store.s3_client, store.bucket, f"{store.prefix}{path}",
+                part_size=part_size, extra_args=self._s3_extra_args(store),
+            )
+        if isinstance(store, FSFilesStore):
+            return lambda: FileSink(os.path.join(str(store.basedir), path))
+        return None
+
+    def _request_headers(self, request):
+        user_agent = self._setting('USER_AGENT', None, getter='get')
+        return {'User-Agent': user_agent} if user_agent else None
+
+    def _stream_succeeded(self, result, request, path):
+        self._inc_status('downloaded')
+        self.crawler.stats.inc_value('media/stream/bytes', result.size)
+        return {
+            'url': request.url,
+            'path': path,
+            'checksum': result.checksum,
+            'status': 'downloaded',
+        }
+
+    def _stream_failed(self, failure, request):
+        if failure.check(RejectedMedia):
+            reason = failure.value.reason
+            self.crawler.stats.inc_value(f"media/stream/rejected/{reason}")
+            logger.warning(f"File (rejected): {request.url}: {failure.value}")
+        else:
+            self.crawler.stats.inc_value('media/stream/errors')
+            logger.error(f"File (stream-error): {request.url}: {failure.value}")
+        return failure
 
     def file_path(self, request, response=None, info=None, *, item=None):
+        if response is not None and self.content_addressed:
+            return content_path(hashlib.sha256(response.body).hexdigest())
+
         # Generate a nice path: exam_name/year/filename.pdf
         exam_name = self._slugify(item.get('exam_name', 'unknown'))
         year = item.get('year', 'unknown')
         filename = request.url.split('/')[-1]
-        
+
         # Sanitize filename
         filename = filename.split('?')[0] # Remove query params
         if not filename.endswith('.pdf'):
             filename += '.pdf'
-            
+
         return f"{exam_name}/{year}/{filename}"
 
     def _slugify(self, text):
@@ -0,0 +1,249 @@
+"""
+Streaming PDF download → storage, without buffering whole bodies
+
+Scrapy's downloader keeps the full response body in memory before
+FilesPipeline uploads it, so a 200 MB result PDF costs 200+ MB of worker
+RSS. stream_pdf() reads the body in chunks and hands each chunk to a sink
+(S3 multipart upload or local file); peak memory is one upload part.
+
+ASSUMPTIONS:
+- Exam boards serve PDFs as application/pdf or a generic binary type
+- A real PDF has "%PDF-" within its first 1024 bytes (PDF spec)
+- S3 multipart parts must be >= 5 MB except the last one
+
+CONDITIONS FOR SUCCESS:
+- HTTP 200
+- Content-Type is PDF-like (or missing)
+- Content-Length (if sent) and actual size <= max_size
+- Magic bytes present
+
+NOT SCRAPY'S DOWNLOADER:
+- Fetches use `requests` in a reactor thread, so downloader middlewares
+  (RETRY, proxy, headers) do not apply; S3MediaPipeline runs them through
+  slot_gate.SlotGate so per-domain delay and concurrency still do
+
+FAILURE MODES:
+- Any check fails → RejectedMedia(reason), nothing left in storage
+  (multipart upload aborted / partial file removed)
+- Network error → exception propagates, sink aborted
+"""
+
+import hashlib
+import logging
+import os
+from typing import NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PDF_MAGIC = b'%PDF-'
+MAGIC_WINDOW = 1024
+MIN_S3_PART_SIZE = 5 * 1024 * 1024
+
+PDF_CONTENT_TYPES = {
+    'application/pdf',
+    'application/x-pdf',
+    'application/octet-stream',
+    'binary/octet-stream',
+    'application/force-download',
+    'application/download',
+}
+
+
+class StreamResult(NamedTuple):
+    checksum: str                 # md5 hex (FilesPipeline's FileInfo checksum)
+    size: int
+    sha256: str                   # content address
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class RejectedMedia(Exception):
+    """Download aborted: not a PDF, too large, or bad status"""
+
+    def __init__(self, reason: str, detail: str = ''):
+        super().__init__(f"{reason}: {detail}" if detail else reason)
+        self.reason = reason
+
+
+def is_pdf_content_type(content_type: Optional[str]) -> bool:
+    """
+    HANDLES:
+    - Parameters: "application/pdf; charset=binary" → True
+    - Missing header → True (decided by magic bytes instead)
+    - HTML error pages: "text/html" → False
+    """
+    if not content_type:
+        return True
+    return content_type.split(';')[0].strip().lower() in PDF_CONTENT_TYPES
+
+
+class FileSink:
+    """Write chunks to a local file; renamed into place on complete()"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tmp_path = f"{path}.part"
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.fh = open(self.tmp_path, 'wb')
+
+    def write(self, chunk: bytes):
+        self.fh.write(chunk)
+
+    def complete(self):
+        self.fh.close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        self.fh.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+class S3MultipartSink:
+    """
+    Upload chunks to S3 (or MinIO) as a multipart upload
+
+    Uses a botocore/boto3 S3 client (e.g. Scrapy's S3FilesStore.s3_client).
+    The multipart upload is only created once the first part is full; small
+    files are sent with a single put_object.
+    """
+
+    def __init__(self, client, bucket: str, key: str, part_size: int = 8 * 1024 * 1024,
+                 extra_args: Optional[dict] = None):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = max(part_size, MIN_S3_PART_SIZE)
+        self.extra_args = extra_args or {}
+        self.buffer = bytearray()
+        self.upload_id = None
+        self.parts = []
+
+    def write(self, chunk: bytes):
+        self.buffer.extend(chunk)
+        if len(self.buffer) >= self.part_size:
+            self._flush_part()
+
+    def _flush_part(self):
+        if self.upload_id is None:
+            response = self.client.create_multipart_upload(
+                Bucket=self.bucket, Key=self.key, **self.extra_args
+            )
+            self.upload_id = response['UploadId']
+
+        part_number = len(self.parts) + 1
+        response = self.client.upload_part(
+            Bucket=self.bucket, Key=self.key, UploadId=self.upload_id,
+            PartNumber=part_number, Body=bytes(self.buffer),
+        )
+        self.parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+        self.buffer = bytearray()
+
+    def complete(self):
+        if self.upload_id is None:
+            self.client.put_object(Bucket=self.bucket, Key=self.key, Body=bytes(self.buffer), **self.extra_args)
+            self.buffer = bytearray()
+            return
+
+        if self.buffer:
+            self._flush_part()
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket, Key=self.key, UploadId=self.upload_id,
+            MultipartUpload={'Parts': self.parts},
+        )
+
+    def abort(self):
+        self.buffer = bytearray()
+        if self.upload_id is None:
+            return
+        try:
+            self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+        except Exception as e:
+            logger.error(f"Failed to abort multipart upload {self.key}: {e}")
+
+
+def stream_pdf(url: str, sink, max_size: int, timeout: float = 60,
+               chunk_size: int = 64 * 1024, session=None, headers: Optional[dict] = None) -> StreamResult:
+    """
+    Stream `url` into `sink`, validating as early as possible
+
+    Returns: StreamResult (md5 + sha256 of the body, size, cache validators)
+    Raises: RejectedMedia (sink aborted) or network errors (sink aborted)
+    """
+    if session is None:
+        import requests
+        session = requests
+
+    md5 = hashlib.md5()
+    sha256 = hashlib.sha256()
+    validators = (None, None)
+    size = 0
+    head = b''
+    magic_checked = False
+
+    try:
+        with session.get(url, stream=True, timeout=timeout, headers=headers) as response:
+            if response.status_code != 200:
+                raise RejectedMedia('bad-status', str(response.status_code))
+
+            content_type = response.headers.get('Content-Type')
+            if not is_pdf_content_type(content_type):
+                raise RejectedMedia('content-type', content_type)
+
+            content_length = response.headers.get('Content-Length')
+            if content_length and content_length.isdigit() and int(content_length) > max_size:
+                raise RejectedMedia('too-large', f"Content-Length {content_length} > {max_size}")
+            validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if size > max_size:
+                    raise RejectedMedia('too-large', f"> {max_size} bytes")
+
+                if not magic_checked:
+                    head += chunk
+                    if len(head) < MAGIC_WINDOW:
+                        continue
+                    if PDF_MAGIC not in head[:MAGIC_WINDOW]:
+                        raise RejectedMedia('not-pdf', 'missing %PDF- header')
+                    magic_checked = True
+                    chunk, head = head, b''
+
+                md5.update(chunk)
+                sha256.update(chunk)
+                sink.write(chunk)
+
+        # Files shorter than the magic window
+        if not magic_checked:
+            if PDF_MAGIC not in head:
+                raise RejectedMedia('not-pdf' if head else 'empty-content', 'missing %PDF- header')
+            md5.update(head)
+            sha256.update(head)
+            sink.write(head)
+
+        sink.complete()
+        return StreamResult(md5.hexdigest(), size, sha256.hexdigest(), *validators)
+
+    except BaseException:
+        sink.abort()
+        raise
+
+
+def probe_validators(url: str, timeout: float = 30, session=None,
+                     headers: Optional[dict] = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    HEAD `url` and return its (ETag, Last-Modified) cache validators
+
+    Returns (None, None) when the server does not answer HEAD with 200 or
+    sends no validators; callers must then fall back to a full download.
+    """
+    if session is None:
+        import requests
+        session = requests
+
+    response = session.head(url, timeout=timeout, headers=headers, allow_redirects=True)
+    if response.status_code != 200:
+        return None, None
+    return response.headers.get('ETag'), response.headers.get('Last-Modified')
@@ -0,0 +1,230 @@
+"""
+PDF text extraction, page-level text cache and field finder
+
+Notification PDFs carry the data listing pages leave out: vacancies,
+application window, exam date. extract_pages() runs in a worker process
+(CPU-bound, must not block the reactor); PageTextCache keeps extracted
+text per (content hash, page) so a PDF linked from several pages or
+re-crawled later is never parsed twice; extract_fields() finds labelled
+values and hands them to the spider's existing extract_date() /
+extract_number().
+
+ASSUMPTIONS:
+- Key dates and vacancy counts are on the first few pages
+- Labels and values share a line, or the value is on the next line
+  (two-column tables flattened by the text extractor)
+- Numeric dates in Indian notifications are day-first (15/03/2026)
+
+BACKENDS (first importable wins):
+- pypdf / PyPDF2 (requirements.txt pins PyPDF2)
+- pdfminer.six (installed with pdfplumber)
+
+FAILURE MODES:
+- No backend installed → PdfTextUnavailable
+- Scanned (image-only) PDF → empty page texts, no fields found
+"""
+
+import importlib
+import os
+import re
+import sqlite3
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class PdfTextUnavailable(Exception):
+    """No PDF text backend (pypdf, PyPDF2 or pdfminer.six) is installed"""
+
+
+# ============================================================================
+# EXTRACTION (runs in worker processes)
+# ============================================================================
+
+def _open_reader(path: str):
+    for module_name in ('pypdf', 'PyPDF2'):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        return module.PdfReader(path)
+    return None
+
+
+def extract_pages(path: str, start: int = 0, stop: Optional[int] = None) -> Tuple[int, List[str]]:
+    """
+    Extract text of pages [start, stop) of the PDF at `path`
+
+    Returns: (total page count, page texts)
+    """
+    reader = _open_reader(path)
+    if reader is not None:
+        total = len(reader.pages)
+        stop = total if stop is None else min(stop, total)
+        return total, [reader.pages[i].extract_text() or '' for i in range(start, stop)]
+
+    try:
+        from pdfminer.high_level import extract_text
+        from pdfminer.pdfpage import PDFPage
+    except ImportError:
+        raise PdfTextUnavailable("install pypdf, PyPDF2 or pdfminer.six")
+
+    with open(path, 'rb') as fh:
+        total = sum(1 for _ in PDFPage.get_pages(fh))
+    stop = total if stop is None else min(stop, total)
+    return total, [extract_text(path, page_numbers=[i]) or '' for i in range(start, stop)]
+
+
+# ============================================================================
+# PAGE-LEVEL CACHE
+# ============================================================================
+
+class PageTextCache:
+    """
+    Extracted page text keyed by (content SHA-256, page number)
+
+    Pages are cached individually: raising PDF_TEXT_MAX_PAGES later only
+    extracts the pages not seen before.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            " sha256 TEXT PRIMARY KEY,"
+            " page_count INTEGER NOT NULL"
+            ") WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " sha256 TEXT NOT NULL,"
+            " page_no INTEGER NOT NULL,"
+            " text TEXT NOT NULL,"
+            " PRIMARY KEY (sha256, page_no)"
+            ") WITHOUT ROWID;"
+        )
+        self.conn.commit()
+
+    def get(self, sha256: str, max_pages: int) -> Tuple[Optional[int], List[str]]:
+        """
+        Returns: (page count or None if unknown, cached texts of the leading
+        pages up to max_pages, stopping at the first gap)
+        """
+        row = self.conn.execute("SELECT page_count FROM documents WHERE sha256 = ?", (sha256,)).fetchone()
+        if row is None:
+            return None, []
+
+        texts = []
+        rows = self.conn.execute(
+            "SELECT page_no, text FROM pages WHERE sha256 = ? AND page_no < ? ORDER BY page_no",
+            (sha256, max_pages),
+        )
+        for page_no, text in rows:
+            if page_no != len(texts):
+                break
+            texts.append(text)
+        return row[0], texts
+
+    def put(self, sha256: str, page_count: int, texts: List[str], start: int = 0):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO documents (sha256, page_count) VALUES (?, ?)",
+                (sha256, page_count),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO pages (sha256, page_no, text) VALUES (?, ?, ?)",
+                [(sha256, start + i, text) for i, text in enumerate(texts)],
+            )
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+# ============================================================================
+# FIELD FINDER
+# ============================================================================
+
+MONTHS = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
+_MONTH = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?'
+
+NUMERIC_DATE_RE = re.compile(r'\b(\d{1,2})[./-](\d{1,2})[./-](\d{4})\b')
+DATE_RE = re.compile(
+    r'\b\d{1,2}[./-]\d{1,2}[./-]\d{4}\b'
+    rf'|\b\d{{1,2}}(?:st|nd|rd|th)?\s+{_MONTH},?\s+\d{{4}}\b'
+    rf'|\b{_MONTH}\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}}\b',
+    re.IGNORECASE,
+)
+YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Checked in order per line; more specific labels first
+DATE_LABELS = {
+    'application_end': ('last date', 'closing date', 'end date', 'last day', 'application end', 'registration end'),
+    'application_start': ('opening date', 'start date', 'starting date', 'commencement', 'application start',
+                          'registration start', 'apply from'),
+    'exam_date': ('date of examination', 'date of exam', 'exam date', 'examination date', 'date of cbt',
+                  'computer based examination'),
+}
+VACANCY_LABELS = ('total vacancies', 'total posts', 'no. of vacancies', 'number of vacancies',
+                  'no. of posts', 'number of posts', 'vacancies')
+MAX_VACANCIES = 1_000_000
+
+
+def _day_first(date_text: str) -> str:
+    """15/03/2026 → 15 Mar 2026, so month/day cannot be swapped downstream"""
+    match = NUMERIC_DATE_RE.fullmatch(date_text)
+    if not match:
+        return date_text
+    day, month, year = (int(g) for g in match.groups())
+    if not 1 <= month <= 12:
+        return date_text
+    return f"{day} {MONTHS[month - 1].title()} {year}"
+
+
+def _after_label(line: str, labels) -> Optional[str]:
+    lower = line.lower()
+    for label in labels:
+        pos = lower.find(label)
+        if pos != -1:
+            return line[pos + len(label):]
+    return None
+
+
+def extract_fields(pages: List[str], extract_date: Callable[[str], Optional[str]],
+                   extract_number: Callable[[str], Optional[int]]) -> Dict[str, object]:
+    """
+    Find application window, exam date and vacancy count in page texts
+
+    The first labelled occurrence of each field wins. Values are parsed by
+    the spider's own extractors so formats match HTML-scraped fields.
+    """
+    lines = [line.strip() for page in pages for line in page.splitlines() if line.strip()]
+    found = {}
+
+    for i, line in enumerate(lines):
+        following = lines[i + 1] if i + 1 < len(lines) else ''
+
+        for field, labels in DATE_LABELS.items():
+            if field in found:
+                continue
+            rest = _after_label(line, labels)
+            if rest is None:
+                continue
+            match = DATE_RE.search(rest) or DATE_RE.search(following)
+            if match:
+                value = extract_date(_day_first(match.group(0)))
+                if value:
+                    found[field] = value
+            break
+
+        if 'total_vacancies' not in found:
+            rest = _after_label(line, VACANCY_LABELS)
+            if rest is not None:
+                for candidate in (rest, following):
+                    candidate = YEAR_RE.sub(' ', DATE_RE.sub(' ', candidate))
+                    number = extract_number(candidate)
+                    if number and 0 < number < MAX_VACANCIES:
+                        found['total_vacancies'] = number
+                        break
+
+    return found
@@ -0,0 +1,175 @@
+import os
+import re
+import hashlib
+import logging
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from scrapy.exceptions import NotConfigured
+from twisted.internet.threads import deferToThread
+
+from .pdf_text import PageTextCache, extract_fields, extract_pages
+
+logger = logging.getLogger(__name__)
+
+SHA256_PATH_RE = re.compile(r'([0-9a-f]{64})\.pdf$')
+
+
+class PdfTextPipeline:
+    """
+    Pipeline to enrich items with fields found inside their downloaded PDF.
+
+    Runs between S3MediaPipeline (which fills item['files']) and
+    DatabasePipeline. Only fields the listing page did not provide are
+    filled: application_start, application_end, exam_date, total_vacancies.
+
+    Text extraction runs in a process pool (PDF_TEXT_WORKERS) and is cached
+    per content hash and page (PDF_TEXT_CACHE_PATH); a cached PDF is not
+    even fetched from storage again. Failures never drop the item.
+    """
+
+    ENRICHED_FIELDS = ('application_start', 'application_end', 'exam_date', 'total_vacancies')
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+        settings = crawler.settings
+        self.files_store = settings.get('FILES_STORE') or ''
+        self.max_pages = settings.getint('PDF_TEXT_MAX_PAGES', 10)
+        self.workers = settings.getint('PDF_TEXT_WORKERS', 2)
+        self.timeout = settings.getint('PDF_TEXT_TIMEOUT', 60)
+        self.cache_path = settings.get('PDF_TEXT_CACHE_PATH', '.scrapy/pdf_text.sqlite3')
+        self.cache = None
+        self._executor = None
+        self._executor_lock = threading.Lock()  # _extract runs in several reactor threads
+        self._s3_client = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('PDF_TEXT_ENABLED', True):
+            raise NotConfigured
+        return cls(crawler)
+
+    def open_spider(self, spider=None):
+        self.cache = PageTextCache(self.cache_path)
+
+    def close_spider(self, spider=None):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    @property
+    def executor(self):
+        # Created on first use (an all-cached crawl starts no workers), under
+        # a lock so concurrent _extract threads cannot each start a pool.
+        # 'spawn': forking a process that runs reactor threads is unsafe
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def process_item(self, item: Dict[str, Any], spider=None):
+        if not item or not hasattr(spider, 'extract_date'):
+            return item
+
+        files = [f for f in item.get('files') or [] if f.get('path')]
+        missing = [field for field in self.ENRICHED_FIELDS if not item.get(field)]
+        if not files or not missing:
+            return item
+
+        path = files[0]['path']  # pdf_link comes first: the notification itself
+        match = SHA256_PATH_RE.search(path)
+        sha256 = match.group(1) if match else None
+
+        cached = []
+        if sha256:
+            page_count, cached = self.cache.get(sha256, self.max_pages)
+            if page_count is not None and len(cached) >= min(page_count, self.max_pages):
+                self.crawler.stats.inc_value('pdf_text/cache_hits')
+                return self._enrich(item, cached, spider)
+
+        dfd = deferToThread(self._extract, path, sha256, len(cached))
+
+        def _extracted(result):
+            sha, page_count, texts = result
+            self.cache.put(sha, page_count, texts, start=len(cached))
+            self.crawler.stats.inc_value('pdf_text/extracted_pages', len(texts))
+            return self._enrich(item, cached + texts, spider)
+
+        def _failed(failure):
+            self.crawler.stats.inc_value('pdf_text/errors')
+            logger.warning(f"PDF text extraction failed for {path}: {failure.value}")
+            return item
+
+        return dfd.addCallbacks(_extracted, _failed)
+
+    def _enrich(self, item, pages, spider):
+        found = extract_fields(pages, spider.extract_date, spider.extract_number)
+        enriched = []
+        for field in self.ENRICHED_FIELDS:
+            if field in found and not item.get(field):
+                item[field] = found[field]
+                enriched.append(field)
+
+        if enriched:
+            item['pdf_enriched_fields'] = enriched
+            self.crawler.stats.inc_value('pdf_text/enriched_items')
+        return item
+
+    # ========================================================================
+    # BLOCKING HELPERS (run in the reactor thread pool)
+    # ========================================================================
+
+    def _extract(self, path: str, sha256: Optional[str], start: int):
+        """Fetch the stored PDF and extract pages [start, max_pages) in a worker process"""
+        local_path, is_temp = self._local_copy(path)
+        try:
+            if sha256 is None:
+                sha256 = self._hash_file(local_path)
+            future = self.executor.submit(extract_pages, local_path, start, self.max_pages)
+            page_count, texts = future.result(timeout=self.timeout)
+            return sha256, page_count, texts
+        finally:
+            if is_temp:
+                os.remove(local_path)
+
+    def _local_copy(self, path: str):
+        """Returns: (local file path, whether it is a temporary copy)"""
+        if not self.files_store.startswith('s3://'):
+            return os.path.join(self.files_store, path), False
+
+        bucket, _, prefix = self.files_store[len('s3://'):].partition('/')
+        fd, tmp_path = tempfile.mkstemp(suffix='.pdf')
+        os.close(fd)
+        self._s3().download_file(bucket, f"{prefix}{path}", tmp_path)
+        return tmp_path, True
+
+    def _s3(self):
+        if self._s3_client is None:
+            import boto3
+
+            settings = self.crawler.settings
+            self._s3_client = boto3.client(
+                's3',
+                aws_access_key_id=settings.get('AWS_ACCESS_KEY_ID'),
+                aws_secret_access_key=settings.get('AWS_SECRET_ACCESS_KEY'),
+                endpoint_url=settings.get('AWS_ENDPOINT_URL'),
+                region_name=settings.get('AWS_REGION_NAME'),
+            )
+        return self._s3_client
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
@@ -0,0 +1,114 @@
+"""
+Per-domain politeness for fetches made outside Scrapy's downloader
+
+S3MediaPipeline streams PDFs and sends HEAD probes with `requests` in a
+reactor thread (pdf_stream.py), so they never pass through the
+downloader: downloader middlewares (RETRY, proxy, headers) do not apply
+and, without this gate, neither would the per-domain slot delay and
+concurrency that DomainPolitenessThrottle (extensions/politeness.py)
+tunes. SlotGate.run() queues such a fetch on the domain's downloader
+slot instead.
+
+ASSUMPTIONS:
+- Downloader slots are keyed by hostname (Scrapy default)
+- The slot's delay/concurrency were already set by the politeness
+  extension when the listing page on that host was crawled
+
+CONDITIONS:
+- At most slot.concurrency gated fetches run per domain at once
+- A fetch starts no earlier than slot.lastseen + slot delay, and starting
+  it moves slot.lastseen, so the downloader's next request to the domain
+  waits behind it too: downloader and out-of-band requests share one rate
+- Domains without a slot (PDF host never crawled) use DOWNLOAD_DELAY and
+  CONCURRENT_REQUESTS_PER_DOMAIN, tracked here
+- Back-off applies through the shared delay; 429/503 answers to gated
+  fetches are not fed back into it (the politeness extension only sees
+  downloader responses)
+
+FAILURE MODES:
+- Fetch raises → its concurrency token is released and the failure
+  propagates to the caller
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from scrapy.core import downloader as scrapy_downloader
+from twisted.internet import defer, task
+
+# Older Scrapy releases stamp slot.lastseen with time.time(), newer ones
+# with time.monotonic(); use the downloader's own clock
+_slot_clock = getattr(scrapy_downloader, 'monotonic', None) or time.time
+
+
+class SlotGate:
+    """Run callables returning Deferreds one domain slot-turn at a time"""
+
+    def __init__(self, downloader=None, default_delay: float = 0.0, default_concurrency: int = 1,
+                 clock=None, now: Callable[[], float] = _slot_clock):
+        self.downloader = downloader
+        self.default_delay = default_delay
+        self.default_concurrency = default_concurrency
+        if clock is None:
+            from twisted.internet import reactor as clock
+        self.clock = clock
+        self.now = now
+        self._semaphores: Dict[str, defer.DeferredSemaphore] = {}
+        self._lastseen: Dict[str, float] = {}  # domains without a downloader slot
+
+    @staticmethod
+    def slot_key(url: str) -> str:
+        return urlsplit(url).hostname or ''
+
+    def _slot(self, key: str):
+        if self.downloader is None:
+            return None
+        return self.downloader.slots.get(key)
+
+    def _semaphore(self, key: str) -> defer.DeferredSemaphore:
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            slot = self._slot(key)
+            concurrency = slot.concurrency if slot is not None else self.default_concurrency
+            semaphore = self._semaphores[key] = defer.DeferredSemaphore(max(1, int(concurrency)))
+        return semaphore
+
+    def _wait_turn(self, key: str) -> Optional[defer.Deferred]:
+        """Fire once the domain's delay since its last request has passed, claiming the turn"""
+        slot = self._slot(key)
+        if slot is not None:
+            delay, lastseen = slot.download_delay(), slot.lastseen
+        else:
+            delay, lastseen = self.default_delay, self._lastseen.get(key, 0.0)
+
+        now = self.now()
+        penalty = lastseen + delay - now
+        if penalty > 0:
+            # Re-check afterwards: the downloader may have taken the turn meanwhile
+            return task.deferLater(self.clock, penalty, self._wait_turn, key)
+
+        if slot is not None:
+            slot.lastseen = now
+        else:
+            self._lastseen[key] = now
+        return None
+
+    def run(self, url: str, fetch: Callable[..., Any], *args, **kwargs) -> defer.Deferred:
+        """fetch(*args, **kwargs) once `url`'s domain allows another request"""
+        key = self.slot_key(url)
+        semaphore = self._semaphore(key)
+
+        def _start(_):
+            dfd = defer.maybeDeferred(self._wait_turn, key)
+            dfd.addCallback(lambda _: fetch(*args, **kwargs))
+            return dfd
+
+        def _release(result):
+            semaphore.release()
+            return result
+
+        dfd = semaphore.acquire()
+        dfd.addCallback(_start)
+        dfd.addBoth(_release)
+        return dfd
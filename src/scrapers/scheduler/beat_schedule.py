@@ -21,4 +21,9 @@ beat_schedule = {
         "task": "src.scrapers.scheduler.auto_update_task.run_auto_update",
         "schedule": crontab(minute=15, hour="*/2"),
     },
+    # Scraper tasks also queue it after each crawl; this drops windows that closed
+    "refresh_upcoming_deadlines": {
+        "task": "src.scrapers.scheduler.tasks.refresh_upcoming_deadlines",
+        "schedule": crontab(minute=5, hour=0),
+    },
 }
@@ -9,20 +9,37 @@ ASSUMPTIONS:
 FAILURE HANDLING:
 - Exceptions caught and logged
 - Task returns failure state without killing worker
+
+AFTER A CRAWL:
+- A successful scraper task queues refresh_upcoming_deadlines, which
+  rebuilds the upcoming_deadlines table in its own task (readers keep
+  the old rows until it commits)
+
+STARTUP:
+- Scrapy and spider modules are imported inside run_spider(), not at
+  module level, so Celery worker boot does not pay Scrapy/Django init cost
 """
 
 import logging
+from importlib import import_module
 from celery import shared_task
-from scrapy.crawler import CrawlerProcess
-from scrapy.utils.project import get_project_settings
-
-from src.scrapers.upsc_scraper_complete import UPSCScraper
-from src.scrapers.ssc_scraper_complete import SSCScraper
 
 logger = logging.getLogger(__name__)
 
+# Spider class paths, resolved lazily by run_spider()
+SPIDERS = {
+    'upsc': 'src.scrapers.upsc_scraper_complete.UPSCScraper',
+    'ssc': 'src.scrapers.ssc_scraper_complete.SSCScraper',
+}
+
+
+def load_spider(spider_name):
+    """Import and return the spider class registered under spider_name."""
+    module_path, class_name = SPIDERS[spider_name].rsplit('.', 1)
+    return getattr(import_module(module_path), class_name)
+
 
-def run_spider(spider_cls):
+def run_spider(spider_name):
     """
     Run a Scrapy spider safely.
     
@@ -31,28 +48,88 @@ def run_spider(spider_cls):
     - Must finish within task timeout
     """
     try:
+        from scrapy.crawler import CrawlerProcess
+        from scrapy.utils.project import get_project_settings
+
+        spider_cls = load_spider(spider_name)
         process = CrawlerProcess(get_project_settings())
         process.crawl(spider_cls)
         process.start(stop_after_crawl=True)
         return True
     except Exception as e:
-        logger.error(f"Spider {spider_cls.__name__} failed: {e}")
+        logger.error(f"Spider {spider_name} failed: {e}")
         return False
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def run_upsc_scraper(self):
     """Run UPSC scraper (every 2 hours)."""
-    success = run_spider(UPSCScraper)
+    success = run_spider('upsc')
     if not success:
         raise self.retry(exc=Exception("UPSC scraper failed"))
+    refresh_upcoming_deadlines.delay()
     return {"status": "success", "spider": "upsc"}
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
 def run_ssc_scraper(self):
     """Run SSC scraper (every 2 hours)."""
-    success = run_spider(SSCScraper)
+    success = run_spider('ssc')
     if not success:
         raise self.retry(exc=Exception("SSC scraper failed"))
+    refresh_upcoming_deadlines.delay()
     return {"status": "success", "spider": "ssc"}
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def refresh_upcoming_deadlines(self):
+    """Rebuild the upcoming_deadlines table (after each crawl, and daily)."""
+    from src.utils.django_setup import setup_django
+
+    if not setup_django():
+        raise self.retry(exc=Exception("Django setup failed"))
+    from core_admin import api, deadlines
+
+    try:
+        count = deadlines.refresh()
+    except Exception as e:
+        raise self.retry(exc=e)
+    api.deadlines_refreshed()
+    return {"status": "success", "deadlines": count}
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=120)
+def parse_notification_with_ai(self, item, spider_name):
+    """
+    AI-parse a notification stub the crawl's AI queue had no room for.
+
+    `item` is the stub AIParsingPipeline dropped (ai_text holds the page
+    text); it is parsed, finalized by the spider and saved like any item.
+    """
+    from scrapy.http import Response
+    from scrapy.utils.project import get_project_settings
+    from src.scrapers.pipelines.db_pipeline import DatabasePipeline
+
+    spider = load_spider(spider_name)()
+    spider.settings = get_project_settings()
+    ai_parser = spider.get_ai_parser()
+    if ai_parser is None:
+        return {"status": "skipped", "reason": "ai_parsing_disabled"}
+
+    text = item.pop('ai_text', '')
+    item.pop('ai_pending', None)
+    try:
+        data = ai_parser.parse_notification(text)
+    finally:
+        ai_parser.close()
+    if data is None:
+        raise self.retry(exc=Exception(f"AI parsing failed for {item.get('source_url')}"))
+
+    for key, value in data.items():
+        item.setdefault(key, value)
+    item = spider.finalize_notification(item, Response(url=item.get('source_url') or 'about:blank'))
+
+    pipeline = DatabasePipeline()
+    pipeline.open_spider(spider)
+    pipeline.process_item(item, spider)
+    return {"status": "success", "source_url": item.get('source_url')}
@@ -1,5 +1,4 @@
 import os
-import sys
 
 # Scrapy Settings
 BOT_NAME = 'examforms_scrapers'
@@ -14,10 +13,46 @@ REQUEST_FINGERPRINTER_IMPLEMENTATION = '2.7'
 
 # Pipelines (Django ORM Pipeline & S3 Pipeline)
 ITEM_PIPELINES = {
+    'src.scrapers.pipelines.ai_pipeline.AIParsingPipeline': 50, # Answer queued AI fallback items first
     'src.scrapers.pipelines.media_pipeline.S3MediaPipeline': 100, # Run first to download files
+    'src.scrapers.pipelines.pdf_text_pipeline.PdfTextPipeline': 200, # Enrich items from downloaded PDFs
     'src.scrapers.pipelines.db_pipeline.DatabasePipeline': 300,
 }
 
+# Per-domain politeness profiles (see extensions/politeness.py)
+# Replaces the fixed DOWNLOAD_DELAY per spider; AutoThrottle must stay off.
+EXTENSIONS = {
+    'src.scrapers.extensions.politeness.DomainPolitenessThrottle': 0,
+}
+POLITENESS_ENABLED = os.getenv('POLITENESS_ENABLED', 'True').lower() == 'true'
+POLITENESS_PROFILES_FILE = os.getenv('POLITENESS_PROFILES_FILE')  # None → src/scrapers/politeness_profiles.json
+POLITENESS_DEBUG = False
+AUTOTHROTTLE_ENABLED = False
+
+# Persistent frontier (see extensions/frontier.py)
+# Fingerprints of fetched detail pages/PDFs survive across scheduled runs;
+# listing pages are always refreshed.
+DUPEFILTER_CLASS = 'src.scrapers.extensions.frontier.PersistentDupeFilter'
+FRONTIER_STORE_DIR = os.getenv('FRONTIER_STORE_DIR', '.scrapy/frontier')
+FRONTIER_RECRAWL_INTERVALS = [
+    # (url_class, regex, interval_seconds) - first match wins
+    ('listing', r'(LatestNotification|AdmitCard|Results|current-examinations|admit-cards|/results)', 0),
+    ('pdf', r'\.pdf($|\?)', 30 * 24 * 3600),
+    ('detail', r'.*', 7 * 24 * 3600),
+]
+
+# Incremental crawl: stop each listing page at the first row seen last run
+# (see BaseExamScraper.listing_row_seen). Force a full sweep with
+# `scrapy crawl <spider> -a mode=full`.
+INCREMENTAL_CRAWL_ENABLED = os.getenv('INCREMENTAL_CRAWL_ENABLED', 'True').lower() == 'true'
+INCREMENTAL_STATE_DIR = os.getenv('INCREMENTAL_STATE_DIR', '.scrapy/incremental')
+INCREMENTAL_FULL_SWEEP_HOURS = 24 * 7  # periodic full sweep to catch edits
+
+# Process-pool parse offload (BaseExamScraper.parse_offloaded). Opt-in per
+# run with `-a offload=1`; see benchmarks/bench_offload.py
+PARSE_OFFLOAD_ENABLED = os.getenv('PARSE_OFFLOAD_ENABLED', 'False').lower() == 'true'
+PARSE_OFFLOAD_WORKERS = int(os.getenv('PARSE_OFFLOAD_WORKERS', 2))
+
 # AWS S3 Settings
 AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID')
 AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
@@ -27,27 +62,57 @@ AWS_Use_SSL = True
 AWS_VERIFY = True
 
 FILES_STORE = os.getenv('S3_BUCKET_NAME', 's3://examforms-media/')
+# Media pipeline requests bypass the scheduler dupe filter; FilesPipeline
+# skips re-downloading stored files younger than this (days), matching the
+# 'pdf' recrawl interval above
+FILES_EXPIRES = 30
+
+# Stream PDFs straight into FILES_STORE (S3 multipart / local file) instead
+# of buffering whole bodies in the downloader
+MEDIA_STREAMING_ENABLED = os.getenv('MEDIA_STREAMING_ENABLED', 'True').lower() == 'true'
+MEDIA_MAX_FILE_SIZE = int(os.getenv('MEDIA_MAX_FILE_SIZE', 50 * 1024 * 1024))  # bytes
+MEDIA_STREAM_PART_SIZE = 8 * 1024 * 1024  # S3 multipart part size (min 5 MB)
+
+# Store each PDF once under pdf/<sha256[:2]>/<sha256>.pdf; URL → hash index
+# with ETag/Last-Modified validators for HEAD checks and reference counts
+MEDIA_CONTENT_ADDRESSED = os.getenv('MEDIA_CONTENT_ADDRESSED', 'True').lower() == 'true'
+MEDIA_INDEX_PATH = os.getenv('MEDIA_INDEX_PATH', '.scrapy/media_index.sqlite3')
+
+# PDF text extraction (fills application dates / exam date / vacancies the
+# listing page left empty); page text cached by content hash
+PDF_TEXT_ENABLED = os.getenv('PDF_TEXT_ENABLED', 'True').lower() == 'true'
+PDF_TEXT_WORKERS = int(os.getenv('PDF_TEXT_WORKERS', 2))  # extraction processes
+PDF_TEXT_MAX_PAGES = 10
+PDF_TEXT_TIMEOUT = 60  # seconds per PDF
+PDF_TEXT_CACHE_PATH = '.scrapy/pdf_text.sqlite3'
+
+# Heuristic parsing (Strategy 2): generic patterns tried before the AI fallback
+HEURISTIC_PARSING_ENABLED = True
+HEURISTIC_MIN_CONFIDENCE = 50  # 0-100, see src/utils/heuristic_parser.py
 
 # AI Parsing Settings
 ENABLE_AI_PARSING = os.getenv('ENABLE_AI_PARSING', 'False').lower() == 'true'
-AI_PROVIDER = os.getenv('AI_PROVIDER', 'openai') # openai or gemini
+AI_PROVIDER = os.getenv('AI_PROVIDER', 'openai') # openai, gemini or local (offline stand-in)
+# Provider keyword options, e.g. for 'local':
+# {'latency_ms': 800, 'jitter': 0.3, 'failure_rate': 0.05, 'seed': 1}
+AI_PROVIDER_OPTIONS = {}
+AI_MODEL = os.getenv('AI_MODEL')  # None → provider default (gpt-4o / gemini-1.5-pro)
+# Parsed responses keyed by hash(provider, model, prompt version, cleaned text)
+AI_CACHE_PATH = os.getenv('AI_CACHE_PATH', '.scrapy/ai_cache.sqlite3')
+# Page text budget per AI request (~4 chars/token); highest-scoring blocks kept
+AI_MAX_INPUT_TOKENS = 1000
+# AI fallback runs in AIParsingPipeline, not inside spider callbacks
+AI_QUEUE_ENABLED = True
+AI_QUEUE_CONCURRENCY = 4  # provider calls in flight
+AI_QUEUE_RATE = 2.0  # requests per second (token bucket), 0 = unlimited
+AI_QUEUE_BURST = 4
+AI_QUEUE_MAX_PENDING = 200
+AI_QUEUE_TIMEOUT = 60  # seconds an item waits for its AI answer, queue time included
+AI_QUEUE_BATCH_SIZE = 5  # queued items per parse_notifications_batch call, 1 = no batching
+AI_QUEUE_OVERFLOW = 'skip'  # or 'celery': hand overflow to parse_notification_with_ai
 
 # Django Integration
-# Add project root and admin_panel to sys.path
-# Using relative paths assuming settings.py is in src/scrapers/
-CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))  # src/scrapers
-SRC_DIR = os.path.dirname(CURRENT_DIR)                    # src
-PROJECT_ROOT = os.path.dirname(SRC_DIR)                   # d:/examforms.org
-
-sys.path.append(PROJECT_ROOT)
-sys.path.append(os.path.join(PROJECT_ROOT, 'src'))
-sys.path.append(os.path.join(PROJECT_ROOT, 'src', 'admin_panel'))
-
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'admin_panel.settings')
-
-import django
-try:
-    django.setup()
-except Exception as e:
-    print(f"Failed to setup Django: {e}")
+# Django is NOT set up here: importing settings happens on every `scrapy list`,
+# Celery worker boot and spider import. The DB pipeline calls
+# src.utils.django_setup.setup_django() when it opens instead.
+DJANGO_SETTINGS_MODULE = 'admin_panel.settings'
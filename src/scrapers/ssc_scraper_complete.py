@@ -113,6 +113,8 @@ class SSCScraper(BaseExamScraper):
         for row in rows[1:]:  # Skip header
             data = self._extract_notification_data(row, response)
             if data:
+                if self.listing_row_seen(response.url, data['exam_name'], data.get('pdf_link')):
+                    break
                 result = self.safe_parse_notification(response, **data)
                 if result:
                     yield result
@@ -154,6 +156,8 @@ class SSCScraper(BaseExamScraper):
         for row in rows[1:]:
             data = self._extract_admit_card_data(row, response)
             if data:
+                if self.listing_row_seen(response.url, data['exam_name'], data.get('download_link')):
+                    break
                 result = self.safe_parse_admit_card(response, **data)
                 if result:
                     yield result
@@ -193,6 +197,8 @@ class SSCScraper(BaseExamScraper):
         for row in rows[1:]:
             data = self._extract_result_data(row, response)
             if data:
+                if self.listing_row_seen(response.url, data['exam_name'], data.get('result_link')):
+                    break
                 result = self.safe_parse_result(response, **data)
                 if result:
                     yield result
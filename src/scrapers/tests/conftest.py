@@ -0,0 +1,47 @@
+"""
+Shared fixtures for tests that need the Django ORM (core_admin)
+
+ASSUMPTIONS:
+1. Django is set up once per session against an in-memory SQLite test
+   database (migrations applied), whatever DATABASE_URL says; tests that
+   do not request `db` never import Django.
+2. Each test runs in a transaction that is rolled back, with the cache
+   cleared, so tests see an empty database and cache.
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+
+@pytest.fixture(scope='session')
+def django_db_setup():
+    os.environ['DATABASE_URL'] = 'sqlite://'
+    from src.utils.django_setup import setup_django
+
+    assert setup_django()
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    if connection.vendor != 'sqlite':
+        pytest.skip('Django was already configured for a non-SQLite database')
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    yield
+    connection.creation.destroy_test_db(old_name, verbosity=0)
+    teardown_test_environment()
+
+
+@pytest.fixture
+def db(django_db_setup):
+    from django.core.cache import cache
+    from django.db import transaction
+
+    cache.clear()
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+    cache.clear()
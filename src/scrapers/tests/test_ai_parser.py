@@ -0,0 +1,115 @@
+"""
+Unit Tests for AIParser caching, batching and usage stats
+
+ASSUMPTIONS:
+1. No network: the provider is replaced by a fake replaying canned replies.
+2. Reopening the cache file simulates the next crawl run.
+"""
+
+import json
+import sys
+import os
+
+from scrapy.settings import Settings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.utils.ai_parser import AIParser, AIResponseCache, clean_input, PROMPT_VERSION
+from src.utils.ai_providers import AIProvider
+from ssc_scraper_complete import SSCScraper
+
+PAGE = "<b>SSC CGL 2026</b>   Last date 05/07/2026"
+
+
+class FakeProvider(AIProvider):
+    """Replays canned replies; reports 1000 prompt / 100 completion tokens"""
+
+    supports_batch = True
+
+    def __init__(self, replies, model='gpt-4o'):
+        super().__init__(model)
+        self.client = self
+        self.replies = list(replies)
+        self.prompts = []
+
+    def complete(self, prompt, system_prompt):
+        self.prompts.append(prompt)
+        return json.dumps(self.replies.pop(0)), 1000, 100
+
+
+def _parser(tmp_path, *replies):
+    parser = AIParser(provider='openai', model='gpt-4o', cache_path=str(tmp_path / 'ai_cache.sqlite3'))
+    parser.backend = FakeProvider(replies)
+    return parser, parser.backend
+
+
+class TestCacheKey:
+    def test_whitespace_insensitive(self):
+        assert clean_input("CGL   2026\n\nnotice") == clean_input("CGL 2026 notice")
+
+    def test_key_depends_on_model_and_prompt_version(self):
+        key = AIResponseCache.make_key('openai', 'gpt-4o', 'text')
+        assert key != AIResponseCache.make_key('openai', 'gpt-4o-mini', 'text')
+        assert PROMPT_VERSION
+
+
+class TestAIParserCache:
+    def test_second_identical_page_served_from_cache(self, tmp_path):
+        parser, completions = _parser(tmp_path, {'exam_name': 'SSC CGL 2026'})
+        assert parser.parse_notification(PAGE) == {'exam_name': 'SSC CGL 2026'}
+        assert parser.parse_notification(PAGE.replace(' ', '  ')) == {'exam_name': 'SSC CGL 2026'}
+        assert len(completions.prompts) == 1
+        assert parser.stats['requests'] == 1
+        assert parser.stats['cache_hits'] == 1
+
+    def test_cache_persists_across_runs(self, tmp_path):
+        parser, _ = _parser(tmp_path, {'exam_name': 'SSC CGL 2026'})
+        parser.parse_notification(PAGE)
+        parser.close()
+
+        parser, completions = _parser(tmp_path)
+        assert parser.parse_notification(PAGE) == {'exam_name': 'SSC CGL 2026'}
+        assert completions.prompts == []
+
+    def test_cost_and_tokens_recorded(self, tmp_path):
+        parser, _ = _parser(tmp_path, {'exam_name': 'X'})
+        parser.parse_notification(PAGE)
+        assert parser.stats['prompt_tokens'] == 1000
+        assert parser.stats['completion_tokens'] == 100
+        assert round(parser.stats['cost_usd'], 6) == 0.0035
+        assert parser.stats['latency_ms'] >= 0
+
+
+class TestAIParserBatch:
+    def test_misses_grouped_into_one_request(self, tmp_path):
+        parser, completions = _parser(tmp_path, {'exam_name': 'A'},
+                                      {'results': [{'exam_name': 'B'}, {'exam_name': 'C'}]})
+        parser.parse_notification('page a')
+        results = parser.parse_notifications_batch(['page a', 'page b', 'page c'])
+        assert [r['exam_name'] for r in results] == ['A', 'B', 'C']
+        assert len(completions.prompts) == 2
+        assert 'Document 1' in completions.prompts[1]
+
+    def test_mismatched_batch_falls_back_to_single_calls(self, tmp_path):
+        parser, completions = _parser(tmp_path, {'results': [{'exam_name': 'B'}]},
+                                      {'exam_name': 'B'}, {'exam_name': 'C'})
+        results = parser.parse_notifications_batch(['page b', 'page c'])
+        assert [r['exam_name'] for r in results] == ['B', 'C']
+        assert len(completions.prompts) == 3
+
+
+class TestSpiderParser:
+    def test_one_parser_per_spider(self, tmp_path):
+        spider = SSCScraper()
+        spider.settings = Settings({
+            'ENABLE_AI_PARSING': True,
+            'AI_PROVIDER': 'openai',
+            'AI_CACHE_PATH': str(tmp_path / 'ai_cache.sqlite3'),
+        })
+        assert spider.get_ai_parser() is spider.get_ai_parser()
+
+    def test_disabled_by_default(self):
+        spider = SSCScraper()
+        spider.settings = Settings({})
+        assert spider.get_ai_parser() is None
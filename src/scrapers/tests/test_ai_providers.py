@@ -0,0 +1,112 @@
+"""
+Unit Tests for pluggable AI providers and the local stand-in
+
+ASSUMPTIONS:
+1. LocalProvider needs no network or API key.
+2. The same seed gives the same simulated failures.
+"""
+
+import sys
+import os
+
+import pytest
+from scrapy.http import HtmlResponse
+from scrapy.settings import Settings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.utils.ai_parser import AIParser
+from src.utils.ai_providers import (
+    AIProvider,
+    LocalProvider,
+    LocalProviderError,
+    create_provider,
+    register_provider,
+)
+from ssc_scraper_complete import SSCScraper
+
+NOTICE = ("Staff Selection Commission Combined Graduate Level Examination 2026. "
+          "Total vacancies: 17,727. Opening date 24/06/2026, last date 05/07/2026.")
+
+
+class TestProviderRegistry:
+    def test_local_by_name(self):
+        assert isinstance(create_provider('local'), LocalProvider)
+
+    def test_unknown_provider_unavailable(self):
+        assert not create_provider('no-such-provider').available
+
+    def test_dotted_path(self):
+        provider = create_provider('src.utils.ai_providers.LocalProvider')
+        assert isinstance(provider, LocalProvider)
+
+    def test_register_custom(self):
+        class EchoProvider(AIProvider):
+            def __init__(self, model=None, **options):
+                super().__init__(model, **options)
+                self.client = self
+
+        register_provider('echo', EchoProvider)
+        assert isinstance(create_provider('echo'), EchoProvider)
+
+
+class TestLocalProvider:
+    def test_rule_based_answer(self):
+        parser = AIParser(provider='local')
+        data = parser.parse_notification(NOTICE)
+        assert data['exam_name'] == 'Staff Selection Commission Combined Graduate Level Examination 2026'
+        assert data['organization'] == 'Staff Selection Commission'
+        assert data['total_vacancies'] == 17727
+        assert data['application_start'] == '24/06/2026'
+        assert data['application_end'] == '05/07/2026'
+
+    def test_deterministic(self):
+        first = LocalProvider().complete(f"Text Content: {NOTICE}", '')
+        second = LocalProvider().complete(f"Text Content: {NOTICE}", '')
+        assert first == second
+
+    def test_batch_answers_each_document(self):
+        parser = AIParser(provider='local')
+        results = parser.parse_notifications_batch([NOTICE, "UPSC Civil Services Examination 2026"])
+        assert len(results) == 2
+        assert results[1]['organization'] == 'UPSC'
+        assert parser.stats['requests'] == 1
+
+    def test_failure_rate(self):
+        provider = LocalProvider(failure_rate=1.0)
+        with pytest.raises(LocalProviderError):
+            provider.complete("Text Content: x", '')
+
+    def test_failures_counted_not_raised(self):
+        parser = AIParser(provider='local', provider_options={'failure_rate': 1.0})
+        assert parser.parse_notification(NOTICE) is None
+        assert parser.stats['errors'] == 1
+
+    def test_seeded_failures_reproducible(self):
+        def pattern():
+            provider = LocalProvider(failure_rate=0.5, seed=7)
+            outcome = []
+            for _ in range(20):
+                try:
+                    provider.complete("Text Content: x", '')
+                    outcome.append(True)
+                except LocalProviderError:
+                    outcome.append(False)
+            return outcome
+
+        assert pattern() == pattern()
+        assert 0 < sum(pattern()) < 20
+
+
+class TestSpiderFallback:
+    def test_ai_fallback_with_local_provider(self):
+        spider = SSCScraper()
+        spider.settings = Settings({'ENABLE_AI_PARSING': True, 'AI_PROVIDER': 'local',
+                                    'HEURISTIC_PARSING_ENABLED': False})
+        spider.parse_notification = lambda response, **kwargs: None
+        response = HtmlResponse(url='https://ssc.nic.in/notice', body=f"<html><body><p>{NOTICE}</p></body></html>".encode(),
+                                encoding='utf-8')
+        data = spider.parse_with_strategies(response)
+        assert data['parsing_method'] == 'ai_fallback'
+        assert data['total_vacancies'] == 17727
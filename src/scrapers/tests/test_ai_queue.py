@@ -0,0 +1,200 @@
+"""
+Unit Tests for the rate-limited AI queue and AIParsingPipeline
+
+ASSUMPTIONS:
+1. A twisted Clock stands in for the reactor; jobs are Deferreds fired by hand.
+2. The pipeline test uses the offline 'local' provider.
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+
+import pytest
+from scrapy.http import HtmlResponse
+from scrapy.settings import Settings
+from scrapy.statscollectors import StatsCollector
+from twisted.internet import defer, task
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from pipelines.ai_queue import AIWorkQueue, JobTimeout, QueueFull, TokenBucket
+from pipelines.ai_pipeline import AIParsingPipeline
+from ssc_scraper_complete import SSCScraper
+
+NOTICE = ("Staff Selection Commission Combined Graduate Level Examination 2026. "
+          "Total vacancies: 17,727. Opening date 24/06/2026, last date 05/07/2026.")
+
+
+class ManualCalls:
+    """Queue callable whose Deferreds are fired by the test"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args):
+        d = defer.Deferred()
+        self.calls.append((args, d))
+        return d
+
+
+def _queue(**kwargs):
+    clock, calls = task.Clock(), ManualCalls()
+    return AIWorkQueue(calls, clock, **kwargs), clock, calls
+
+
+def _results(d):
+    out = []
+    d.addBoth(out.append)
+    return out
+
+
+class TestTokenBucket:
+    def test_burst_then_wait(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0])
+        assert bucket.take() == 0
+        assert bucket.take() == 0
+        assert bucket.take() == pytest.approx(0.5)
+        now[0] = 0.5
+        assert bucket.take() == 0
+
+    def test_unlimited(self):
+        bucket = TokenBucket(rate=0, capacity=1)
+        assert all(bucket.take() == 0 for _ in range(100))
+
+
+class TestAIWorkQueue:
+    def test_concurrency_limit(self):
+        queue, _, calls = _queue(concurrency=2)
+        results = [_results(queue.submit(i)) for i in range(3)]
+        assert len(calls.calls) == 2
+        calls.calls[0][1].callback('a')
+        assert results[0] == ['a']
+        assert len(calls.calls) == 3
+
+    def test_rate_limit(self):
+        queue, clock, calls = _queue(concurrency=10, rate=1, burst=1)
+        for i in range(3):
+            queue.submit(i)
+        assert len(calls.calls) == 1
+        clock.advance(1)
+        assert len(calls.calls) == 2
+        clock.advance(1)
+        assert len(calls.calls) == 3
+
+    def test_full_queue_rejects(self):
+        queue, _, _ = _queue(concurrency=1, max_pending=1)
+        queue.submit(1)  # started
+        queue.submit(2)  # pending
+        with pytest.raises(QueueFull):
+            queue.submit(3)
+        assert queue.stats['rejected'] == 1
+
+    def test_timeout_keeps_slot_until_call_ends(self):
+        queue, clock, calls = _queue(concurrency=1, timeout=5)
+        first = _results(queue.submit(1))
+        clock.advance(3)
+        queue.submit(2)
+        clock.advance(2)
+        assert first[0].check(JobTimeout)
+        assert len(calls.calls) == 1
+        calls.calls[0][1].callback('late')
+        assert len(calls.calls) == 2
+        assert queue.stats['timeouts'] == 1
+
+    def test_queued_job_times_out_before_starting(self):
+        queue, clock, calls = _queue(concurrency=1, timeout=5)
+        queue.submit(1)  # started, hangs
+        queued = _results(queue.submit(2))
+        clock.advance(5)
+        assert queued[0].check(JobTimeout)
+        assert len(queue) == 0
+        assert queue.stats['queued_timeouts'] == 1
+        calls.calls[0][1].callback('late')
+        assert len(calls.calls) == 1  # the timed-out job never reaches the provider
+
+    def test_backlog_drained_in_batches(self):
+        batches = ManualCalls()
+        queue, _, calls = _queue(concurrency=1, call_batch=batches, batch_size=2,
+                                 batch_key=lambda key, n: key)
+        results = [_results(queue.submit(key, n)) for n, key in enumerate('aaab')]
+        assert len(calls.calls) == 1  # idle queue: first job starts alone
+        calls.calls[0][1].callback('r0')
+        assert batches.calls[0][0] == ([('a', 1), ('a', 2)],)
+        batches.calls[0][1].callback(['r1', 'r2'])
+        assert [r[0] for r in results[:3]] == ['r0', 'r1', 'r2']
+        assert len(calls.calls) == 2  # different key: not batched
+        assert queue.stats['batches'] == 1 and queue.stats['completed'] == 3
+
+    def test_short_batch_answer_fails_every_job(self):
+        batches = ManualCalls()
+        queue, _, calls = _queue(concurrency=1, call_batch=batches, batch_size=5,
+                                 batch_key=lambda n: 'all')
+        queue.submit(0)
+        results = [_results(queue.submit(n)) for n in (1, 2)]
+        calls.calls[0][1].callback('r0')
+        batches.calls[0][1].callback(['r1'])
+        assert all(r[0].check(ValueError) for r in results)
+        assert queue.stats['failed'] == 2
+
+    def test_no_batch_key_means_single_calls(self):
+        batches = ManualCalls()
+        queue, _, calls = _queue(concurrency=1, call_batch=batches, batch_size=5)
+        for n in range(3):
+            queue.submit(n)
+        calls.calls[0][1].callback('r0')
+        assert len(calls.calls) == 2 and not batches.calls
+
+    def test_drain(self):
+        queue, _, calls = _queue()
+        queue.submit(1)
+        drained = _results(queue.drain())
+        assert drained == []
+        calls.calls[0][1].callback('done')
+        assert drained == [None]
+
+
+class TestAIParsingPipeline:
+    def _setup(self):
+        settings = Settings({'ENABLE_AI_PARSING': True, 'AI_QUEUE_ENABLED': True, 'AI_PROVIDER': 'local',
+                             'HEURISTIC_PARSING_ENABLED': False})
+        spider = SSCScraper()
+        spider.settings = settings
+        spider.parse_notification = lambda response, **kwargs: None
+        crawler = SimpleNamespace(settings=settings)
+        crawler.stats = StatsCollector(crawler)
+        pipeline = AIParsingPipeline(crawler)
+        pipeline.queue = AIWorkQueue(lambda parser, text: defer.succeed(parser.parse_notification(text)), task.Clock())
+        return spider, pipeline
+
+    def test_spider_yields_stub(self):
+        spider, _ = self._setup()
+        response = HtmlResponse(url='https://ssc.nic.in/notice', body=f"<p>{NOTICE}</p>".encode(), encoding='utf-8')
+        stub = spider.safe_parse_notification(response)
+        assert stub['ai_pending'] is True
+        assert stub['source_url'] == 'https://ssc.nic.in/notice'
+        assert 'confidence_score' not in stub
+
+    def test_stub_answered_and_finalized(self):
+        spider, pipeline = self._setup()
+        response = HtmlResponse(url='https://ssc.nic.in/notice', body=f"<p>{NOTICE}</p>".encode(), encoding='utf-8')
+        stub = spider.safe_parse_notification(response)
+        item = _results(pipeline.process_item(stub, spider))[0]
+        assert 'ai_pending' not in item and 'ai_text' not in item
+        assert item['total_vacancies'] == 17727
+        assert item['organization'] == 'Staff Selection Commission'
+        assert 'confidence_score' in item
+
+    def test_overflow_skips_ai(self):
+        spider, pipeline = self._setup()
+        pipeline.queue.max_pending = 0
+        item = pipeline.process_item({'ai_pending': True, 'ai_text': NOTICE, 'source_url': 'https://ssc.nic.in/x'}, spider)
+        assert item['ai_failed'] is True
+        assert item['validation_failed'] is True
+
+    def test_other_items_untouched(self):
+        spider, pipeline = self._setup()
+        item = {'exam_name': 'CGL'}
+        assert pipeline.process_item(item, spider) is item
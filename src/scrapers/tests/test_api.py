@@ -0,0 +1,95 @@
+"""
+Unit Tests for the public read API (core_admin/api.py, views.py)
+
+ASSUMPTIONS:
+1. Runs against the in-memory SQLite test database and LocMemCache
+   (conftest.py `db` fixture); requests go through Django's test client.
+"""
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def exam(db):
+    from core_admin.models import Exam, ExamEvent
+
+    exam = Exam.objects.create(name='SSC Combined Graduate Level', slug='ssc-cgl', organization='SSC')
+    ExamEvent.objects.create(exam=exam, year=2026, event_type='notification', total_vacancies=17727)
+    return exam
+
+
+@pytest.fixture
+def client(db):
+    from django.test import Client
+
+    return Client()
+
+
+class TestViews:
+    def test_detail_and_etag_revalidation(self, client, exam):
+        response = client.get('/api/exams/ssc-cgl/')
+        assert response.status_code == 200
+        assert json.loads(response.content)['events'][0]['total_vacancies'] == 17727
+        etag = response['ETag']
+
+        assert client.get('/api/exams/ssc-cgl/', HTTP_IF_NONE_MATCH=etag).status_code == 304
+        assert client.get('/api/exams/ssc-cgl/', HTTP_IF_NONE_MATCH='"other"').status_code == 200
+
+    def test_weak_validator_matches(self, client, exam):
+        etag = client.get('/api/exams/').headers['ETag']
+        response = client.get('/api/exams/', HTTP_IF_NONE_MATCH=f'"other", W/{etag}')
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+
+    def test_bad_parameters(self, client, db):
+        assert client.get('/api/exams/?page=0').status_code == 400
+        assert client.get('/api/exams/?page=x').status_code == 400
+        assert client.get('/api/deadlines/?days=900').status_code == 400
+
+    def test_unknown_exam(self, client, db):
+        response = client.get('/api/exams/nope/')
+        assert response.status_code == 404
+        assert json.loads(response.content) == {'error': 'exam not found'}
+
+
+class TestCache:
+    def test_exam_written_refreshes_detail(self, exam):
+        from core_admin import api
+        from core_admin.models import ExamEvent
+
+        etag, _ = api.exam_detail('ssc-cgl')
+        ExamEvent.objects.filter(exam=exam).update(total_vacancies=18000)
+        assert api.exam_detail('ssc-cgl')[0] == etag  # served from cache
+
+        api.exam_written('ssc-cgl')
+        new_etag, body = api.exam_detail('ssc-cgl')
+        assert new_etag != etag
+        assert json.loads(body)['events'][0]['total_vacancies'] == 18000
+
+    def test_new_exam_bumps_list_version(self, exam):
+        from core_admin import api
+        from core_admin.models import Exam
+
+        assert json.loads(api.exam_list(1)[1])['count'] == 1
+        Exam.objects.create(name='IBPS PO', slug='ibps-po')
+        api.exam_written('ibps-po', exam_created=True)
+        assert json.loads(api.exam_list(1)[1])['count'] == 2
+
+    def test_bump(self, db):
+        from django.core.cache import cache
+        from core_admin import api
+
+        assert api._version('exams') == 1
+        api._bump('exams')
+        assert api._version('exams') == 2
+        cache.clear()
+        api._bump('exams')  # evicted version key
+        assert api._version('exams') == 2
+
+    def test_etag_is_body_hash(self, django_db_setup):
+        from core_admin import api
+
+        assert api.encode({'a': 1}) == api.encode({'a': 1})
+        assert api.encode({'a': 1})[0] != api.encode({'a': 2})[0]
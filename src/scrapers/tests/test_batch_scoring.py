@@ -0,0 +1,82 @@
+"""
+Unit Tests for columnar confidence scoring
+
+ASSUMPTIONS:
+1. score_records() must agree with BaseExamScraper.calculate_confidence()
+   and validate_data() row for row.
+"""
+
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.utils.batch_scoring import field_masks, missing_fields, score_records, valid_url
+from ssc_scraper_complete import SSCScraper
+
+FULL = {
+    'exam_name': 'SSC CGL 2026',
+    'organization': 'Staff Selection Commission',
+    'notification_date': '2026-06-24',
+    'official_link': 'https://ssc.nic.in/notice',
+    'application_start': '2026-06-24',
+    'application_end': '2026-07-05',
+    'exam_date': '2026-09-14',
+}
+
+RECORDS = [
+    FULL,
+    {'exam_name': 'SSC CGL 2026', 'organization': 'SSC'},
+    {**FULL, 'official_link': '/relative/notice.pdf'},
+    {**FULL, 'application_end': None},
+    {**FULL, 'exam_name': '   '},
+    {**FULL, 'organization': '&nbsp;'},
+    {'exam_name': 'x', 'organization': 'y', 'official_link': 'javascript:void(0)'},
+    {'exam_name': 'x', 'organization': 'y', 'official_link': 'http:///path'},
+    {'total_vacancies': 100},
+    {},
+    None,
+]
+
+
+class TestParity:
+    def test_scores_match_per_item(self):
+        spider = SSCScraper()
+        expected = [spider.calculate_confidence(record or {}) for record in RECORDS]
+        assert score_records(RECORDS).scores.tolist() == expected
+
+    def test_validity_matches_per_item(self):
+        spider = SSCScraper()
+        expected = [spider.validate_data(record or {})[0] for record in RECORDS]
+        # Entity-only text: validate_data() accepts it, calculate_confidence() does not score it
+        expected[5] = False
+        assert score_records(RECORDS).valid.tolist() == expected
+
+    def test_url_mask_matches_urlparse(self):
+        spider = SSCScraper()
+        for url in ['https://a.in', 'HTTP://A.IN/x', 'ftp://h', '//host/x', 'mailto:a@b.in',
+                    'https://', 'https:/a.in', ' https://a.in', '1http://a.in', None, 42]:
+            assert valid_url(url) == spider.is_valid_url(url), url
+
+
+class TestBatch:
+    def test_review_flags_low_and_invalid(self):
+        result = score_records(RECORDS)
+        assert result.review.tolist()[:2] == [False, True]
+        assert result.review[~result.valid].all()
+
+    def test_threshold(self):
+        assert not score_records([RECORDS[1]], threshold=50).review[0]
+
+    def test_empty_batch(self):
+        result = score_records([])
+        assert result.scores.shape == (0,)
+        assert result.scores.dtype == np.int16
+
+    def test_missing_fields(self):
+        masks = field_masks(RECORDS)
+        assert missing_fields(masks, 5) == ['organization']
+        assert missing_fields(masks, 9) == ['exam_name', 'organization']
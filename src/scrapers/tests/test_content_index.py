@@ -0,0 +1,90 @@
+"""
+Unit Tests for the content-addressed media index
+
+ASSUMPTIONS:
+1. Hashes are opaque strings here; real ones are SHA-256 hex digests.
+2. Reopening the index file simulates the next crawl run.
+"""
+
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pipelines.content_index import ContentIndex, UrlEntry, content_path
+
+SHA_A = 'aa' + '1' * 62
+SHA_B = 'bb' + '2' * 62
+
+
+def _index(tmp_path):
+    return ContentIndex(str(tmp_path / 'media_index.sqlite3'))
+
+
+class TestContentPath:
+    def test_sharded_by_prefix(self):
+        assert content_path(SHA_A) == f"pdf/aa/{SHA_A}.pdf"
+
+
+class TestContentIndex:
+    def test_same_content_from_two_urls_is_one_object(self, tmp_path):
+        index = _index(tmp_path)
+        assert index.record('https://upsc.gov.in/notice.pdf', SHA_A, content_path(SHA_A), 100) is True
+        assert index.record('https://upsc.gov.in/admit/notice-v2.pdf', SHA_A, content_path(SHA_A), 100) is False
+        assert index.refcount(SHA_A) == 2
+        assert index.lookup('https://upsc.gov.in/admit/notice-v2.pdf').path == content_path(SHA_A)
+        index.close()
+
+    def test_rerecording_same_url_keeps_refcount(self, tmp_path):
+        index = _index(tmp_path)
+        index.record('https://x/a.pdf', SHA_A, content_path(SHA_A), 100)
+        index.record('https://x/a.pdf', SHA_A, content_path(SHA_A), 100)
+        assert index.refcount(SHA_A) == 1
+        index.close()
+
+    def test_changed_content_moves_reference(self, tmp_path):
+        index = _index(tmp_path)
+        index.record('https://x/notice.pdf', SHA_A, content_path(SHA_A), 100)
+        index.record('https://x/notice.pdf', SHA_B, content_path(SHA_B), 120)
+        assert index.refcount(SHA_A) == 0
+        assert index.refcount(SHA_B) == 1
+        assert index.orphans() == [content_path(SHA_A)]
+        index.close()
+
+    def test_persists_across_runs(self, tmp_path):
+        index = _index(tmp_path)
+        index.record('https://x/a.pdf', SHA_A, content_path(SHA_A), 100, etag='"v1"')
+        index.close()
+
+        index = _index(tmp_path)
+        entry = index.lookup('https://x/a.pdf')
+        assert entry.sha256 == SHA_A
+        assert entry.etag == '"v1"'
+        assert index.lookup('https://x/missing.pdf') is None
+        index.close()
+
+    def test_touch_updates_checked_at(self, tmp_path):
+        index = _index(tmp_path)
+        index.record('https://x/a.pdf', SHA_A, content_path(SHA_A), 100)
+        index.conn.execute("UPDATE urls SET checked_at = 0")
+        index.touch('https://x/a.pdf')
+        assert index.lookup('https://x/a.pdf').checked_at >= int(time.time()) - 1
+        index.close()
+
+
+class TestValidators:
+    def _entry(self, etag=None, last_modified=None):
+        return UrlEntry('https://x/a.pdf', SHA_A, content_path(SHA_A), etag, last_modified, 0)
+
+    def test_etag_match(self):
+        assert self._entry(etag='"v1"').matches('"v1"', None)
+
+    def test_etag_changed(self):
+        assert not self._entry(etag='"v1"', last_modified='Mon').matches('"v2"', 'Mon')
+
+    def test_last_modified_fallback(self):
+        assert self._entry(last_modified='Mon, 01 Jun 2026').matches(None, 'Mon, 01 Jun 2026')
+
+    def test_no_validators_never_match(self):
+        assert not self._entry().matches(None, None)
@@ -0,0 +1,101 @@
+"""
+Unit Tests for the upcoming_deadlines table (core_admin/deadlines.py)
+
+ASSUMPTIONS:
+1. Runs against the in-memory SQLite test database (conftest.py `db`
+   fixture); the PostgreSQL table lock in refresh() is not exercised.
+"""
+
+from datetime import date, timedelta
+from io import StringIO
+
+import pytest
+
+TODAY = date(2026, 10, 19)
+
+
+@pytest.fixture
+def events(db):
+    """Exam 'ssc-N'/'upsc-N' with one window closing N-3 days after TODAY"""
+    from core_admin.models import Exam, ExamEvent
+
+    for n in range(8):
+        organization = 'SSC' if n % 2 else 'UPSC'
+        exam = Exam.objects.create(name=f'{organization} Exam {n}', slug=f'{organization.lower()}-{n}',
+                                   organization=organization, is_active=n != 5)
+        ExamEvent.objects.create(exam=exam, year=2026, event_type='notification',
+                                 application_end=TODAY + timedelta(days=n - 3))
+    # No application window at all
+    ExamEvent.objects.create(exam=exam, year=2025, event_type='result')
+
+
+def _slugs(rows):
+    return [row['exam_slug'] for row in rows]
+
+
+class TestRefresh:
+    def test_open_windows_of_active_exams_only(self, events):
+        from core_admin import deadlines
+        from core_admin.models import UpcomingDeadline
+
+        # Closed (n < 3), inactive (n == 5) and window-less events are left out
+        assert deadlines.refresh(TODAY) == 4
+        assert sorted(UpcomingDeadline.objects.values_list('exam_slug', flat=True)) == \
+            ['ssc-3', 'ssc-7', 'upsc-4', 'upsc-6']
+
+    def test_rerefresh_is_idempotent_and_follows_edits(self, events):
+        from core_admin import deadlines
+        from core_admin.models import Exam, UpcomingDeadline
+
+        deadlines.refresh(TODAY)
+        first = list(UpcomingDeadline.objects.order_by('event_id').values(*deadlines.FIELDS))
+        assert deadlines.refresh(TODAY) == 4
+        assert list(UpcomingDeadline.objects.order_by('event_id').values(*deadlines.FIELDS)) == first
+
+        Exam.objects.filter(slug='ssc-3').update(name='SSC CGL 2026')
+        deadlines.refresh(TODAY)
+        assert UpcomingDeadline.objects.get(exam_slug='ssc-3').exam_name == 'SSC CGL 2026'
+
+
+class TestClosingWithin:
+    def test_window_and_order(self, events):
+        from core_admin import deadlines
+
+        deadlines.refresh(TODAY)
+        assert _slugs(deadlines.closing_within(TODAY, 3, limit=10)) == ['ssc-3', 'upsc-4', 'upsc-6']
+        assert _slugs(deadlines.closing_within(TODAY, 3, limit=2)) == ['ssc-3', 'upsc-4']
+
+    def test_windows_closed_since_refresh_excluded(self, events):
+        from core_admin import deadlines
+
+        deadlines.refresh(TODAY)
+        assert _slugs(deadlines.closing_within(TODAY + timedelta(days=2), 30, limit=10)) == ['upsc-6', 'ssc-7']
+
+    def test_organization_filter(self, events):
+        from core_admin import deadlines
+
+        deadlines.refresh(TODAY)
+        assert _slugs(deadlines.closing_within(TODAY, 30, limit=10, organization='SSC')) == ['ssc-3', 'ssc-7']
+        assert deadlines.closing_within(TODAY, 30, limit=10, organization='RRB') == []
+
+
+class TestEntryPoints:
+    def test_task_refreshes_and_invalidates_api_cache(self, events, monkeypatch):
+        from django.utils import timezone
+        from core_admin import api
+        from src.scrapers.scheduler.tasks import refresh_upcoming_deadlines
+
+        monkeypatch.setattr(timezone, 'localdate', lambda: TODAY)
+        assert api.deadlines(30)[1].count(b'exam_slug') == 0  # cached before any refresh
+
+        assert refresh_upcoming_deadlines() == {'status': 'success', 'deadlines': 4}
+        assert api.deadlines(30)[1].count(b'exam_slug') == 4
+
+    def test_command(self, events, monkeypatch):
+        from django.core.management import call_command
+        from django.utils import timezone
+
+        monkeypatch.setattr(timezone, 'localdate', lambda: TODAY)
+        out = StringIO()
+        call_command('refresh_deadlines', stdout=out)
+        assert 'Upcoming deadlines: 4 open windows' in out.getvalue()
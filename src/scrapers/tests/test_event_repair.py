@@ -0,0 +1,76 @@
+"""
+Unit Tests for the stored-item repair pass (manage.py repair_events)
+
+ASSUMPTIONS:
+1. Rows are (pk, details, columns) with column dates as YYYY-MM-DD strings,
+   as the command reads them.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.utils.event_repair import event_columns, repair_batch, repair_item
+
+STORED = {
+    'exam_name': 'SSC  CGL &amp; CHSL 2026',
+    'organization': 'Staff Selection Commission',
+    'notification_date': '24/06/2026',
+    'exam_date': '14th September 2026',
+    'pdf_link': '/notices/cgl.pdf',
+    'source_url': 'https://ssc.nic.in/portal/notices',
+    'total_vacancies': '17,727 posts',
+}
+
+
+class TestRepairItem:
+    def test_normalizes_fields(self):
+        data = repair_item(STORED)
+        assert data['exam_name'] == 'SSC CGL & CHSL 2026'
+        assert data['notification_date'] == '2026-06-24'
+        assert data['exam_date'] == '2026-09-14'
+        assert data['pdf_link'] == 'https://ssc.nic.in/notices/cgl.pdf'
+        assert data['total_vacancies'] == 17727
+
+    def test_unparseable_date_kept(self):
+        assert repair_item({**STORED, 'exam_date': 'to be notified'})['exam_date'] == 'to be notified'
+
+    def test_input_not_mutated(self):
+        stored = dict(STORED)
+        repair_item(stored)
+        assert stored == STORED
+
+
+class TestColumns:
+    def test_mirrors_pipeline_mapping(self):
+        columns = event_columns(repair_item(STORED))
+        assert columns['event_date'] == '2026-06-24'
+        assert columns['official_link'] == STORED['source_url']
+        assert columns['total_vacancies'] == 17727
+
+    def test_never_clears_or_writes_invalid(self):
+        columns = event_columns({'exam_date': 'to be notified', 'pdf_link': '', 'total_vacancies': '12'})
+        assert columns == {}
+
+
+class TestRepairBatch:
+    def test_changed_rows_and_idempotent(self):
+        clean = repair_batch([(1, STORED, {})])[0][1]
+        columns = event_columns(clean)
+        changes = repair_batch([(1, STORED, {}), (2, clean, columns)])
+        assert [pk for pk, _, _ in changes] == [1]
+        assert changes[0][1]['confidence_score'] == 75
+
+    def test_column_only_change(self):
+        clean = repair_batch([(1, STORED, {})])[0][1]
+        stale = {**event_columns(clean), 'exam_date': '2026-09-15'}
+        assert repair_batch([(1, clean, stale)]) == [(1, None, {'exam_date': '2026-09-14'})]
+
+    def test_non_dict_details_skipped(self):
+        changes = repair_batch([(1, ['not', 'an', 'item'], {}), (2, 'text', {}), (3, STORED, {})])
+        assert [pk for pk, _, _ in changes] == [3]
+
+    def test_low_score_flagged(self):
+        _, details, _ = repair_batch([(1, {'exam_name': 'X Exam 2026'}, {})])[0]
+        assert details['requires_manual_review'] is True
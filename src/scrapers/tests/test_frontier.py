@@ -0,0 +1,139 @@
+"""
+Unit Tests for the persistent crawl frontier
+
+ASSUMPTIONS:
+1. Two dupe filter instances over the same store directory simulate two runs.
+2. Scrapy's 2.7 request fingerprinter is available (Scrapy >= 2.7).
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+import sys
+import os
+
+import scrapy
+from scrapy.utils.request import RequestFingerprinter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extensions.frontier import (
+    DEFAULT_RECRAWL_INTERVALS,
+    FingerprintStore,
+    PersistentDupeFilter,
+    RecrawlPolicy,
+)
+
+
+def _dupefilter(store_dir):
+    crawler = Mock()
+    crawler.request_fingerprinter = RequestFingerprinter()
+    crawler.spider = SimpleNamespace(name='upsc')
+    df = PersistentDupeFilter(crawler, str(store_dir), RecrawlPolicy(DEFAULT_RECRAWL_INTERVALS))
+    df.open()
+    return df
+
+
+def _ok(request):
+    return SimpleNamespace(status=200), request
+
+
+class TestFingerprintStore:
+    def test_mark_and_lookup(self, tmp_path):
+        store = FingerprintStore(str(tmp_path / 'fp.sqlite3'))
+        store.mark(b'\x01' * 20, 'detail', fetched_at=1000)
+        assert store.last_fetched(b'\x01' * 20) == 1000
+        assert store.last_fetched(b'\x02' * 20) is None
+        assert len(store) == 1
+        store.close()
+
+    def test_prune(self, tmp_path):
+        store = FingerprintStore(str(tmp_path / 'fp.sqlite3'))
+        store.mark(b'\x01' * 20, 'detail', fetched_at=1000)
+        store.mark(b'\x02' * 20, 'detail', fetched_at=5000)
+        assert store.prune(older_than=2000) == 1
+        assert len(store) == 1
+        store.close()
+
+
+class TestRecrawlPolicy:
+    def setup_method(self):
+        self.policy = RecrawlPolicy(DEFAULT_RECRAWL_INTERVALS)
+
+    def test_listing_always_refreshed(self):
+        request = scrapy.Request('https://ssc.nic.in/Portal/LatestNotification')
+        assert self.policy.classify(request) == ('listing', 0)
+
+    def test_pdf_class(self):
+        request = scrapy.Request('https://upsc.gov.in/files/cse-2026.pdf?v=2')
+        assert self.policy.classify(request)[0] == 'pdf'
+
+    def test_meta_override(self):
+        request = scrapy.Request('https://upsc.gov.in/x', meta={'url_class': 'listing'})
+        assert self.policy.classify(request) == ('listing', 0)
+
+
+class TestPersistentDupeFilter:
+    def test_detail_page_skipped_next_run(self, tmp_path):
+        detail = scrapy.Request('https://upsc.gov.in/exams/cse-2026')
+
+        first = _dupefilter(tmp_path)
+        assert first.request_seen(detail) is False
+        first.response_received(*_ok(detail), spider=None)
+        first.close('finished')
+
+        second = _dupefilter(tmp_path)
+        assert second.request_seen(scrapy.Request('https://upsc.gov.in/exams/cse-2026')) is True
+        second.close('finished')
+
+    def test_listing_page_refreshed_next_run(self, tmp_path):
+        listing = scrapy.Request('https://upsc.gov.in/examinations/current-examinations')
+
+        first = _dupefilter(tmp_path)
+        first.request_seen(listing)
+        first.response_received(*_ok(listing), spider=None)
+        first.close('finished')
+
+        second = _dupefilter(tmp_path)
+        assert second.request_seen(listing) is False
+        second.close('finished')
+
+    def test_failed_fetch_not_remembered(self, tmp_path):
+        detail = scrapy.Request('https://upsc.gov.in/exams/cds-2026')
+
+        first = _dupefilter(tmp_path)
+        first.request_seen(detail)
+        first.response_received(SimpleNamespace(status=500), detail, spider=None)
+        first.close('finished')
+
+        second = _dupefilter(tmp_path)
+        assert second.request_seen(detail) is False
+        second.close('finished')
+
+    def test_expired_interval_recrawled(self, tmp_path):
+        detail = scrapy.Request('https://upsc.gov.in/exams/nda-2026')
+        df = _dupefilter(tmp_path)
+        fp = df.fingerprinter.fingerprint(detail)
+        df.store.mark(fp, 'detail', fetched_at=int(time.time()) - 8 * 24 * 3600)
+        assert df.request_seen(detail) is False
+        df.close('finished')
+
+    def test_expired_fingerprints_pruned_on_open(self, tmp_path):
+        now = int(time.time())
+        first = _dupefilter(tmp_path)
+        first.store.mark(b'\x01' * 20, 'pdf', fetched_at=now - 31 * 24 * 3600)  # past every interval
+        first.store.mark(b'\x02' * 20, 'detail', fetched_at=now - 8 * 24 * 3600)  # within the pdf interval
+        first.close('finished')
+
+        second = _dupefilter(tmp_path)
+        assert second.store.last_fetched(b'\x01' * 20) is None
+        assert second.store.last_fetched(b'\x02' * 20) is not None
+        second.crawler.stats.set_value.assert_any_call('frontier/pruned', 1)
+        second.close('finished')
+
+    def test_duplicate_within_run(self, tmp_path):
+        df = _dupefilter(tmp_path)
+        listing = scrapy.Request('https://ssc.nic.in/Portal/Results')
+        assert df.request_seen(listing) is False
+        assert df.request_seen(listing) is True
+        df.close('finished')
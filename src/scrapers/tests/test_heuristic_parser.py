@@ -0,0 +1,120 @@
+"""
+Unit Tests for the generic heuristic parser (Strategy 2)
+
+ASSUMPTIONS:
+1. fixtures/boards/*.html are trimmed copies of real board page layouts
+   (div listing, table, list, detail page, free-text paragraphs).
+"""
+
+import sys
+import os
+
+import pytest
+from scrapy.http import HtmlResponse
+from scrapy.settings import Settings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.utils.heuristic_parser import HeuristicParser, trim_title
+from ssc_scraper_complete import SSCScraper
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'boards')
+
+
+def _page(name, url='https://board.gov.in/notices'):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return HtmlResponse(url=url, body=f.read(), encoding='utf-8')
+
+
+class TestBoards:
+    @pytest.mark.parametrize('fixture, expected', [
+        ('upsc_listing.html', {
+            'exam_name': 'Civil Services (Preliminary) Examination, 2026',
+            'notification_date': '14/02/2026',
+            'application_end': '04/03/2026',
+            'exam_date': '24/05/2026',
+            'total_vacancies': 979,
+        }),
+        ('ssc_table.html', {
+            'exam_name': 'Combined Graduate Level Examination 2026',
+            'notification_date': '24/06/2026',
+            'total_vacancies': 17727,
+        }),
+        ('ibps_list.html', {
+            'application_start': '01/08/2026',
+            'application_end': '21/08/2026',
+            'total_vacancies': 5208,
+        }),
+        ('rrb_detail.html', {
+            'exam_name': 'Centralised Employment Notice No. 02/2026 (Non-Technical Popular Categories) Recruitment 2026',
+            'application_start': '14 September 2026',
+            'application_end': '13 October 2026',
+            'total_vacancies': 11558,
+            'pdf_link': '/uploads/CEN-02-2026-NTPC.pdf',
+        }),
+        ('mpsc_paragraphs.html', {
+            'exam_name': 'Maharashtra Group B (Non-Gazetted) Combined Preliminary Examination 2026',
+            'application_start': '05/08/2026',
+            'application_end': '25/08/2026',
+            'exam_date': '02/11/2026',
+            'total_vacancies': 1333,
+        }),
+    ])
+    def test_fields(self, fixture, expected):
+        data = HeuristicParser().parse_page(_page(fixture))
+        for field, value in expected.items():
+            assert data[field] == value, field
+        assert data['heuristic_confidence'] >= 70
+
+    def test_listing_row_chosen_by_pdf_link(self):
+        data = HeuristicParser().parse_page(
+            _page('ssc_table.html'), pdf_link='/SSCFileServer/PortalManagement/UploadedFiles/notice_SPP13.pdf')
+        assert data['exam_name'] == 'Selection Post Phase XIII Examination 2026'
+        assert data['application_end'] == '18/07/2026'
+
+    def test_listing_unmatched_pdf_link_not_parsed(self):
+        # Another row's dates must not be saved under this row's title/link
+        page = _page('ssc_table.html')
+        assert HeuristicParser().parse_page(page, pdf_link='/SSCFileServer/other_notice.pdf') is None
+        assert HeuristicParser().parse_page(page) is not None
+
+
+class TestFields:
+    def test_title_trimming(self):
+        assert trim_title('1. CGL Examination 2026 (17727 posts)') == 'CGL Examination 2026'
+        assert trim_title('Advt. No. 12/2026 - Assistant Recruitment 2026') == 'Assistant Recruitment 2026'
+
+    def test_generic_anchor_not_a_title(self):
+        data = HeuristicParser().extract('Download CEN 02/2026', [('Download CEN 02/2026', '/a.pdf')])
+        assert data is None
+
+    def test_date_not_read_as_vacancies(self):
+        data = HeuristicParser().extract('Clerk Grade Recruitment Examination 2026 notified 05/07/2026 posts')
+        assert 'total_vacancies' not in data
+
+    def test_low_confidence_for_bare_title(self):
+        data = HeuristicParser().extract('Clerk Recruitment 2026')
+        assert data['heuristic_confidence'] == 50
+
+
+class TestStrategy:
+    def _spider(self, **settings):
+        spider = SSCScraper()
+        spider.settings = Settings(settings)
+        spider.parse_notification = lambda response, **kwargs: None
+        return spider
+
+    def test_heuristic_before_ai(self):
+        data = self._spider().parse_with_strategies(_page('rrb_detail.html'))
+        assert data['parsing_method'] == 'heuristic'
+        assert data['organization'] == SSCScraper.exam_organization
+
+    def test_below_threshold_falls_through(self):
+        spider = self._spider(HEURISTIC_MIN_CONFIDENCE=101)
+        assert spider.parse_with_strategies(_page('rrb_detail.html')) is None
+
+    def test_row_metadata_wins(self):
+        data = self._spider().parse_with_strategies(_page('rrb_detail.html'), exam_name='RRB NTPC 2026', pdf_link=None)
+        assert data['exam_name'] == 'RRB NTPC 2026'
+        assert data['pdf_link'] == '/uploads/CEN-02-2026-NTPC.pdf'
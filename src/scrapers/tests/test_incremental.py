@@ -0,0 +1,102 @@
+"""
+Unit Tests for incremental crawl mode
+
+ASSUMPTIONS:
+1. Listing pages are reverse-chronological (newest row first).
+2. A finished crawl persists state; the next spider instance is the next run.
+"""
+
+import json
+import time
+from unittest.mock import Mock
+import sys
+import os
+
+from scrapy.http import HtmlResponse
+from scrapy.settings import Settings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ssc_scraper_complete import SSCScraper
+
+LISTING_URL = 'https://ssc.nic.in/Portal/LatestNotification'
+
+
+def _listing(*titles):
+    rows = ''.join(
+        f'<tr><td>{t}</td><td><a href="/{t.replace(" ", "-")}.pdf">{t}</a></td></tr>' for t in titles
+    )
+    body = f'<html><body><table><tr><th>Exam</th><th>Link</th></tr>{rows}</table></body></html>'
+    return HtmlResponse(url=LISTING_URL, body=body.encode('utf-8'), encoding='utf-8')
+
+
+def _spider(state_dir, enabled=True, **kwargs):
+    spider = SSCScraper(**kwargs)
+    spider.crawler = Mock()
+    spider.crawler.settings = Settings({
+        'INCREMENTAL_CRAWL_ENABLED': enabled,
+        'INCREMENTAL_STATE_DIR': str(state_dir),
+        'INCREMENTAL_FULL_SWEEP_HOURS': 24,
+    })
+    return spider
+
+
+def _titles(spider, response):
+    return [item['exam_name'] for item in spider.parse_notifications_page(response)]
+
+
+class TestIncrementalCrawl:
+    def test_first_run_processes_all_rows(self, tmp_path):
+        spider = _spider(tmp_path)
+        assert _titles(spider, _listing('CGL 2026', 'CHSL 2026')) == ['CGL 2026', 'CHSL 2026']
+
+    def test_second_run_stops_at_seen_row(self, tmp_path):
+        first = _spider(tmp_path)
+        _titles(first, _listing('CGL 2026', 'CHSL 2026'))
+        first.closed('finished')
+
+        second = _spider(tmp_path)
+        assert _titles(second, _listing('MTS 2026', 'CGL 2026', 'CHSL 2026')) == ['MTS 2026']
+
+    def test_unchanged_listing_emits_nothing(self, tmp_path):
+        first = _spider(tmp_path)
+        _titles(first, _listing('CGL 2026', 'CHSL 2026'))
+        first.closed('finished')
+
+        second = _spider(tmp_path)
+        assert _titles(second, _listing('CGL 2026', 'CHSL 2026')) == []
+
+    def test_failed_run_does_not_save_state(self, tmp_path):
+        first = _spider(tmp_path)
+        _titles(first, _listing('CGL 2026'))
+        first.closed('shutdown')
+        assert not os.path.exists(tmp_path / 'ssc.json')
+
+    def test_full_sweep_mode(self, tmp_path):
+        first = _spider(tmp_path)
+        _titles(first, _listing('CGL 2026', 'CHSL 2026'))
+        first.closed('finished')
+
+        second = _spider(tmp_path, mode='full')
+        assert _titles(second, _listing('CGL 2026', 'CHSL 2026')) == ['CGL 2026', 'CHSL 2026']
+
+    def test_periodic_full_sweep(self, tmp_path):
+        first = _spider(tmp_path)
+        _titles(first, _listing('CGL 2026'))
+        first.closed('finished')
+
+        path = tmp_path / 'ssc.json'
+        state = json.loads(path.read_text())
+        state['listings'][LISTING_URL]['last_full_sweep'] = time.time() - 25 * 3600
+        path.write_text(json.dumps(state))
+
+        second = _spider(tmp_path)
+        assert _titles(second, _listing('CGL 2026')) == ['CGL 2026']
+
+    def test_disabled_without_setting(self, tmp_path):
+        first = _spider(tmp_path, enabled=False)
+        _titles(first, _listing('CGL 2026'))
+        first.closed('finished')
+
+        second = _spider(tmp_path, enabled=False)
+        assert _titles(second, _listing('CGL 2026')) == ['CGL 2026']
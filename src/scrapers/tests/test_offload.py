@@ -0,0 +1,98 @@
+"""
+Unit Tests for process-pool parse offload
+
+ASSUMPTIONS:
+1. The worker function is called directly (same process) to keep tests fast;
+   it only receives picklable arguments, exactly as in the pool.
+2. Listing fixtures follow the SSC table layout used in test_incremental.
+"""
+
+import time
+import sys
+import os
+
+import pytest
+import scrapy
+from scrapy.http import HtmlResponse
+from scrapy.settings import Settings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from base_scraper_complete import _parse_in_worker
+from ssc_scraper_complete import SSCScraper
+
+LISTING_URL = 'https://ssc.nic.in/Portal/LatestNotification'
+SPIDER_PATH = 'ssc_scraper_complete.SSCScraper'
+DISABLED = {'enabled': False, 'listings': {}}
+
+
+def _listing(*titles):
+    rows = ''.join(
+        f'<tr><td>{t}</td><td><a href="/{t.replace(" ", "-")}.pdf">{t}</a></td></tr>' for t in titles
+    )
+    body = f'<html><body><table><tr><th>Exam</th><th>Link</th></tr>{rows}</table></body></html>'
+    return HtmlResponse(url=LISTING_URL, body=body.encode('utf-8'), encoding='utf-8')
+
+
+def _run(response, incremental=DISABLED, method='parse'):
+    return _parse_in_worker(SPIDER_PATH, method, response.url, response.body, response.encoding, incremental)
+
+
+class TestParseInWorker:
+    def test_items_match_inline_parse(self):
+        response = _listing('CGL 2026', 'CHSL 2026')
+        inline = [item['exam_name'] for item in SSCScraper().parse(response)]
+        result = _run(response)
+        assert [item['exam_name'] for item in result['items']] == inline
+        assert result['stats']['items_valid'] == 2
+
+    def test_incremental_snapshot_stops_early(self):
+        snapshot = {'enabled': True, 'listings': {}, 'force_full': False, 'full_sweep_seconds': 3600}
+        first = _run(_listing('CHSL 2026', 'CGL 2026'), incremental=snapshot)
+        assert len(first['items']) == 2
+
+        snapshot['listings'] = {LISTING_URL: {'keys': first['run_keys'][LISTING_URL], 'last_full_sweep': time.time()}}
+        result = _run(_listing('MTS 2026', 'CHSL 2026', 'CGL 2026'), incremental=snapshot)
+        assert [item['exam_name'] for item in result['items']] == ['MTS 2026']
+        assert len(result['run_keys'][LISTING_URL]) == 2
+        assert result['crawler_stats'] == {'incremental/stopped_early': 1}
+
+    def test_offload_settings_reach_worker(self, monkeypatch):
+        def report_threshold(self, response):
+            yield {'threshold': self.crawler.settings.getint('HEURISTIC_MIN_CONFIDENCE')}
+
+        monkeypatch.setattr(SSCScraper, 'report_threshold', report_threshold, raising=False)
+        spider = SSCScraper()
+        spider.settings = Settings({'HEURISTIC_MIN_CONFIDENCE': 80, 'AI_PROVIDER': 'local'})
+        offload_settings = spider._offload_settings()
+        assert offload_settings == {'HEURISTIC_MIN_CONFIDENCE': 80}
+
+        response = _listing('CGL 2026')
+        result = _parse_in_worker(SPIDER_PATH, 'report_threshold', response.url, response.body,
+                                  response.encoding, DISABLED, offload_settings)
+        assert result['items'] == [{'threshold': 80}]
+
+    def test_request_yielding_callback_rejected(self, monkeypatch):
+        monkeypatch.setattr(SSCScraper, 'follow_links', lambda self, response: iter([scrapy.Request(response.url)]),
+                            raising=False)
+        with pytest.raises(TypeError):
+            _run(_listing('CGL 2026'), method='follow_links')
+
+
+class TestMergeOffloadResult:
+    def test_counters_and_run_keys_merged(self):
+        spider = SSCScraper()
+        spider._merge_offload_result({
+            'items': [],
+            'stats': {'items_valid': 3, 'items_invalid': 1, 'errors': [{'url': LISTING_URL}]},
+            'crawler_stats': {},
+            'run_keys': {LISTING_URL: ['a', 'b']},
+        })
+        assert spider.stats['items_valid'] == 3
+        assert spider.stats['items_invalid'] == 1
+        assert len(spider.stats['errors']) == 1
+        assert spider._incremental_run_keys == {LISTING_URL: ['a', 'b']}
+
+    def test_offload_is_opt_in(self):
+        assert not SSCScraper()._offload_enabled()
+        assert SSCScraper(offload='1')._offload_enabled()
@@ -0,0 +1,190 @@
+"""
+Unit Tests for the static page build (src/page_generator/build.py)
+
+ASSUMPTIONS:
+1. ORM rows are stood in for by SimpleNamespace objects, except in
+   TestBuildExams and TestRecrawl, which use the SQLite test database
+   (conftest.py `db`).
+"""
+
+import sys
+import os
+import json
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.page_generator.build import PageBuilder, context_hash, event_data, page_path, write_manifest
+from src.page_generator.renderer import JinjaRenderer, write_atomic
+
+
+class _Related(list):
+    """Stand-in for a prefetched related manager"""
+
+    def all(self):
+        return self
+
+
+def _event(event_type='notification', year=2026, **columns):
+    fields = dict(event_date=None, application_start=None, application_end=None, exam_date=None,
+                  official_link=None, pdf_link=None, download_link=None, total_vacancies=None, updated_at=None)
+    fields.update(columns)
+    return SimpleNamespace(event_type=event_type, year=year, details=fields.pop('details', None),
+                           results=_Related(fields.pop('results', [])), **fields)
+
+
+def _exam(events=(), patterns=()):
+    return SimpleNamespace(name='SSC CGL', slug='ssc-cgl', organization='Staff Selection Commission',
+                           updated_at=None, events=_Related(events), patterns=_Related(patterns))
+
+
+class TestEventData:
+    def test_columns_override_details(self):
+        event = _event(details={'application_end': '01/07/2026', 'total_vacancies': '17,727'},
+                       application_end=date(2026, 7, 5), event_date=date(2026, 6, 24))
+        data = event_data(event)
+        assert data['application_end'] == '2026-07-05'
+        assert data['notification_date'] == '2026-06-24'
+        assert data['total_vacancies'] == '17,727'
+        assert data['year'] == 2026
+
+
+class TestContext:
+    def test_picks_event_by_type_and_year(self):
+        exam = _exam([_event(year=2025, event_date=date(2025, 6, 1)),
+                      _event(year=2026, event_date=date(2026, 6, 1)),
+                      _event('result', year=2026)])
+        context = PageBuilder('/tmp/unused').context_for('notification', exam, 2026)
+        assert context['slug'] == 'ssc-cgl-2026-notification'
+        assert context['notification_date'] == '2026-06-01'
+
+    def test_result_cutoffs(self):
+        result = SimpleNamespace(cutoff_general=Decimal('120.50'), cutoff_obc=None, cutoff_sc=None,
+                                 cutoff_st=None, cutoff_ews=None, additional_cutoffs=None)
+        exam = _exam([_event('result', results=[result])])
+        context = PageBuilder('/tmp/unused').context_for('result', exam, 2026)
+        assert context['cutoffs'] == {'cutoff_general': 120.5}
+
+    def test_missing_event_or_type(self):
+        builder = PageBuilder('/tmp/unused')
+        assert builder.context_for('admit_card', _exam([_event()]), 2026) is None
+        assert builder.context_for('unknown', _exam([_event()]), 2026) is None
+
+    def test_every_page_of_exam(self):
+        exam = _exam([_event(year=2025), _event(year=2026), _event('result', year=2026)])
+        slugs = [context['slug'] for context in PageBuilder('/tmp/unused').pages_for_exam(exam)]
+        assert slugs == ['ssc-cgl-2025-notification', 'ssc-cgl-2026-notification',
+                         'ssc-cgl-2026-result', 'ssc-cgl-syllabus']
+
+    def test_syllabus_needs_no_event(self):
+        assert PageBuilder('/tmp/unused').context_for('syllabus', _exam(), None)['slug'] == 'ssc-cgl-syllabus'
+
+
+class TestOutput:
+    def test_render_escapes(self):
+        exam = _exam([_event(details={'exam_name': 'x'}, pdf_link='/a.pdf?x=1&y=2')])
+        context = PageBuilder('/tmp/unused').context_for('notification', exam, 2026)
+        context['schema_markup'] = '{"headline": "</script><b>"}'
+        page = JinjaRenderer(bytecode_cache_dir=False).render(context)
+        assert '<\\/script><b>' in page
+        assert 'href="/a.pdf?x=1&amp;y=2"' in page
+
+    def test_write_atomic(self, tmp_path):
+        path = page_path(str(tmp_path), 'ssc-cgl-2026-notification')
+        assert write_atomic(path, 'é') == 2
+        write_atomic(path, 'second')
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == 'second'
+        assert os.listdir(os.path.dirname(path)) == ['index.html']
+
+    def test_write_atomic_stream(self, tmp_path):
+        path = str(tmp_path / 'page.html')
+        assert write_atomic(path, iter(['<p>', 'é', '</p>'])) == 9
+
+
+class _CountingRenderer:
+    fingerprint = 'v1'
+
+    def __init__(self):
+        self.rendered = []
+
+    def render_to_file(self, context, path):
+        self.rendered.append(context['slug'])
+        return write_atomic(path, context['title'])
+
+
+class TestContentHash:
+    CONTEXT = {'slug': 'ssc-cgl-syllabus', 'title': 'SSC CGL Syllabus',
+               'canonical_url': 'https://examforms.org/ssc-cgl-syllabus'}
+
+    def test_hash_is_key_order_independent_and_covers_templates(self):
+        reordered = dict(reversed(list(self.CONTEXT.items())))
+        assert context_hash(self.CONTEXT, 'v1') == context_hash(reordered, 'v1')
+        assert context_hash(self.CONTEXT, 'v1') != context_hash(self.CONTEXT, 'v2')
+        assert context_hash(self.CONTEXT, 'v1') != context_hash(dict(self.CONTEXT, title='x'), 'v1')
+
+    def test_unchanged_page_is_not_rewritten(self, tmp_path):
+        renderer = _CountingRenderer()
+        builder = PageBuilder(str(tmp_path), renderer=renderer)
+        digest = builder.write_page(self.CONTEXT)
+        assert builder.write_page(self.CONTEXT, digest) == digest
+        assert renderer.rendered == ['ssc-cgl-syllabus']
+        assert builder.stats['pages_unchanged'] == 1
+        assert builder.changed == [('ssc-cgl-syllabus', 'https://examforms.org/ssc-cgl-syllabus')]
+
+        os.unlink(page_path(str(tmp_path), 'ssc-cgl-syllabus'))
+        builder.write_page(self.CONTEXT, digest)
+        assert len(renderer.rendered) == 2
+
+    def test_manifest(self, tmp_path):
+        path = str(tmp_path / 'changes.json')
+        write_manifest(path, [('a', 'https://examforms.org/a')])
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        assert manifest['count'] == 1
+        assert manifest['slugs'] == ['a']
+        assert manifest['urls'] == ['https://examforms.org/a']
+
+
+class TestBuildExams:
+    def test_second_build_writes_nothing(self, db, tmp_path):
+        from core_admin.models import Exam, ExamEvent, PageMetadata
+
+        exam = Exam.objects.create(name='SSC Combined Graduate Level', slug='ssc-cgl', organization='SSC')
+        ExamEvent.objects.create(exam=exam, year=2026, event_type='notification')
+
+        first = PageBuilder(str(tmp_path), renderer=_CountingRenderer())
+        first.build_exams([exam.pk])
+        assert sorted(slug for slug, _ in first.changed) == ['ssc-cgl-2026-notification', 'ssc-cgl-syllabus']
+        rows = PageMetadata.objects.filter(exam=exam)
+        assert sorted(rows.values_list('page_type', flat=True)) == ['notification', 'syllabus']
+        assert all(rows.values_list('content_hash', flat=True))
+
+        second = PageBuilder(str(tmp_path), renderer=_CountingRenderer())
+        second.build_exams([exam.pk])
+        assert second.stats['pages_built'] == 0
+        assert second.stats['pages_unchanged'] == 2
+        assert second.changed == []
+
+
+class TestRecrawl:
+    def test_identical_recrawl_keeps_updated_at(self, db):
+        from core_admin.models import ExamEvent
+        from src.scrapers.pipelines import db_pipeline
+
+        db_pipeline._load_models()
+        pdf = {'url': 'https://ssc.nic.in/cgl.pdf', 'path': 'full/ab/abcd.pdf', 'checksum': 'abcd'}
+        item = {'exam_name': 'SSC Combined Graduate Level', 'organization': 'SSC', 'year': 2026,
+                'scraped_at': '2026-06-24T10:00:00', 'files': [dict(pdf, status='downloaded')]}
+        pipeline = db_pipeline.DatabasePipeline()
+        pipeline.process_item(dict(item))
+        updated_at = ExamEvent.objects.get().updated_at
+
+        # Next crawl: new scrape time, the PDF is answered from storage
+        pipeline.process_item(dict(item, scraped_at='2026-06-25T10:00:00', files=[dict(pdf, status='uptodate')]))
+        assert ExamEvent.objects.get().updated_at == updated_at
+
+        pipeline.process_item(dict(item, files=[dict(pdf, checksum='ef01', status='downloaded')]))
+        assert ExamEvent.objects.get().details['files'][0]['checksum'] == 'ef01'
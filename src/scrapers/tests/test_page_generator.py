@@ -0,0 +1,77 @@
+"""
+Unit Tests for PageGenerator shared fragments and JSON-LD encoding
+
+ASSUMPTIONS:
+1. orjson is optional; dumps_schema() must give the same text without it.
+"""
+
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.page_generator import template_generator
+from src.page_generator.template_generator import PageGenerator, dumps_schema
+
+EXAM = {'name': 'SSC CGL', 'slug': 'ssc-cgl', 'organization': 'Staff Selection Commission'}
+EVENT = {'year': 2026, 'notification_date': '2026-06-24', 'exam_date': '2026-09-14'}
+
+
+class TestFragments:
+    def test_related_links_shared_per_exam_year(self):
+        generator = PageGenerator()
+        first = generator.generate_notification_page(EXAM, EVENT)['related_pages']
+        second = generator.generate_result_page(EXAM, EVENT)['related_pages']
+        assert first == second
+        assert first[0] is second[0]
+        assert first[2] == {'url': '/ssc-cgl-2026-admit-card', 'title': 'SSC CGL 2026 Admit Card',
+                            'type': 'admit_card'}
+
+    def test_exam_specific_text_kept(self):
+        context = PageGenerator().generate_admit_card_page(EXAM, EVENT)
+        assert context['download_steps'][0] == 'Visit the official SSC CGL website'
+        assert len(context['download_steps']) == 6
+        assert context['faqs'][1]['question'] == 'What details are mentioned on SSC CGL admit card?'
+        assert len(context['faqs']) == 4
+
+
+class TestSchema:
+    def test_orjson_and_json_agree(self, monkeypatch):
+        schema = {"@type": "Event", "name": "परीक्षा 2026", "location": template_generator.SCHEMA_EXAM_CENTERS}
+        fast = dumps_schema(schema)
+        monkeypatch.setattr(template_generator, 'orjson', None)
+        assert dumps_schema(schema) == fast
+        assert json.loads(fast) == schema
+
+    def test_event_schema(self):
+        schema = json.loads(PageGenerator().generate_admit_card_page(EXAM, EVENT)['schema_markup'])
+        assert schema['startDate'] == '2026-09-14'
+        assert schema['location'] == {"@type": "Place", "name": "Multiple Exam Centers"}
+
+
+class TestDeterminism:
+    def test_same_input_same_context(self):
+        generator = PageGenerator()
+        for method in ('generate_notification_page', 'generate_admit_card_page', 'generate_result_page',
+                       'generate_answer_key_page'):
+            assert getattr(generator, method)(EXAM, EVENT) == getattr(PageGenerator(), method)(EXAM, EVENT)
+        assert generator.generate_syllabus_page(EXAM) == generator.generate_syllabus_page(EXAM)
+
+    def test_dates_from_source_rows(self):
+        exam = dict(EXAM, updated_at='2026-06-01T08:00:00+00:00')
+        event = dict(EVENT, updated_at='2026-06-25T09:30:00+00:00')
+        context = PageGenerator().generate_notification_page(exam, event)
+        schema = json.loads(context['schema_markup'])
+        assert schema['datePublished'] == '2026-06-24'
+        assert schema['dateModified'] == '2026-06-25T09:30:00+00:00'
+        assert context['last_updated'] == '2026-06-25T09:30:00+00:00'
+        assert PageGenerator().generate_syllabus_page(exam)['last_updated'] == '2026-06-01T08:00:00+00:00'
+
+    def test_falls_back_to_event_date_or_omits(self):
+        context = PageGenerator().generate_notification_page(EXAM, EVENT)
+        assert json.loads(context['schema_markup'])['dateModified'] == '2026-06-24'
+        assert context['last_updated'] == '2026-06-24'
+
+        schema = json.loads(PageGenerator().generate_result_page(EXAM, {'year': 2026})['schema_markup'])
+        assert 'datePublished' not in schema and 'dateModified' not in schema
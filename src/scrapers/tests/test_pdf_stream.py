@@ -0,0 +1,182 @@
+"""
+Unit Tests for streaming PDF downloads
+
+ASSUMPTIONS:
+1. HTTP responses are simulated with a fake session (no network access).
+2. S3 is simulated with a fake client that records multipart calls.
+"""
+
+import hashlib
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pipelines.pdf_stream import (
+    FileSink,
+    RejectedMedia,
+    S3MultipartSink,
+    is_pdf_content_type,
+    stream_pdf,
+)
+
+PDF_BODY = b'%PDF-1.4\n' + b'x' * 5000
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200, headers=None):
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {'Content-Type': 'application/pdf'}
+        self.chunks_read = 0
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            self.chunks_read += 1
+            yield self.body[i:i + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, **kwargs):
+        return self.response
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.objects = {}
+        self.parts = []
+        self.aborted = False
+        self.completed = False
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = Body
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        return {'UploadId': 'upload-1'}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.parts.append(Body)
+        return {'ETag': f'etag-{PartNumber}'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed = True
+        self.objects[Key] = b''.join(self.parts)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+
+class TestContentType:
+    def test_pdf_with_parameters(self):
+        assert is_pdf_content_type('application/pdf; charset=binary')
+
+    def test_missing_header_allowed(self):
+        assert is_pdf_content_type(None)
+
+    def test_html_rejected(self):
+        assert not is_pdf_content_type('text/html; charset=utf-8')
+
+
+class TestStreamToFile:
+    def test_writes_file_and_checksum(self, tmp_path):
+        target = tmp_path / 'cse' / '2026' / 'notice.pdf'
+        result = stream_pdf('https://upsc.gov.in/notice.pdf', FileSink(str(target)),
+                            max_size=10_000, chunk_size=512, session=FakeSession(FakeResponse(PDF_BODY)))
+        assert target.read_bytes() == PDF_BODY
+        assert result.checksum == hashlib.md5(PDF_BODY).hexdigest()
+        assert result.sha256 == hashlib.sha256(PDF_BODY).hexdigest()
+        assert result.size == len(PDF_BODY)
+
+    def test_validators_returned(self, tmp_path):
+        response = FakeResponse(PDF_BODY, headers={'Content-Type': 'application/pdf', 'ETag': '"abc"'})
+        result = stream_pdf('https://x/a.pdf', FileSink(str(tmp_path / 'a.pdf')), max_size=10_000,
+                            session=FakeSession(response))
+        assert result.etag == '"abc"'
+        assert result.last_modified is None
+
+    def test_small_pdf_below_magic_window(self, tmp_path):
+        target = tmp_path / 'tiny.pdf'
+        stream_pdf('https://x/tiny.pdf', FileSink(str(target)), max_size=10_000,
+                   session=FakeSession(FakeResponse(b'%PDF-1.7\n%%EOF')))
+        assert target.read_bytes() == b'%PDF-1.7\n%%EOF'
+
+    def test_html_error_page_rejected(self, tmp_path):
+        target = tmp_path / 'notice.pdf'
+        response = FakeResponse(b'<html>Not found</html>', headers={'Content-Type': 'text/html'})
+        with pytest.raises(RejectedMedia) as exc:
+            stream_pdf('https://x/notice.pdf', FileSink(str(target)), max_size=10_000, session=FakeSession(response))
+        assert exc.value.reason == 'content-type'
+        assert not os.listdir(tmp_path)
+
+    def test_magic_bytes_checked(self, tmp_path):
+        response = FakeResponse(b'<html>' + b'y' * 4000, headers={'Content-Type': 'application/octet-stream'})
+        with pytest.raises(RejectedMedia) as exc:
+            stream_pdf('https://x/a.pdf', FileSink(str(tmp_path / 'a.pdf')), max_size=10_000,
+                       session=FakeSession(response))
+        assert exc.value.reason == 'not-pdf'
+        assert not os.listdir(tmp_path)
+
+    def test_content_length_rejected_before_body(self, tmp_path):
+        response = FakeResponse(PDF_BODY, headers={'Content-Type': 'application/pdf', 'Content-Length': '999999'})
+        with pytest.raises(RejectedMedia) as exc:
+            stream_pdf('https://x/a.pdf', FileSink(str(tmp_path / 'a.pdf')), max_size=10_000,
+                       session=FakeSession(response))
+        assert exc.value.reason == 'too-large'
+        assert response.chunks_read == 0
+
+    def test_oversize_body_aborted_mid_stream(self, tmp_path):
+        response = FakeResponse(PDF_BODY)
+        with pytest.raises(RejectedMedia) as exc:
+            stream_pdf('https://x/a.pdf', FileSink(str(tmp_path / 'a.pdf')), max_size=2048,
+                       chunk_size=512, session=FakeSession(response))
+        assert exc.value.reason == 'too-large'
+        assert response.chunks_read < len(PDF_BODY) // 512
+        assert not os.listdir(tmp_path)
+
+    def test_bad_status_rejected(self, tmp_path):
+        with pytest.raises(RejectedMedia) as exc:
+            stream_pdf('https://x/a.pdf', FileSink(str(tmp_path / 'a.pdf')), max_size=10_000,
+                       session=FakeSession(FakeResponse(b'', status_code=404)))
+        assert exc.value.reason == 'bad-status'
+
+
+class TestS3MultipartSink:
+    def test_small_file_single_put(self):
+        client = FakeS3Client()
+        sink = S3MultipartSink(client, 'bucket', 'cse/2026/a.pdf')
+        sink.write(PDF_BODY)
+        sink.complete()
+        assert client.objects['cse/2026/a.pdf'] == PDF_BODY
+        assert client.parts == []
+
+    def test_large_file_uploaded_in_parts(self):
+        client = FakeS3Client()
+        sink = S3MultipartSink(client, 'bucket', 'big.pdf', part_size=5 * 1024 * 1024)
+        body = b'%PDF-1.4\n' + b'z' * (11 * 1024 * 1024)
+        for i in range(0, len(body), 1024 * 1024):
+            sink.write(body[i:i + 1024 * 1024])
+        sink.complete()
+        assert client.completed
+        assert len(client.parts) == 3
+        assert client.objects['big.pdf'] == body
+
+    def test_rejection_aborts_upload(self):
+        client = FakeS3Client()
+        sink = S3MultipartSink(client, 'bucket', 'big.pdf', part_size=5 * 1024 * 1024)
+        response = FakeResponse(b'%PDF-1.4\n' + b'z' * (6 * 1024 * 1024))
+        with pytest.raises(RejectedMedia):
+            stream_pdf('https://x/big.pdf', sink, max_size=5 * 1024 * 1024 + 100,
+                       chunk_size=1024 * 1024, session=FakeSession(response))
+        assert client.aborted
+        assert 'big.pdf' not in client.objects
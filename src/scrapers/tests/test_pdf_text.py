@@ -0,0 +1,127 @@
+"""
+Unit Tests for PDF text extraction and enrichment
+
+ASSUMPTIONS:
+1. Page texts are given as strings (what pypdf/pdfminer would return).
+2. The spider's extract_date/extract_number are the real BaseExamScraper ones.
+3. Extraction from a real file needs pypdf, PyPDF2 or pdfminer.six.
+"""
+
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from scrapy.settings import Settings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pipelines.pdf_text import PageTextCache, extract_fields, extract_pages
+from pipelines.pdf_text_pipeline import PdfTextPipeline
+from upsc_scraper_complete import UPSCScraper
+
+NOTIFICATION_PAGE = """
+COMBINED GRADUATE LEVEL EXAMINATION, 2026
+Total Vacancies: 17,727 (tentative)
+Opening date of online application 24.06.2026
+Last date for receipt of online applications: 05/07/2026 (23:00)
+Date of Computer Based Examination
+September 14th, 2026
+"""
+
+SHA = 'ab' + '0' * 62
+
+
+def _minimal_pdf(text):
+    """Single-page PDF with one line of Helvetica text"""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R"
+        b" /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+class TestExtractFields:
+    def setup_method(self):
+        self.spider = UPSCScraper()
+
+    def _fields(self, *pages):
+        return extract_fields(list(pages), self.spider.extract_date, self.spider.extract_number)
+
+    def test_notification_fields(self):
+        fields = self._fields(NOTIFICATION_PAGE)
+        assert fields == {
+            'total_vacancies': 17727,
+            'application_start': '2026-06-24',
+            'application_end': '2026-07-05',
+            'exam_date': '2026-09-14',
+        }
+
+    def test_numeric_dates_are_day_first(self):
+        assert self._fields("Last date: 04/05/2026")['application_end'] == '2026-05-04'
+
+    def test_year_not_taken_as_vacancies(self):
+        assert self._fields("Number of vacancies (2026):\n312")['total_vacancies'] == 312
+
+    def test_first_occurrence_wins(self):
+        fields = self._fields("Last date: 01/07/2026", "Last date for fee payment: 03/07/2026")
+        assert fields['application_end'] == '2026-07-01'
+
+    def test_nothing_found(self):
+        assert self._fields("Scanned page", "") == {}
+
+
+class TestPageTextCache:
+    def test_roundtrip(self, tmp_path):
+        cache = PageTextCache(str(tmp_path / 'pdf_text.sqlite3'))
+        cache.put(SHA, 3, ['p1', 'p2', 'p3'])
+        assert cache.get(SHA, 10) == (3, ['p1', 'p2', 'p3'])
+        assert cache.get(SHA, 2) == (3, ['p1', 'p2'])
+        cache.close()
+
+    def test_unknown_document(self, tmp_path):
+        cache = PageTextCache(str(tmp_path / 'pdf_text.sqlite3'))
+        assert cache.get(SHA, 10) == (None, [])
+        cache.close()
+
+    def test_pages_added_incrementally(self, tmp_path):
+        cache = PageTextCache(str(tmp_path / 'pdf_text.sqlite3'))
+        cache.put(SHA, 20, ['p1', 'p2'])
+        cache.put(SHA, 20, ['p3'], start=2)
+        assert cache.get(SHA, 10) == (20, ['p1', 'p2', 'p3'])
+        cache.close()
+
+
+class TestExtractPages:
+    def test_real_pdf(self, tmp_path):
+        pytest.importorskip('PyPDF2')
+        path = tmp_path / 'notice.pdf'
+        path.write_bytes(_minimal_pdf('Last date: 05/07/2026'))
+        page_count, texts = extract_pages(str(path))
+        assert page_count == 1
+        assert 'Last date' in texts[0]
+
+
+class TestPdfTextPipeline:
+    def test_concurrent_threads_share_one_executor(self):
+        pipeline = PdfTextPipeline(SimpleNamespace(settings=Settings()))
+        with ThreadPoolExecutor(max_workers=8) as threads:
+            executors = list(threads.map(lambda _: pipeline.executor, range(32)))
+        assert len({id(executor) for executor in executors}) == 1
+        pipeline.close_spider()
+        assert pipeline._executor is None
@@ -0,0 +1,148 @@
+"""
+Unit Tests for per-domain politeness profiles
+
+ASSUMPTIONS:
+1. Downloader slots can be represented by simple objects with delay/concurrency.
+2. Profile files are small JSON documents (written to tmp_path in tests).
+"""
+
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extensions.politeness import (
+    DomainPolitenessThrottle,
+    load_profiles,
+    parse_retry_after,
+    resolve_profile,
+)
+
+
+def _profiles(tmp_path, config):
+    path = tmp_path / 'profiles.json'
+    path.write_text(json.dumps(config))
+    return load_profiles(str(path))
+
+
+class TestProfileResolution:
+    def test_missing_file_uses_defaults(self, tmp_path):
+        profiles = load_profiles(str(tmp_path / 'missing.json'))
+        assert profiles['default']['min_delay'] == 2.0
+        assert profiles['domains'] == {}
+
+    def test_domain_profile_merged_over_default(self, tmp_path):
+        profiles = _profiles(tmp_path, {
+            'default': {'min_delay': 3.0},
+            'domains': {'upsc.gov.in': {'concurrency': 2}},
+        })
+        profile = resolve_profile(profiles, 'upsc.gov.in')
+        assert profile['concurrency'] == 2
+        assert profile['min_delay'] == 3.0
+        assert profile['max_backoff'] == 300.0
+
+    def test_longest_suffix_wins(self, tmp_path):
+        profiles = _profiles(tmp_path, {'domains': {
+            'nic.in': {'min_delay': 5.0},
+            'ssc.nic.in': {'min_delay': 1.0},
+        }})
+        assert resolve_profile(profiles, 'www.ssc.nic.in')['min_delay'] == 1.0
+        assert resolve_profile(profiles, 'sscner.nic.in')['min_delay'] == 5.0
+
+    def test_unknown_host_gets_default(self, tmp_path):
+        profiles = _profiles(tmp_path, {'domains': {'upsc.gov.in': {'min_delay': 9.0}}})
+        assert resolve_profile(profiles, 'example.com') is profiles['default']
+        assert resolve_profile(profiles, None) is profiles['default']
+
+
+class TestRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after(b'120') == 120.0
+
+    def test_http_date(self):
+        now = datetime(2026, 10, 21, 7, 27, 0, tzinfo=timezone.utc)
+        assert parse_retry_after('Wed, 21 Oct 2026 07:28:00 GMT', now=now) == 60.0
+
+    def test_past_date_is_zero(self):
+        now = datetime(2026, 10, 22, tzinfo=timezone.utc)
+        assert parse_retry_after('Wed, 21 Oct 2026 07:28:00 GMT', now=now) == 0.0
+
+    def test_garbage(self):
+        assert parse_retry_after('soon') is None
+        assert parse_retry_after(None) is None
+
+
+class TestDelayPolicy:
+    profile = {
+        'min_delay': 1.0, 'max_delay': 10.0, 'target_concurrency': 2.0,
+        'backoff_factor': 2.0, 'max_backoff': 100.0,
+    }
+
+    def test_fast_server_reduces_delay(self):
+        assert DomainPolitenessThrottle.adjust_delay(5.0, 0.2, 200, self.profile) == 2.55
+
+    def test_delay_clamped_to_min_and_max(self):
+        assert DomainPolitenessThrottle.adjust_delay(1.0, 0.01, 200, self.profile) == 1.0
+        assert DomainPolitenessThrottle.adjust_delay(5.0, 60.0, 200, self.profile) == 10.0
+
+    def test_error_response_never_reduces_delay(self):
+        assert DomainPolitenessThrottle.adjust_delay(5.0, 0.1, 404, self.profile) == 5.0
+
+    def test_backoff_is_exponential(self):
+        assert DomainPolitenessThrottle.backoff_delay(3.0, self.profile) == 6.0
+
+    def test_backoff_honors_retry_after(self):
+        assert DomainPolitenessThrottle.backoff_delay(3.0, self.profile, retry_after=45.0) == 45.0
+
+    def test_backoff_capped(self):
+        assert DomainPolitenessThrottle.backoff_delay(3.0, self.profile, retry_after=3600.0) == 100.0
+
+
+class TestSignalHandlers:
+    def setup_method(self):
+        self.slot = SimpleNamespace(delay=5.0, concurrency=1)
+        crawler = Mock()
+        crawler.settings.getbool.return_value = False
+        crawler.engine.downloader.slots = {'cdn.cloudfront.net': self.slot}
+        profiles = {
+            'default': {},
+            'domains': {'cloudfront.net': {
+                'start_delay': 0.5, 'min_delay': 0.0, 'max_delay': 10.0,
+                'target_concurrency': 4.0, 'concurrency': 4,
+                'backoff_factor': 2.0, 'max_backoff': 300.0,
+            }},
+        }
+        self.ext = DomainPolitenessThrottle(crawler, profiles)
+        self.crawler = crawler
+
+    def _request(self, latency=0.4):
+        return SimpleNamespace(meta={'download_slot': 'cdn.cloudfront.net', 'download_latency': latency})
+
+    def test_profile_applied_on_first_request(self):
+        self.ext.request_reached_downloader(self._request(), spider=None)
+        assert self.slot.concurrency == 4
+        assert self.slot.delay == 0.5
+
+    def test_429_backs_off_with_retry_after(self):
+        request = self._request()
+        self.ext.request_reached_downloader(request, spider=None)
+        response = SimpleNamespace(status=429, headers={'Retry-After': b'30'})
+        self.ext.response_downloaded(response, request, spider=None)
+        assert self.slot.delay == 30.0
+        assert self.ext.domains['cdn.cloudfront.net']['backoffs'] == 1
+
+    def test_stats_report_rate(self):
+        request = self._request()
+        self.ext.request_reached_downloader(request, spider=None)
+        response = SimpleNamespace(status=200, headers={})
+        for _ in range(3):
+            self.ext.response_downloaded(response, request, spider=None)
+        self.ext.spider_closed(spider=None)
+
+        keys = {c.args[0] for c in self.crawler.stats.set_value.call_args_list}
+        assert 'politeness/cdn.cloudfront.net/responses' in keys
+        assert 'politeness/cdn.cloudfront.net/requests_per_minute' in keys
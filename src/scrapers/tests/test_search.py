@@ -0,0 +1,74 @@
+"""
+Unit Tests for exam search (src/search/)
+
+ASSUMPTIONS:
+1. Only the pure parts are covered: query parsing, tsquery building and
+   the in-memory PrefixIndex; the DB queries need a configured database.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.page_generator.template_generator import page_slug
+from src.search.prefix_index import PrefixIndex, normalize
+from src.search.queries import parse_query, prefix_tsquery
+
+ROWS = [
+    (1, 'ssc-cgl', 'SSC Combined Graduate Level'),
+    (2, 'ssc-chsl', 'SSC Combined Higher Secondary Level'),
+    (3, 'ibps-po', 'IBPS Probationary Officer'),
+    (4, 'sbi-po', 'SBI PO'),
+    (5, 'up-police-constable', 'UP Police Constable (Civil Police)'),
+]
+
+
+class TestParseQuery:
+    def test_year_and_page_type(self):
+        assert parse_query('SSC CGL 2026 Admit Card') == ('ssc cgl', 2026, 'admit_card')
+        assert parse_query('ibps po hall-ticket') == ('ibps po', None, 'admit_card')
+        assert parse_query('2025 result UPSC CSE') == ('upsc cse', 2025, 'result')
+
+    def test_plain_text(self):
+        assert parse_query('  SBI,  PO ') == ('sbi po', None, None)
+        assert parse_query('resultant') == ('resultant', None, None)
+
+    def test_tsquery_prefix_on_last_word(self):
+        assert prefix_tsquery('ssc cg') == 'ssc & cg:*'
+        assert prefix_tsquery("o'brien") == 'o & brien:*'
+        assert prefix_tsquery('') == ''
+
+
+class TestPageSlug:
+    def test_matches_generated_pages(self):
+        assert page_slug('ssc-cgl', 'admit_card', 2026) == 'ssc-cgl-2026-admit-card'
+        assert page_slug('ssc-cgl', 'syllabus', 2026) == 'ssc-cgl-syllabus'
+
+
+class TestPrefixIndex:
+    def test_name_prefix_ranks_first(self):
+        index = PrefixIndex(ROWS)
+        assert [s.slug for s in index.lookup('ssc comb')] == ['ssc-cgl', 'ssc-chsl']
+        assert [s.slug for s in index.lookup('po')] == ['sbi-po', 'ibps-po', 'up-police-constable']
+
+    def test_later_word_and_slug_match(self):
+        index = PrefixIndex(ROWS)
+        assert [s.exam_id for s in index.lookup('graduate')] == [1]
+        assert [s.exam_id for s in index.lookup('cgl')] == [1]
+        assert [s.exam_id for s in index.lookup('civil pol')] == [5]
+
+    def test_limit_and_empty(self):
+        index = PrefixIndex(ROWS)
+        assert len(index.lookup('s', limit=1)) == 1
+        assert index.lookup('?!') == []
+        assert index.lookup('zzz') == []
+
+    def test_one_suggestion_per_exam(self):
+        index = PrefixIndex(ROWS)
+        # "po" starts a word in both name and slug of sbi-po
+        assert index.count('po') > len(index.lookup('po'))
+
+    def test_normalize_keeps_unicode_letters(self):
+        assert normalize('UPSC–CSE (Prelims) 2026') == 'upsc cse prelims 2026'
+        assert normalize('पुलिस भर्ती') == 'पुलिस भर्ती'
@@ -0,0 +1,134 @@
+"""
+Unit Tests for sharded sitemaps (src/page_generator/sitemap.py)
+
+ASSUMPTIONS:
+1. The two DB queries (shard_signatures, shard_rows) are replaced with
+   in-memory pages via monkeypatch; no Django database is needed.
+"""
+
+import sys
+import os
+import gzip
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.page_generator import sitemap
+from src.page_generator.sitemap import generate_sitemaps, shard_name, write_shard
+
+SHARD = 10
+
+
+def _at(minute):
+    return datetime(2026, 6, 24, 10, minute, 30, 123456, tzinfo=timezone.utc)
+
+
+class _Pages:
+    """pk → (slug, canonical_url, updated_at), standing in for PageMetadata"""
+
+    def __init__(self, count):
+        self.rows = {pk: (f'page-{pk}', None, _at(0)) for pk in range(1, count + 1)}
+        self.queried = []
+
+    def signatures(self, shard_size):
+        shards = {}
+        for pk, (_, _, updated_at) in self.rows.items():
+            entry = shards.setdefault(pk // shard_size, {'count': 0, 'last_updated': None, 'pk_sum': 0})
+            entry['count'] += 1
+            entry['pk_sum'] += pk
+            entry['last_updated'] = max(entry['last_updated'] or '', updated_at.isoformat())
+        return shards
+
+    def shard(self, shard, shard_size):
+        self.queried.append(shard)
+        return [self.rows[pk] for pk in sorted(self.rows) if pk // shard_size == shard]
+
+
+def _install(monkeypatch, pages):
+    monkeypatch.setattr(sitemap, 'shard_signatures', pages.signatures)
+    monkeypatch.setattr(sitemap, 'shard_rows', pages.shard)
+
+
+def _urls(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return [line for line in f if line.startswith('<url>')]
+
+
+class TestWriteShard:
+    def test_escapes_and_prefers_canonical(self, tmp_path):
+        path = str(tmp_path / 'sitemap-00000.xml.gz')
+        count = write_shard(path, [('a&b', None, _at(1)), ('c', 'https://examforms.org/canonical', None)],
+                            'https://examforms.org')
+        urls = _urls(path)
+        assert count == 2
+        assert urls[0] == ('<url><loc>https://examforms.org/a&amp;b</loc>'
+                           '<lastmod>2026-06-24T10:01:30+00:00</lastmod></url>\n')
+        assert urls[1] == '<url><loc>https://examforms.org/canonical</loc></url>\n'
+
+    def test_output_is_deterministic(self, tmp_path):
+        rows = [('a', None, _at(1))]
+        write_shard(str(tmp_path / 'one.xml.gz'), rows, 'https://examforms.org')
+        write_shard(str(tmp_path / 'two.xml.gz'), rows, 'https://examforms.org')
+        assert (tmp_path / 'one.xml.gz').read_bytes() == (tmp_path / 'two.xml.gz').read_bytes()
+
+
+class TestGenerateSitemaps:
+    def test_first_run_writes_every_shard_and_index(self, tmp_path, monkeypatch):
+        pages = _Pages(25)
+        _install(monkeypatch, pages)
+        stats = generate_sitemaps(str(tmp_path), 'https://examforms.org/', shard_size=SHARD)
+        assert stats == {'shards': 3, 'shards_written': 3, 'shards_removed': 0, 'urls_written': 25}
+        index = (tmp_path / 'sitemap.xml').read_text()
+        assert index.count('<sitemap>') == 3
+        assert '<loc>https://examforms.org/sitemap-00002.xml.gz</loc>' in index
+        assert len(_urls(tmp_path / shard_name(0))) == 9  # pks 1-9
+
+    def test_only_changed_shards_are_rewritten(self, tmp_path, monkeypatch):
+        pages = _Pages(25)
+        _install(monkeypatch, pages)
+        generate_sitemaps(str(tmp_path), shard_size=SHARD)
+        pages.queried.clear()
+
+        assert generate_sitemaps(str(tmp_path), shard_size=SHARD)['shards_written'] == 0
+
+        pages.rows[15] = ('page-15', None, _at(5))  # edited
+        del pages.rows[3]                           # deleted
+        pages.rows[26] = ('page-26', None, _at(5))  # added
+        stats = generate_sitemaps(str(tmp_path), shard_size=SHARD)
+        assert sorted(pages.queried) == [0, 1, 2]
+        assert stats['shards_written'] == 3
+
+        pages.queried.clear()
+        pages.rows[12] = ('page-12', None, _at(9))
+        generate_sitemaps(str(tmp_path), shard_size=SHARD)
+        assert pages.queried == [1]
+        assert '2026-06-24T10:09:30+00:00' in (tmp_path / 'sitemap.xml').read_text()
+
+    def test_edit_within_same_second_is_rewritten(self, tmp_path, monkeypatch):
+        pages = _Pages(25)
+        _install(monkeypatch, pages)
+        generate_sitemaps(str(tmp_path), shard_size=SHARD)
+        pages.queried.clear()
+        pages.rows[15] = ('page-15', None, _at(0).replace(microsecond=654321))
+        assert generate_sitemaps(str(tmp_path), shard_size=SHARD)['shards_written'] == 1
+        assert pages.queried == [1]
+        assert '2026-06-24T10:00:30+00:00' in (tmp_path / 'sitemap.xml').read_text()
+
+    def test_empty_shard_is_removed(self, tmp_path, monkeypatch):
+        pages = _Pages(25)
+        _install(monkeypatch, pages)
+        generate_sitemaps(str(tmp_path), shard_size=SHARD)
+        for pk in range(20, 26):
+            del pages.rows[pk]
+        stats = generate_sitemaps(str(tmp_path), shard_size=SHARD)
+        assert stats['shards_removed'] == 1
+        assert not (tmp_path / shard_name(2)).exists()
+        assert shard_name(2) not in (tmp_path / 'sitemap.xml').read_text()
+
+    def test_missing_file_or_new_base_url_rewrites(self, tmp_path, monkeypatch):
+        pages = _Pages(25)
+        _install(monkeypatch, pages)
+        generate_sitemaps(str(tmp_path), shard_size=SHARD)
+        (tmp_path / shard_name(1)).unlink()
+        assert generate_sitemaps(str(tmp_path), shard_size=SHARD)['shards_written'] == 1
+        assert generate_sitemaps(str(tmp_path), 'https://examforms.in', shard_size=SHARD)['shards_written'] == 3
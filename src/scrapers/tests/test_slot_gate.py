@@ -0,0 +1,97 @@
+"""
+Unit Tests for SlotGate (per-domain politeness outside the downloader)
+
+ASSUMPTIONS:
+1. Time is a twisted task.Clock and the downloader and its slots are
+   fakes with the attributes SlotGate reads, so no reactor or network
+   is needed.
+"""
+
+import sys
+import os
+
+from twisted.internet import defer, task
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pipelines.slot_gate import SlotGate
+
+
+class _Slot:
+    def __init__(self, concurrency, delay, lastseen=0.0):
+        self.concurrency = concurrency
+        self.delay = delay
+        self.lastseen = lastseen
+
+    def download_delay(self):
+        return self.delay
+
+
+class _Downloader:
+    def __init__(self, **slots):
+        self.slots = slots
+
+
+def _gate(clock, **kwargs):
+    return SlotGate(clock=clock, now=clock.seconds, **kwargs)
+
+
+class _Fetches:
+    """Records start times; each fetch stays in flight until finish()"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.started = []
+        self.pending = []
+
+    def __call__(self, name):
+        self.started.append((name, self.clock.seconds()))
+        dfd = defer.Deferred()
+        self.pending.append(dfd)
+        return dfd
+
+    def finish(self):
+        self.pending.pop(0).callback(None)
+
+
+class TestSlotGate:
+    def test_slot_delay_spaces_fetches_and_moves_lastseen(self):
+        clock = task.Clock()
+        clock.advance(100)
+        slot = _Slot(concurrency=2, delay=5.0, lastseen=98.0)
+        fetches = _Fetches(clock)
+        gate = _gate(clock, downloader=_Downloader(**{'upsc.gov.in': slot}))
+
+        gate.run('https://upsc.gov.in/a.pdf', fetches, 'a')
+        gate.run('https://upsc.gov.in/b.pdf', fetches, 'b')
+        assert fetches.started == []
+        clock.advance(3)
+        assert fetches.started == [('a', 103.0)]
+        assert slot.lastseen == 103.0
+        clock.advance(5)
+        assert fetches.started == [('a', 103.0), ('b', 108.0)]
+
+    def test_concurrency_limited_per_domain(self):
+        clock = task.Clock()
+        fetches = _Fetches(clock)
+        gate = _gate(clock, default_concurrency=1)
+
+        gate.run('https://ssc.nic.in/a.pdf', fetches, 'a')
+        gate.run('https://ssc.nic.in/b.pdf', fetches, 'b')
+        gate.run('https://rrb.gov.in/c.pdf', fetches, 'c')
+        assert [name for name, _ in fetches.started] == ['a', 'c']
+        fetches.finish()
+        assert [name for name, _ in fetches.started] == ['a', 'c', 'b']
+
+    def test_failure_releases_token(self):
+        clock = task.Clock()
+        gate = _gate(clock, default_concurrency=1)
+        failures = []
+
+        def boom():
+            raise RuntimeError('connection reset')
+
+        gate.run('https://ssc.nic.in/a.pdf', boom).addErrback(failures.append)
+        done = gate.run('https://ssc.nic.in/b.pdf', lambda: 'ok')
+        assert failures and failures[0].check(RuntimeError)
+        assert done.result == 'ok'
@@ -0,0 +1,44 @@
+"""
+Unit Tests for lazy startup (settings, tasks, spiders)
+
+ASSUMPTIONS:
+1. Each check runs in a fresh interpreter (sys.modules is process-global).
+2. Tests run from any cwd; project root is derived from this file.
+"""
+
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+SCRAPERS_DIR = os.path.join(PROJECT_ROOT, 'src', 'scrapers')
+
+
+def _loaded_after_import(module):
+    code = (
+        f"import sys; sys.path.insert(0, {PROJECT_ROOT!r}); sys.path.insert(0, {SCRAPERS_DIR!r}); "
+        f"import {module}; print('\\n'.join(sys.modules))"
+    )
+    proc = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    return set(proc.stdout.split())
+
+
+class TestLazyStartup:
+    def test_settings_does_not_import_django_or_scrapy(self):
+        loaded = _loaded_after_import('src.scrapers.settings')
+        assert 'django' not in loaded
+        assert 'scrapy' not in loaded
+
+    def test_settings_does_not_mutate_sys_path(self):
+        code = (
+            f"import sys; sys.path.insert(0, {PROJECT_ROOT!r}); before = list(sys.path); "
+            f"import src.scrapers.settings; print(before == sys.path)"
+        )
+        proc = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, capture_output=True, text=True)
+        assert proc.stdout.strip() == 'True'
+
+    def test_spider_import_defers_dateutil_and_orm(self):
+        loaded = _loaded_after_import('upsc_scraper_complete')
+        assert 'dateutil.parser' not in loaded
+        assert 'core_admin.models' not in loaded
@@ -0,0 +1,70 @@
+"""
+Unit Tests for AI input windowing
+
+ASSUMPTIONS:
+1. Token counts are the ~4 chars/token estimate, not a real tokenizer.
+"""
+
+import sys
+import os
+
+from scrapy.http import HtmlResponse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.utils.ai_parser import AIParser
+from src.utils.text_window import estimate_tokens, html_text_blocks, score_block, select_window, split_blocks
+
+NAV = "\n".join(f"Menu item {i} | Home | About us | Contact | Gallery | Tenders | RTI" for i in range(40))
+DATES = "Last date for receipt of applications: 05/07/2026\nExamination date: 14/09/2026"
+
+
+class TestScoring:
+    def test_dates_outscore_navigation(self):
+        assert score_block("Last date for receipt of applications: 05/07/2026") > score_block("Home | About us | Contact")
+
+    def test_duplicates_removed(self):
+        assert split_blocks("Home\nNotice\nHome") == ['Home', 'Notice']
+
+
+class TestSelectWindow:
+    def test_under_budget_returned_whole(self):
+        window = select_window("SSC   CGL\n2026", 100)
+        assert window.text == "SSC CGL 2026"
+        assert window.tokens_saved == 0
+
+    def test_dates_survive_past_the_cut(self):
+        # Naive truncation at the budget would only ever see the menu
+        text = f"SSC Combined Graduate Level Examination 2026\n{NAV}\n{DATES}"
+        window = select_window(text, 100)
+        assert "05/07/2026" in window.text
+        assert "14/09/2026" in window.text
+        assert window.tokens <= 100
+        assert window.tokens_saved > 0
+
+    def test_document_order_kept(self):
+        window = select_window(f"{NAV}\n{DATES}", 60)
+        assert window.text.index("05/07/2026") < window.text.index("14/09/2026")
+
+    def test_oversized_block_truncated(self):
+        window = select_window("1 2 3 " * 500, 50)
+        assert estimate_tokens(window.text) <= 50
+
+
+class TestHtmlBlocks:
+    def test_inline_markup_stays_in_block(self):
+        html = (b"<html><body><script>var x = 1;</script><ul><li>Home</li><li>About</li></ul>"
+                b"<p>Last date: <b>05/07/2026</b> (till 6 PM)</p>"
+                b"<table><tr><td>Opening date</td><td>24/06/2026</td></tr></table></body></html>")
+        response = HtmlResponse(url='https://ssc.nic.in/', body=html, encoding='utf-8')
+        assert html_text_blocks(response).split('\n') == [
+            'Home', 'About', 'Last date: 05/07/2026 (till 6 PM)', 'Opening date 24/06/2026',
+        ]
+
+
+class TestParserSavings:
+    def test_savings_recorded_per_request(self):
+        parser = AIParser(provider='local', max_input_tokens=100)
+        parser.parse_notification(f"{NAV}\n{DATES}")
+        assert parser.stats['input_tokens_sent'] <= 100
+        assert parser.stats['input_tokens_raw'] > parser.stats['input_tokens_sent']
@@ -156,6 +156,9 @@ class UPSCScraper(BaseExamScraper):
             data = self._extract_notification_data(notification, response)
             
             if data:
+                # Incremental mode: rows are newest-first, stop at first seen
+                if self.listing_row_seen(response.url, data['exam_name'], data.get('pdf_link')):
+                    break
                 # Use base class safe wrapper
                 result = self.safe_parse_notification(response, **data)
                 if result:
@@ -252,6 +255,8 @@ class UPSCScraper(BaseExamScraper):
         for item in items:
             data = self._extract_admit_card_data(item, response)
             if data:
+                if self.listing_row_seen(response.url, data['exam_name'], data.get('download_link')):
+                    break
                 result = self.safe_parse_admit_card(response, **data)
                 if result:
                     yield result
@@ -366,6 +371,8 @@ class UPSCScraper(BaseExamScraper):
         for item in items:
             data = self._extract_result_data(item, response)
             if data:
+                if self.listing_row_seen(response.url, data['exam_name'], data.get('result_link')):
+                    break
                 result = self.safe_parse_result(response, **data)
                 if result:
                     yield result
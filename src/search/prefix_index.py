@@ -0,0 +1,139 @@
+"""
+In-memory prefix index over exam names and slugs (typeahead)
+
+A word-level suffix array: every word start of every exam's normalized
+name/slug is one entry, entries are sorted by the text from that word on,
+and a lookup is a binary search plus a short forward scan. "cgl" finds
+"SSC CGL" and "ssc cg" finds "SSC CGL 2026" without a DB round trip.
+
+ASSUMPTIONS:
+- Built once per process from (exam_id, slug, name) rows and replaced
+  wholesale when stale (see queries.typeahead); never mutated in place
+- Query text is normalized the same way as indexed text (normalize())
+
+CONDITIONS:
+- Compact: entries are parallel array('I'/'H') columns pointing into the
+  list of normalized texts; no per-suffix strings are kept (about 5 MB of
+  entries for 100k exams)
+- Lookups are two binary searches (comparing only len(prefix)
+  characters per probe) for the matching range, then at most `max_scan`
+  entries of it are ranked, so cost does not grow with the number of
+  matches
+- Ranking: match at an earlier word first (prefix of the name beats
+  prefix of a later word), then shorter names, then alphabetical
+
+FAILURE MODES:
+- Very short prefixes ("s") match more exams than max_scan; only the
+  alphabetically first candidates are ranked
+- Empty or punctuation-only query → no suggestions
+"""
+
+import heapq
+import re
+from array import array
+from typing import Iterable, List, NamedTuple, Tuple
+
+# Not word characters; Indic blocks are kept whole because their vowel
+# signs are combining marks, which \w does not match (dandas excepted)
+_SEPARATORS_RE = re.compile(r'(?:[^\w\u0900-\u0963\u0966-\u0DFF]|_)+')
+
+
+class Suggestion(NamedTuple):
+    exam_id: int
+    slug: str
+    name: str
+
+
+def normalize(text: str) -> str:
+    """Lowercase, punctuation/hyphens to single spaces (Unicode letters kept)"""
+    return _SEPARATORS_RE.sub(' ', text.lower()).strip()
+
+
+class PrefixIndex:
+    """
+    Typeahead over exams: PrefixIndex(rows).lookup('ssc cg')
+
+    `rows` yields (exam_id, slug, name).
+    """
+
+    def __init__(self, rows: Iterable[Tuple[int, str, str]]):
+        self.exam_ids = array('q')
+        self.slugs: List[str] = []
+        self.names: List[str] = []
+        self.texts: List[str] = []
+        text_exam = array('I')      # text → exam position
+        entry_text = array('I')     # entry → text
+        entry_offset = array('H')   # entry → character offset of the word
+        entry_word = array('H')     # entry → word number (ranking)
+
+        for exam_id, slug, name in rows:
+            position = len(self.exam_ids)
+            self.exam_ids.append(exam_id)
+            self.slugs.append(slug)
+            self.names.append(name)
+            for text in dict.fromkeys(normalize(source) for source in (name, slug.replace('-', ' '))):
+                if not text:
+                    continue
+                text_index = len(self.texts)
+                self.texts.append(text)
+                text_exam.append(position)
+                offset = 0
+                for word, token in enumerate(text.split(' ')):
+                    entry_text.append(text_index)
+                    entry_offset.append(min(offset, 0xFFFF))
+                    entry_word.append(min(word, 0xFFFF))
+                    offset += len(token) + 1
+
+        texts = self.texts
+        order = sorted(range(len(entry_text)), key=lambda j: texts[entry_text[j]][entry_offset[j]:])
+        self._text_exam = text_exam
+        self._text = array('I', (entry_text[j] for j in order))
+        self._offset = array('H', (entry_offset[j] for j in order))
+        self._word = array('H', (entry_word[j] for j in order))
+
+    def __len__(self) -> int:
+        return len(self.exam_ids)
+
+    def _bounds(self, prefix: str) -> Tuple[int, int]:
+        """Entries [lo, hi) whose text (from their word on) starts with prefix"""
+        texts, text, offset, size = self.texts, self._text, self._offset, len(prefix)
+        lo, hi = 0, len(text)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = offset[mid]
+            if texts[text[mid]][start:start + size] < prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+        first, hi = lo, len(text)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = offset[mid]
+            if texts[text[mid]][start:start + size] <= prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def count(self, query: str) -> int:
+        """Number of index entries matching `query` (word starts, not exams)"""
+        lo, hi = self._bounds(normalize(query))
+        return hi - lo
+
+    def lookup(self, query: str, limit: int = 10, max_scan: int = 256) -> List[Suggestion]:
+        """Exams with a word (or word run) starting with `query`, best first"""
+        prefix = normalize(query)
+        if not prefix or limit <= 0:
+            return []
+        lo, hi = self._bounds(prefix)
+        hi = min(hi, lo + max_scan)
+        text_exam = self._text_exam
+        best = {}
+        for text, word in zip(self._text[lo:hi], self._word[lo:hi]):
+            exam = text_exam[text]
+            if word < best.get(exam, 0xFFFF + 1):
+                best[exam] = word
+
+        names = self.names
+        ranked = heapq.nsmallest(limit, best, key=lambda exam: (best[exam], len(names[exam]), names[exam]))
+        return [Suggestion(self.exam_ids[exam], self.slugs[exam], names[exam]) for exam in ranked]
@@ -0,0 +1,242 @@
+"""
+Exam/event search: "ssc cgl 2026 admit card" → exams and their pages
+
+parse_query() splits a visitor's query into exam text, a year and a page
+type; the exam text is matched by PostgreSQL full-text search (prefix
+match on the last word), topped up with trigram similarity for typos,
+and events are then filtered by year/type. typeahead() answers from an
+in-memory PrefixIndex without touching the DB per keystroke.
+
+ASSUMPTIONS:
+- Django is set up; models are imported lazily
+- On PostgreSQL, migration 0004 created the indexes used here:
+  exams_search_fts_gin (GIN over EXAM_DOCUMENT_SQL) and
+  exams_name_trgm_gin (pg_trgm GIN on name)
+
+CONDITIONS:
+- Full-text queries use the 'simple' configuration (exam names are
+  acronyms and proper nouns; stemming would only hurt) and the exact
+  expression of the index, so the planner can use it
+- Other databases (SQLite in development) fall back to icontains on
+  name/slug/organization for every word
+- The prefix index is rebuilt from one values_list() query when older
+  than TYPEAHEAD_MAX_AGE seconds
+
+FAILURE MODES:
+- Query with only a year/page type → no exam text, no results
+- Trigram similarity below pg_trgm.similarity_threshold (0.3) → no match
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from src.page_generator.template_generator import page_slug
+from src.search.prefix_index import PrefixIndex, Suggestion, normalize
+
+# Must stay identical to the expression indexed in migration 0004
+EXAM_DOCUMENT_SQL = (
+    "to_tsvector('simple', coalesce(exams.name, '') || ' ' || coalesce(exams.organization, '') "
+    "|| ' ' || replace(exams.slug, '-', ' '))"
+)
+TYPEAHEAD_MAX_AGE = 300
+
+# Phrases (normalized) → page type; longest phrases are matched first
+PAGE_TYPE_PHRASES = {
+    'admit card': 'admit_card',
+    'hall ticket': 'admit_card',
+    'call letter': 'admit_card',
+    'answer key': 'answer_key',
+    'result': 'result',
+    'results': 'result',
+    'merit list': 'result',
+    'cutoff': 'result',
+    'cut off': 'result',
+    'notification': 'notification',
+    'recruitment': 'notification',
+    'apply online': 'notification',
+    'syllabus': 'syllabus',
+    'exam pattern': 'syllabus',
+}
+_PAGE_TYPE_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(phrase) for phrase in sorted(PAGE_TYPE_PHRASES, key=len, reverse=True)) + r')\b'
+)
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+
+
+class ParsedQuery(NamedTuple):
+    text: str
+    year: Optional[int]
+    page_type: Optional[str]
+
+
+def parse_query(query: str) -> ParsedQuery:
+    """'SSC CGL 2026 Admit Card' → ParsedQuery('ssc cgl', 2026, 'admit_card')"""
+    text = normalize(query)
+    page_type = None
+    match = _PAGE_TYPE_RE.search(text)
+    if match:
+        page_type = PAGE_TYPE_PHRASES[match.group(1)]
+        text = text[:match.start()] + text[match.end():]
+    year = None
+    match = _YEAR_RE.search(text)
+    if match:
+        year = int(match.group(1))
+        text = text[:match.start()] + text[match.end():]
+    return ParsedQuery(' '.join(text.split()), year, page_type)
+
+
+def prefix_tsquery(text: str) -> str:
+    """to_tsquery() input: every word required, the last one as a prefix"""
+    words = normalize(text).split()
+    if not words:
+        return ''
+    return ' & '.join(words[:-1] + [words[-1] + ':*'])
+
+
+# ============================================================================
+# EXAM MATCHING
+# ============================================================================
+
+def match_exams(text: str, limit: int = 20) -> List[Dict[str, Any]]:
+    """Exams (id, slug, name, organization) matching `text`, best first"""
+    from django.db import connection
+
+    if not text:
+        return []
+    if connection.vendor == 'postgresql':
+        return _match_exams_postgres(connection, text, limit)
+    return _match_exams_fallback(text, limit)
+
+
+def _match_exams_postgres(connection, text: str, limit: int) -> List[Dict[str, Any]]:
+    tsquery = prefix_tsquery(text)
+    columns = ('id', 'slug', 'name', 'organization')
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT id, slug, name, organization FROM exams "
+            f"WHERE is_active AND {EXAM_DOCUMENT_SQL} @@ to_tsquery('simple', %s) "
+            f"ORDER BY ts_rank({EXAM_DOCUMENT_SQL}, to_tsquery('simple', %s)) DESC, length(name), id "
+            f"LIMIT %s",
+            [tsquery, tsquery, limit],
+        )
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        if len(rows) < limit:
+            # Typos ("ssc cgi"): nearest names by trigram similarity
+            cursor.execute(
+                "SELECT id, slug, name, organization FROM exams "
+                "WHERE is_active AND name %% %s AND NOT (id = ANY(%s)) "
+                "ORDER BY similarity(name, %s) DESC, id LIMIT %s",
+                [text, [row['id'] for row in rows], text, limit - len(rows)],
+            )
+            rows.extend(dict(zip(columns, row)) for row in cursor.fetchall())
+    return rows
+
+
+def _match_exams_fallback(text: str, limit: int) -> List[Dict[str, Any]]:
+    from django.db.models import Q
+    from core_admin.models import Exam
+
+    queryset = Exam.objects.filter(is_active=True)
+    for word in normalize(text).split():
+        queryset = queryset.filter(Q(name__icontains=word) | Q(slug__icontains=word)
+                                   | Q(organization__icontains=word))
+    return list(queryset.order_by('name', 'pk').values('id', 'slug', 'name', 'organization')[:limit])
+
+
+# ============================================================================
+# SEARCH
+# ============================================================================
+
+def search(query: str, limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Search results for a visitor query: one hit per matching page
+
+    Each hit has exam_id, exam slug/name/organization, page_type, year
+    and page_slug. With a year or page type in the query only matching
+    events are returned; otherwise every event page of each exam (newest
+    year first) plus its syllabus page.
+    """
+    from core_admin.models import ExamEvent
+
+    parsed = parse_query(query)
+    exams = match_exams(parsed.text, limit)
+    if not exams:
+        return []
+
+    if parsed.page_type == 'syllabus':
+        return [_hit(exam, 'syllabus', None) for exam in exams]
+
+    events = ExamEvent.objects.filter(exam_id__in=[exam['id'] for exam in exams])
+    if parsed.year is not None:
+        events = events.filter(year=parsed.year)
+    if parsed.page_type is not None:
+        events = events.filter(event_type=parsed.page_type)
+    by_exam: Dict[int, List] = {}
+    for exam_id, event_type, year in events.order_by('-year', 'event_type').values_list(
+            'exam_id', 'event_type', 'year'):
+        by_exam.setdefault(exam_id, []).append((event_type, year))
+
+    hits = []
+    for exam in exams:
+        for event_type, year in by_exam.get(exam['id'], ()):
+            if event_type in ('notification', 'admit_card', 'result', 'answer_key'):
+                hits.append(_hit(exam, event_type, year))
+        if parsed.year is None and parsed.page_type is None:
+            hits.append(_hit(exam, 'syllabus', None))
+        if len(hits) >= limit:
+            break
+    return hits[:limit]
+
+
+def _hit(exam: Dict[str, Any], page_type: str, year: Optional[int]) -> Dict[str, Any]:
+    return {
+        'exam_id': exam['id'],
+        'exam_slug': exam['slug'],
+        'exam_name': exam['name'],
+        'organization': exam['organization'],
+        'page_type': page_type,
+        'year': year,
+        'page_slug': page_slug(exam['slug'], page_type, year),
+    }
+
+
+# ============================================================================
+# TYPEAHEAD
+# ============================================================================
+
+_index: Optional[PrefixIndex] = None
+_index_built_at = 0.0
+_index_lock = threading.Lock()
+
+
+def prefix_index(max_age: float = TYPEAHEAD_MAX_AGE) -> PrefixIndex:
+    """Process-wide PrefixIndex of active exams, rebuilt when older than max_age"""
+    global _index, _index_built_at
+    if _index is None or time.monotonic() - _index_built_at > max_age:
+        with _index_lock:
+            if _index is None or time.monotonic() - _index_built_at > max_age:
+                from core_admin.models import Exam
+
+                rows = Exam.objects.filter(is_active=True).values_list('pk', 'slug', 'name')
+                _index = PrefixIndex(rows.iterator(chunk_size=5000))
+                _index_built_at = time.monotonic()
+    return _index
+
+
+def typeahead(query: str, limit: int = 10) -> List[Suggestion]:
+    """
+    Exam suggestions for a partial query
+
+    Year and page-type words are dropped; if nothing matches, trailing
+    words are dropped one at a time ("ssc cgl 2026 adm" → "ssc cgl").
+    """
+    index = prefix_index()
+    words = parse_query(query).text.split()
+    while words:
+        suggestions = index.lookup(' '.join(words), limit=limit)
+        if suggestions:
+            return suggestions
+        words.pop()
+    return []
@@ -1,58 +1,33 @@
 import os
+import time
+import hashlib
 import logging
 import json
+import sqlite3
+import threading
 from datetime import datetime
+from typing import List, Optional
 
-class AIParser:
-    """
-    Parser that uses LLMs (OpenAI/Gemini) to extract structured data from unstructured text/HTML.
-    """
-    
-    def __init__(self, provider="openai", model="gpt-4o"):
-        self.logger = logging.getLogger(self.__class__.__name__)
-        self.provider = provider
-        self.model = model
-        self.client = None
-        self.api_key = None
-
-        self._setup_client()
-
-    def _setup_client(self):
-        """Initialize the AI client"""
-        if self.provider == "openai":
-            self.api_key = os.getenv("OPENAI_API_KEY")
-            if self.api_key:
-                try:
-                    from openai import OpenAI
-                    self.client = OpenAI(api_key=self.api_key)
-                except ImportError:
-                    self.logger.warning("openai package not installed. AI parsing disabled.")
-            else:
-                self.logger.warning("OPENAI_API_KEY not found. AI parsing disabled.")
-        
-        elif self.provider == "gemini":
-            self.api_key = os.getenv("GOOGLE_API_KEY")
-            if self.api_key:
-                try:
-                    import google.generativeai as genai
-                    genai.configure(api_key=self.api_key)
-                    self.client = genai.GenerativeModel('gemini-1.5-pro')
-                except ImportError:
-                    self.logger.warning("google-generativeai package not installed. AI parsing disabled.")
-            else:
-                 self.logger.warning("GOOGLE_API_KEY not found. AI parsing disabled.")
+from src.utils.ai_providers import create_provider
+from src.utils.text_window import Window, select_window
 
-    def parse_notification(self, text_content: str) -> dict:
-        """
-        Extract Exam Notification details from text using LLM.
-        """
-        if not self.client:
-            return None
+# Bump when the prompt or expected fields change: cached responses from an
+# older prompt are then ignored instead of served
+PROMPT_VERSION = 'notification-v1'
 
-        prompt = f"""
-        Extract the following details from the text below in valid JSON format.
-        If a field is not found, use null.
-        
+# Input budget for a single page (estimated tokens, see text_window)
+MAX_INPUT_TOKENS = 1000
+
+# USD per 1M tokens: (input, output). Unknown models are counted as 0 cost.
+MODEL_PRICING = {
+    'gpt-4o': (2.50, 10.00),
+    'gpt-4o-mini': (0.15, 0.60),
+    'gemini-1.5-pro': (1.25, 5.00),
+    'gemini-1.5-flash': (0.075, 0.30),
+    'local-rules': (0.0, 0.0),
+}
+
+NOTIFICATION_FIELDS = """
         Fields:
         - exam_name (string)
         - organization (string)
@@ -62,30 +37,273 @@ class AIParser:
         - exam_date (YYYY-MM-DD or null)
         - total_vacancies (integer or null)
         - official_link (string or null)
-        
+"""
+
+SYSTEM_PROMPT = "You are a helpful assistant that extracts structured data from exam notifications."
+
+
+def clean_input(text_content: str, max_tokens: int = MAX_INPUT_TOKENS) -> str:
+    """Whitespace-normalized, windowed text: what is sent and what is cached"""
+    return select_window(text_content, max_tokens).text
+
+
+def build_prompt(cleaned: str) -> str:
+    return f"""
+        Extract the following details from the text below in valid JSON format.
+        If a field is not found, use null.
+        {NOTIFICATION_FIELDS}
         Text Content:
-        {text_content[:4000]}  # Limit context window
+        {cleaned}
         """
 
-        try:
-            if self.provider == "openai":
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful assistant that extracts structured data from exam notifications."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    response_format={"type": "json_object"}
-                )
-                content = response.choices[0].message.content
-                return json.loads(content)
-            
-            elif self.provider == "gemini":
-                response = self.client.generate_content(prompt)
-                # Naive JSON extraction for Gemini (it sometimes wraps in markdown)
-                content = response.text.replace('```json', '').replace('```', '').strip()
-                return json.loads(content)
 
+def build_batch_prompt(cleaned_texts: List[str]) -> str:
+    documents = "\n".join(f"--- Document {i} ---\n{text}" for i, text in enumerate(cleaned_texts))
+    return f"""
+        Each document below is a separate exam notification. For each one,
+        extract the following details. If a field is not found, use null.
+        {NOTIFICATION_FIELDS}
+        Reply with a JSON object {{"results": [...]}} holding exactly
+        {len(cleaned_texts)} objects, in document order.
+
+        {documents}
+        """
+
+
+class AIResponseCache:
+    """
+    Persistent cache of parsed AI responses (SQLite)
+
+    Key: sha256(provider | model | PROMPT_VERSION | cleaned input). Only
+    successful parses are stored; failures are retried next time.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Shared by the reactor thread and AI queue worker threads
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " result TEXT NOT NULL,"
+            " created_at INTEGER NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, cleaned: str) -> str:
+        raw = f"{provider}|{model}|{PROMPT_VERSION}|{cleaned}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self.conn.execute("SELECT result FROM responses WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, result: dict):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, result, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(result), int(time.time())),
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+class AIParser:
+    """
+    Parser that uses LLMs (OpenAI/Gemini, see ai_providers) to extract structured data from unstructured text/HTML.
+
+    Create one per spider (client setup is not free) and pass cache_path to
+    reuse answers across pages and runs. Counters in self.stats:
+    requests, cache_hits, errors, prompt_tokens, completion_tokens,
+    cost_usd, latency_ms, input_tokens_raw, input_tokens_sent.
+
+    Page text is cut to max_input_tokens by text_window.select_window()
+    (highest-scoring blocks, not the first N characters); input_tokens_raw
+    minus input_tokens_sent is what that saved on requests actually sent.
+
+    parse_notification() may be called from several threads at once (the
+    AI queue's worker pool); cache and counters are lock-protected.
+    """
+
+    # Largest number of pages sent in one batched request
+    MAX_BATCH_SIZE = 5
+
+    def __init__(self, provider="openai", model=None, cache_path=None, provider_options=None,
+                 max_input_tokens=MAX_INPUT_TOKENS):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.provider = provider
+        self.max_input_tokens = max_input_tokens
+        self.backend = create_provider(provider, model, **(provider_options or {}))
+        self.model = self.backend.model
+        self.cache = AIResponseCache(cache_path) if cache_path else None
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'cache_hits': 0,
+            'errors': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'cost_usd': 0.0,
+            'latency_ms': 0.0,
+            'input_tokens_raw': 0,
+            'input_tokens_sent': 0,
+        }
+
+    @property
+    def client(self):
+        """Provider client, None when the provider is unavailable"""
+        return self.backend.client
+
+    @property
+    def supports_batch(self) -> bool:
+        return self.backend.supports_batch
+
+    def cached(self, text_content: str) -> Optional[dict]:
+        """Cached result for this page, without calling the provider"""
+        return self._cache_get(self._cache_key(self._window(text_content).text))
+
+    def parse_notification(self, text_content: str) -> dict:
+        """
+        Extract Exam Notification details from text using LLM.
+        """
+        window = self._window(text_content)
+        key = self._cache_key(window.text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        if not self.client:
+            return None
+
+        self._record_window(window)
+        try:
+            data = self._complete(build_prompt(window.text))
         except Exception as e:
+            self._count('errors')
             self.logger.error(f"AI Parsing failed: {e}")
             return None
+
+        if isinstance(data, dict):
+            self._cache_put(key, data)
+            return data
+        return None
+
+    def parse_notifications_batch(self, texts: List[str]) -> List[Optional[dict]]:
+        """
+        Parse several pages, sending cache misses in groups of MAX_BATCH_SIZE
+
+        Returns results in input order. A batch whose reply does not line up
+        with its inputs is retried page by page.
+        """
+        windows = [self._window(text) for text in texts]
+        cleaned = [window.text for window in windows]
+        keys = [self._cache_key(text) for text in cleaned]
+        results = [self._cache_get(key) for key in keys]
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending or not self.client:
+            return results
+
+        if not self.supports_batch:
+            for i in pending:
+                results[i] = self.parse_notification(texts[i])
+            return results
+
+        for start in range(0, len(pending), self.MAX_BATCH_SIZE):
+            group = pending[start:start + self.MAX_BATCH_SIZE]
+            for i in group:
+                self._record_window(windows[i])
+            try:
+                reply = self._complete(build_batch_prompt([cleaned[i] for i in group]))
+                batch = reply.get('results') if isinstance(reply, dict) else None
+            except Exception as e:
+                self._count('errors')
+                self.logger.error(f"AI batch parsing failed: {e}")
+                batch = None
+
+            if not isinstance(batch, list) or len(batch) != len(group):
+                self.logger.warning("AI batch reply did not match inputs, parsing pages individually")
+                for i in group:
+                    results[i] = self.parse_notification(texts[i])
+                continue
+
+            for i, data in zip(group, batch):
+                if isinstance(data, dict):
+                    self._cache_put(keys[i], data)
+                    results[i] = data
+        return results
+
+    # ========================================================================
+    # INPUT WINDOWING
+    # ========================================================================
+
+    def _window(self, text_content: str) -> Window:
+        return select_window(text_content, self.max_input_tokens)
+
+    def _record_window(self, window: Window):
+        """Count input tokens for a page about to be sent"""
+        self._count('input_tokens_raw', window.raw_tokens)
+        self._count('input_tokens_sent', window.tokens)
+        if window.tokens_saved:
+            self.logger.debug(
+                f"AI input windowed: {window.blocks_kept}/{window.blocks_total} blocks, "
+                f"~{window.tokens}/{window.raw_tokens} tokens ({window.tokens_saved} saved)"
+            )
+
+    # ========================================================================
+    # PROVIDER CALLS
+    # ========================================================================
+
+    def _complete(self, prompt: str) -> dict:
+        """Send one prompt, record usage/latency, return the parsed JSON reply"""
+        started = time.perf_counter()
+        self._count('requests')
+        try:
+            content, prompt_tokens, completion_tokens = self.backend.complete(prompt, SYSTEM_PROMPT)
+            self._record_usage(prompt_tokens, completion_tokens)
+            return json.loads(content)
+        finally:
+            self._count('latency_ms', (time.perf_counter() - started) * 1000)
+
+    def _record_usage(self, prompt_tokens, completion_tokens):
+        prompt_tokens, completion_tokens = prompt_tokens or 0, completion_tokens or 0
+        input_price, output_price = MODEL_PRICING.get(self.model, (0.0, 0.0))
+        self._count('prompt_tokens', prompt_tokens)
+        self._count('completion_tokens', completion_tokens)
+        self._count('cost_usd', (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000)
+
+    def _count(self, key: str, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    # ========================================================================
+    # CACHE
+    # ========================================================================
+
+    def _cache_key(self, cleaned: str) -> str:
+        return AIResponseCache.make_key(self.provider, self.model, cleaned)
+
+    def _cache_get(self, key: str) -> Optional[dict]:
+        if self.cache is None:
+            return None
+        data = self.cache.get(key)
+        if data is not None:
+            self._count('cache_hits')
+        return data
+
+    def _cache_put(self, key: str, data: dict):
+        if self.cache is not None:
+            self.cache.put(key, data)
+
+    def close(self):
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
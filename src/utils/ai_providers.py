@@ -0,0 +1,225 @@
+"""
+Pluggable LLM backends for AIParser
+
+Each provider turns one prompt into a JSON string plus token usage. AIParser
+owns prompts, caching, batching and stats; providers only talk to a model.
+
+PROVIDERS (AI_PROVIDER setting):
+- openai  → OpenAI chat completions (OPENAI_API_KEY; OPENAI_BASE_URL points
+            it at any OpenAI-compatible server, e.g. a model on localhost)
+- gemini  → Google Gemini (GOOGLE_API_KEY)
+- local   → LocalProvider: deterministic rule-based stand-in, no network,
+            configurable latency and failure rate (AI_PROVIDER_OPTIONS)
+- dotted path to an AIProvider subclass for anything else
+
+FAILURE MODES:
+- Missing package / API key → provider.available is False, AI parsing off
+- Provider error → exception propagates to AIParser (counted in stats)
+"""
+
+import importlib
+import json
+import logging
+import os
+import random
+import re
+import time
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (content, prompt_tokens, completion_tokens)
+Completion = Tuple[str, int, int]
+
+
+class AIProvider:
+    """Base class: set self.client in __init__ when the backend is usable"""
+
+    name = 'base'
+    default_model = None
+    supports_batch = False
+
+    def __init__(self, model: Optional[str] = None, **options):
+        self.model = model or self.default_model
+        self.options = options
+        self.client = None
+
+    @property
+    def available(self) -> bool:
+        return self.client is not None
+
+    def complete(self, prompt: str, system_prompt: str) -> Completion:
+        raise NotImplementedError
+
+
+class OpenAIProvider(AIProvider):
+    name = 'openai'
+    default_model = 'gpt-4o'
+    supports_batch = True
+
+    def __init__(self, model=None, **options):
+        super().__init__(model, **options)
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            logger.warning("OPENAI_API_KEY not found. AI parsing disabled.")
+            return
+        try:
+            from openai import OpenAI
+        except ImportError:
+            logger.warning("openai package not installed. AI parsing disabled.")
+            return
+        self.client = OpenAI(api_key=api_key, base_url=options.get('base_url') or os.getenv("OPENAI_BASE_URL"))
+
+    def complete(self, prompt, system_prompt):
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"}
+        )
+        usage = getattr(response, 'usage', None)
+        return (
+            response.choices[0].message.content,
+            getattr(usage, 'prompt_tokens', 0) or 0,
+            getattr(usage, 'completion_tokens', 0) or 0,
+        )
+
+
+class GeminiProvider(AIProvider):
+    name = 'gemini'
+    default_model = 'gemini-1.5-pro'
+    supports_batch = True
+
+    def __init__(self, model=None, **options):
+        super().__init__(model, **options)
+        api_key = os.getenv("GOOGLE_API_KEY")
+        if not api_key:
+            logger.warning("GOOGLE_API_KEY not found. AI parsing disabled.")
+            return
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            logger.warning("google-generativeai package not installed. AI parsing disabled.")
+            return
+        genai.configure(api_key=api_key)
+        self.client = genai.GenerativeModel(self.model)
+
+    def complete(self, prompt, system_prompt):
+        response = self.client.generate_content(prompt)
+        usage = getattr(response, 'usage_metadata', None)
+        # Naive JSON extraction for Gemini (it sometimes wraps in markdown)
+        content = response.text.replace('```json', '').replace('```', '').strip()
+        return (
+            content,
+            getattr(usage, 'prompt_token_count', 0) or 0,
+            getattr(usage, 'candidates_token_count', 0) or 0,
+        )
+
+
+class LocalProviderError(Exception):
+    """Simulated provider failure (LocalProvider failure_rate)"""
+
+
+class LocalProvider(AIProvider):
+    """
+    Offline, deterministic stand-in for an LLM
+
+    Answers with regex-extracted fields so the whole AI fallback path
+    (prompting, caching, batching, stats, spider integration) can be
+    exercised and benchmarked without network access or API keys.
+
+    OPTIONS (AI_PROVIDER_OPTIONS):
+    - latency_ms:   simulated response time per request (default 0)
+    - jitter:       ± fraction of latency_ms, uniform (default 0)
+    - failure_rate: probability a request raises LocalProviderError (default 0)
+    - seed:         RNG seed; same seed → same latencies and failures
+    """
+
+    name = 'local'
+    default_model = 'local-rules'
+    supports_batch = True
+
+    DATE = r'(\d{4}-\d{2}-\d{2}|\d{1,2}[./-]\d{1,2}[./-]\d{4})'
+    FIELD_PATTERNS = {
+        'application_start': re.compile(r'(?:opening|start(?:ing|s)?|commencement)\D{0,40}?' + DATE, re.I),
+        'application_end': re.compile(r'(?:last|closing|end)\s+(?:date|day)\D{0,40}?' + DATE, re.I),
+        'exam_date': re.compile(r'(?:exam(?:ination)?\s+date|date\s+of\s+exam(?:ination)?)\D{0,40}?' + DATE, re.I),
+    }
+    EXAM_NAME = re.compile(r'([A-Z][\w&().,\- ]{2,80}?(?:Examination|Exam|Recruitment)\b[\w ,\-()]*?\d{4})')
+    ORGANIZATION = re.compile(r'(Union Public Service Commission|Staff Selection Commission|\b(?:UPSC|SSC|IBPS|RRB)\b)')
+    VACANCIES = re.compile(r'vacanc\w*\D{0,20}?([\d,]+)', re.I)
+    DOCUMENT_SPLIT = re.compile(r'--- Document \d+ ---')
+
+    def __init__(self, model=None, **options):
+        super().__init__(model, **options)
+        self.latency_ms = float(options.get('latency_ms', 0))
+        self.jitter = float(options.get('jitter', 0))
+        self.failure_rate = float(options.get('failure_rate', 0))
+        self.rng = random.Random(options.get('seed', 0))
+        self.client = self  # always available
+
+    def complete(self, prompt, system_prompt):
+        delay = self.latency_ms * (1 + self.jitter * self.rng.uniform(-1, 1))
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if self.rng.random() < self.failure_rate:
+            raise LocalProviderError("simulated provider failure")
+
+        if self.DOCUMENT_SPLIT.search(prompt):
+            documents = self.DOCUMENT_SPLIT.split(prompt)[1:]
+            content = json.dumps({'results': [self.extract(doc) for doc in documents]})
+        else:
+            text = prompt.split('Text Content:', 1)[-1]
+            content = json.dumps(self.extract(text))
+        return content, len(prompt) // 4, len(content) // 4
+
+    def extract(self, text: str) -> Dict[str, object]:
+        """Rule-based answer for one document"""
+        name = self.EXAM_NAME.search(text)
+        organization = self.ORGANIZATION.search(text)
+        vacancies = self.VACANCIES.search(text)
+        dates = re.findall(self.DATE, text)
+
+        result = {
+            'exam_name': name.group(1).strip() if name else (text.strip()[:80] or None),
+            'organization': organization.group(1) if organization else None,
+            'notification_date': dates[0] if dates else None,
+            'total_vacancies': int(vacancies.group(1).replace(',', '')) if vacancies else None,
+            'official_link': None,
+        }
+        for field, pattern in self.FIELD_PATTERNS.items():
+            match = pattern.search(text)
+            result[field] = match.group(1) if match else None
+        return result
+
+
+PROVIDERS = {
+    'openai': OpenAIProvider,
+    'gemini': GeminiProvider,
+    'local': LocalProvider,
+}
+
+
+def register_provider(name: str, provider_class):
+    PROVIDERS[name] = provider_class
+
+
+def create_provider(name: str, model: Optional[str] = None, **options) -> AIProvider:
+    """
+    Instantiate a provider by registry name or dotted class path
+
+    Unknown names give an unavailable base provider (AI parsing disabled).
+    """
+    provider_class = PROVIDERS.get(name)
+    if provider_class is None and '.' in (name or ''):
+        module_name, _, class_name = name.rpartition('.')
+        try:
+            provider_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError) as e:
+            logger.warning(f"Could not load AI provider {name}: {e}")
+    if provider_class is None:
+        logger.warning(f"Unknown AI provider '{name}'. AI parsing disabled.")
+        return AIProvider(model, **options)
+    return provider_class(model, **options)
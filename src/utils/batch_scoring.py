@@ -0,0 +1,121 @@
+"""
+Columnar confidence scoring and validation for stored notifications
+
+Batch counterpart of BaseExamScraper.calculate_confidence() and
+validate_data(), for re-scoring ExamEvent.details rows in bulk (backfills,
+threshold changes). Each field is reduced to one NumPy boolean mask over
+the batch; scores and validity are then whole-array arithmetic instead of
+clean_text()/urlparse() per field per item.
+
+SCORING (same weights as calculate_confidence):
+- exam_name 30, organization 20, notification_date 15
+- official_link 15 if it has a scheme and a host
+- application_start AND application_end 10, exam_date 10
+
+ASSUMPTIONS:
+- Records are the dicts finalize_notification() produced (already
+  cleaned), so a name only has to be "not blank": no unescape or Unicode
+  normalization is needed; dates count when truthy, as per item
+- URL validity is a precompiled regex equivalent to urlparse() having
+  both scheme and netloc
+
+FAILURE MODES:
+- Non-dict record → every field absent (score 0, invalid)
+- Non-string values count as present when truthy, like the per-item code
+- A mandatory field holding only "&nbsp;" is missing here; validate_data()
+  only strips whitespace and would accept it
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Sequence
+
+import numpy as np
+
+CONFIDENCE_WEIGHTS = {
+    'exam_name': 30,
+    'organization': 20,
+    'notification_date': 15,
+    'official_link': 15,
+    'exam_date': 10,
+}
+APPLICATION_DATES_WEIGHT = 10
+MANDATORY_FIELDS = ('exam_name', 'organization')
+REVIEW_THRESHOLD = 70
+
+# Scored as clean_text() non-empty / plain truthiness / valid URL
+TEXT_FIELDS = ('exam_name', 'organization')
+DATE_FIELDS = ('notification_date', 'application_start', 'application_end', 'exam_date')
+URL_FIELDS = ('official_link',)
+
+# Blank after clean_text(): whitespace and the entities it unescapes to whitespace
+_BLANK_RE = re.compile(r'(?:\s|&nbsp;|&#160;|&#xa0;)*', re.I)
+# urlparse(): scheme is a letter then [a-z0-9+.-], netloc follows '//'
+# and runs to the first '/', '?' or '#'; leading C0/space is stripped
+_URL_RE = re.compile(r'[\x00-\x20]*[A-Za-z][A-Za-z0-9+.\-]*://[^/?#\s]')
+
+
+class BatchScores(NamedTuple):
+    scores: np.ndarray   # int16, 0-100
+    valid: np.ndarray    # bool, mandatory fields present
+    review: np.ndarray   # bool, invalid or below threshold
+
+
+def has_text(value) -> bool:
+    if not value:
+        return False
+    if isinstance(value, str):
+        return not _BLANK_RE.fullmatch(value)
+    return True
+
+
+def valid_url(value) -> bool:
+    return isinstance(value, str) and _URL_RE.match(value) is not None
+
+
+def field_masks(records: Sequence[Dict]) -> Dict[str, np.ndarray]:
+    """One boolean mask per scored field, aligned with `records`"""
+    count = len(records)
+    rows = [record if isinstance(record, dict) else {} for record in records]
+    masks = {
+        field: np.fromiter((has_text(row.get(field)) for row in rows), dtype=bool, count=count)
+        for field in TEXT_FIELDS
+    }
+    for field in DATE_FIELDS:
+        masks[field] = np.fromiter((bool(row.get(field)) for row in rows), dtype=bool, count=count)
+    for field in URL_FIELDS:
+        masks[field] = np.fromiter((valid_url(row.get(field)) for row in rows), dtype=bool, count=count)
+    return masks
+
+
+def score_masks(masks: Dict[str, np.ndarray]) -> np.ndarray:
+    """Confidence score per row (int16), capped at 100"""
+    scores = np.zeros(len(next(iter(masks.values()))), dtype=np.int16)
+    for field, weight in CONFIDENCE_WEIGHTS.items():
+        scores += masks[field] * np.int16(weight)
+    scores += (masks['application_start'] & masks['application_end']) * np.int16(APPLICATION_DATES_WEIGHT)
+    return np.minimum(scores, 100, out=scores)
+
+
+def validate_masks(masks: Dict[str, np.ndarray], mandatory: Iterable[str] = MANDATORY_FIELDS) -> np.ndarray:
+    """True where every mandatory field is present"""
+    return np.logical_and.reduce([masks[field] for field in mandatory])
+
+
+def score_records(records: Sequence[Dict], threshold: int = REVIEW_THRESHOLD) -> BatchScores:
+    """
+    Score and validate a batch of records
+
+    `review` is what requires_manual_review should be: rows failing
+    validation are flagged too, since finalize_notification() never scored
+    them.
+    """
+    masks = field_masks(records)
+    scores = score_masks(masks)
+    valid = validate_masks(masks)
+    return BatchScores(scores, valid, ~valid | (scores < threshold))
+
+
+def missing_fields(masks: Dict[str, np.ndarray], row: int,
+                   mandatory: Iterable[str] = MANDATORY_FIELDS) -> List[str]:
+    """validate_data()'s missing-field list for one row"""
+    return [field for field in mandatory if not masks[field][row]]
@@ -0,0 +1,65 @@
+"""
+Lazy Django bootstrap for non-Django processes (Scrapy, Celery)
+
+ASSUMPTIONS:
+- Django is only needed by code that touches the ORM (DB pipeline, tasks)
+- Importing Scrapy settings or spider modules must NOT pay Django init cost
+
+CONDITIONS:
+- setup_django() is idempotent: safe to call from every pipeline/task
+- sys.path is only extended once, and only with missing entries
+
+FAILURE MODES:
+- django.setup() fails → logged, returns False (caller decides)
+"""
+
+import os
+import sys
+import logging
+
+logger = logging.getLogger(__name__)
+
+# src/utils/django_setup.py → src/utils → src → project root
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.dirname(SRC_DIR)
+ADMIN_PANEL_DIR = os.path.join(SRC_DIR, 'admin_panel')
+
+_django_ready = False
+
+
+def _extend_sys_path():
+    """Add project root, src and admin_panel to sys.path (once)."""
+    for path in (PROJECT_ROOT, SRC_DIR, ADMIN_PANEL_DIR):
+        if path not in sys.path:
+            sys.path.append(path)
+
+
+def setup_django(settings_module: str = 'admin_panel.settings') -> bool:
+    """
+    Initialize Django exactly once for this process.
+
+    `settings_module` is only used if DJANGO_SETTINGS_MODULE is not already set.
+
+    Returns True if Django is ready (either already set up or set up now).
+    """
+    global _django_ready
+    if _django_ready:
+        return True
+
+    _extend_sys_path()
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+
+    import django
+    from django.apps import apps
+
+    if apps.ready:
+        _django_ready = True
+        return True
+
+    try:
+        django.setup()
+        _django_ready = True
+    except Exception as e:
+        logger.error(f"Failed to setup Django: {e}")
+
+    return _django_ready
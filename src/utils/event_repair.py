@@ -0,0 +1,144 @@
+"""
+Re-normalize stored notification items (ExamEvent.details)
+
+Repair pass behind `manage.py repair_events`: re-runs the normalization
+finalize_notification() applies at crawl time, so rows stored before a
+parser fix pick it up without a re-crawl.
+
+REPAIRS:
+- exam_name / organization / description: clean_text()
+- notification_date / application_start / application_end / exam_date:
+  extract_date() to YYYY-MM-DD
+- official_link / pdf_link / apply_link: made absolute against source_url
+- total_vacancies: extract_number() when stored as text
+- confidence_score / requires_manual_review: rescored (batch_scoring)
+- ExamEvent columns mirrored from the item the way DatabasePipeline
+  writes them (event_date, application dates, exam_date, links, vacancies)
+
+ASSUMPTIONS:
+- Runs in worker processes: repair_batch() takes and returns plain
+  picklable data, never ORM objects
+- Normalization is idempotent, so a second pass changes nothing
+
+FAILURE MODES:
+- details not a JSON object (list, string) → row skipped, never repaired
+- Date that does not parse → kept as stored (a repair never drops data);
+  its column is left alone, as are columns the item has no value for
+- Relative URL without source_url → kept
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.batch_scoring import score_records
+
+TEXT_FIELDS = ('exam_name', 'organization', 'description')
+DATE_FIELDS = ('notification_date', 'application_start', 'application_end', 'exam_date')
+URL_FIELDS = ('official_link', 'pdf_link', 'apply_link')
+DATE_COLUMNS = ('event_date', 'application_start', 'application_end', 'exam_date')
+
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# (pk, details, current column values with dates as ISO strings)
+Row = Tuple[int, Dict[str, Any], Dict[str, Any]]
+# (pk, repaired details or None if unchanged, changed column values)
+Repair = Tuple[int, Optional[Dict[str, Any]], Dict[str, Any]]
+
+# One normalizer per worker process
+_NORMALIZER = None
+
+
+def _normalizer():
+    """BaseExamScraper instance for its clean/extract helpers (built once)"""
+    global _NORMALIZER
+    if _NORMALIZER is None:
+        from src.scrapers.base_scraper_complete import BaseExamScraper
+
+        _NORMALIZER = BaseExamScraper()
+        # Unparseable dates are expected in old rows; one warning each would flood the log
+        logging.getLogger(_NORMALIZER.name).setLevel(logging.ERROR)
+    return _NORMALIZER
+
+
+def repair_item(details: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalized copy of one stored item (scores are left to repair_batch)"""
+    from scrapy.http import Response
+
+    normalizer = _normalizer()
+    data = dict(details)
+
+    for field in TEXT_FIELDS:
+        if isinstance(data.get(field), str) and data[field]:
+            data[field] = normalizer.clean_text(data[field])
+
+    for field in DATE_FIELDS:
+        value = data.get(field)
+        if isinstance(value, str) and value and not ISO_DATE_RE.fullmatch(value):
+            data[field] = normalizer.extract_date(value) or value
+
+    source_url = data.get('source_url')
+    if source_url:
+        response = Response(url=source_url)
+        for field in URL_FIELDS:
+            if isinstance(data.get(field), str) and data[field]:
+                data[field] = normalizer.make_absolute_url(data[field], response)
+
+    if isinstance(data.get('total_vacancies'), str):
+        data['total_vacancies'] = normalizer.extract_number(data['total_vacancies'])
+
+    return data
+
+
+def event_columns(details: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    ExamEvent column values for an item, mapped as DatabasePipeline does
+
+    Empty values, dates that are not YYYY-MM-DD and non-integer vacancies
+    are omitted: a repair never clears a column or writes something the
+    DB would reject.
+    """
+    columns = {
+        'event_date': details.get('notification_date') or details.get('result_date'),
+        'application_start': details.get('application_start'),
+        'application_end': details.get('application_end'),
+        'exam_date': details.get('exam_date'),
+        'official_link': details.get('official_link') or details.get('source_url'),
+        'pdf_link': details.get('pdf_link'),
+        'total_vacancies': details.get('total_vacancies'),
+    }
+    for column in DATE_COLUMNS:
+        if columns[column] and not (isinstance(columns[column], str) and ISO_DATE_RE.fullmatch(columns[column])):
+            columns[column] = None
+    vacancies = columns['total_vacancies']
+    if not isinstance(vacancies, int) or isinstance(vacancies, bool):
+        columns['total_vacancies'] = None
+    return {column: value for column, value in columns.items() if value not in (None, '')}
+
+
+def repair_batch(rows: List[Row], threshold: Optional[int] = None) -> List[Repair]:
+    """
+    Repair a batch of rows; only rows with something to write are returned
+
+    Runs in a worker process (see repair_events); rescoring uses the
+    columnar scorer over the whole batch. Rows whose details are not a
+    dict are skipped.
+    """
+    rows = [row for row in rows if isinstance(row[1], dict)]
+    repaired = [repair_item(details) for _, details, _ in rows]
+    kwargs = {'threshold': threshold} if threshold is not None else {}
+    result = score_records(repaired, **kwargs)
+
+    changes = []
+    for index, (pk, details, columns) in enumerate(rows):
+        data = repaired[index]
+        data['confidence_score'] = int(result.scores[index])
+        if result.review[index] or 'requires_manual_review' in data:
+            data['requires_manual_review'] = bool(result.review[index])
+        column_changes = {
+            column: value for column, value in event_columns(data).items()
+            if columns.get(column) != value
+        }
+        if data != details or column_changes:
+            changes.append((pk, data if data != details else None, column_changes))
+    return changes
@@ -0,0 +1,265 @@
+"""
+Generic heuristic extractor for exam notification blocks
+
+Strategy 2 of BaseExamScraper.parse_with_strategies(): no site-specific
+selectors and no LLM, just patterns every board's pages share.
+
+FIELDS:
+- exam_name: anchor text of the PDF link if it reads like a title, else
+  a table cell or the nearest heading, else the first sentence naming an
+  exam; serial numbers, advt. references and trailing dates/post counts
+  are trimmed
+- pdf_link: first href ending in .pdf
+- application_start / application_end / exam_date: first date within
+  LABEL_WINDOW characters after a matching label, or a registration
+  date range ("01/08/2026 to 21/08/2026")
+- notification_date: first date that no label claimed
+- total_vacancies: number next to "vacancies"/"posts" (either side),
+  dates removed first so "05/07/2026 posts" cannot match
+
+CONFIDENCE (0-100, returned as heuristic_confidence):
+- exam_name 40 (+10 if it names an exam keyword and a year)
+- pdf_link 15, each date field 8, total_vacancies 11
+
+ASSUMPTIONS:
+- Works on plain text + links, so one block (row, list item, paragraph)
+  costs a handful of precompiled regex scans, well under a millisecond
+- Dates are returned as found; the spider's extract_date() normalizes
+
+DOES NOT:
+- Know the organization (the spider supplies exam_organization)
+- Resolve relative links (finalize_notification does)
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DATE = (r'(\d{1,2}[./-]\d{1,2}[./-]\d{4}|\d{4}-\d{2}-\d{2}'
+        r'|\d{1,2}(?:st|nd|rd|th)?\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?,?\s+\d{4})')
+DATE_RE = re.compile(DATE, re.I)
+
+# Characters between a label and its date ("Last date for receipt of
+# online applications: 05/07/2026" is ~40)
+LABEL_WINDOW = 60
+
+# Order matters: see LABEL_RE. A date claimed by one label is not reused
+DATE_LABELS = {
+    'exam_date': re.compile(
+        r'(?:exam(?:ination)?|cbt|test)\s+(?:date|on|will\s+be\s+held)'
+        r'|(?:date\s+of\s+)?commencement\s+of\s+(?:exam(?:ination)?|cbt|test)'
+        r'|date\s+of\s+(?:exam(?:ination)?|cbt|test)', re.I),
+    'application_start': re.compile(
+        r'(?:opening|start(?:ing)?|commencement|apply\s+from|begins?)\b', re.I),
+    'application_end': re.compile(
+        r'(?:last|closing|end)\s+date|apply\s+(?:by|before|till)|closes?\s+on', re.I),
+}
+
+# All labels in one scan; at the same position the earlier field wins.
+# Matched against lowercased text (faster than re.I); spans are unchanged.
+LABEL_RE = re.compile('|'.join(f'(?P<{field}>{label.pattern})' for field, label in DATE_LABELS.items()))
+
+# "Online registration: 01/08/2026 to 21/08/2026" → start and end
+APPLICATION_RANGE_RE = re.compile(
+    r'(?:registration|application|apply)\D{0,40}?' + DATE + r'\s*(?:to|till|until|-|–)\s*' + DATE)
+
+VACANCY_RE = re.compile(
+    r'(\d[\d,]*)\s*(?:\(\s*)?(?:total\s+)?(?:vacanc(?:y|ies)|posts?)\b'
+    r'|(?:vacanc(?:y|ies)|posts?|no\.?\s+of\s+posts)\D{0,25}?(\d[\d,]*)'
+)
+EXAM_WORD_RE = re.compile(r'\b(?:exam(?:ination)?|recruitment|test|cbt|notice|notification|advt|advertisement)\b', re.I)
+YEAR_RE = re.compile(r'(?<![/\d-])\b(?:19|20)\d{2}\b')
+NAV_WORDS = frozenset({'home', 'about us', 'contact us', 'click here', 'download', 'view', 'new', 'more', 'pdf'})
+# Link texts that describe the action, not the notice ("Download CEN 02/2026")
+GENERIC_ANCHOR_RE = re.compile(r'^(?:download|view|click|read|see|open)\b', re.I)
+
+# Title clean-up: leading serial number / advertisement reference, and
+# everything from the first date, date label or "(N posts)" on
+TITLE_PREFIX_RE = re.compile(
+    r'^(?:\d{1,3}[.)]?\s+)?(?:(?:advt|advertisement|notice)?\.?\s*(?:no\.?)?\s*[\w-]*?\d+/\d{4}\s*[:\-–]\s*)?', re.I)
+TITLE_END_RE = re.compile(
+    DATE + r'|[(\s]+(?:for\s+)?\d[\d,]*\s+(?:total\s+)?(?:posts?|vacanc)'
+    + ''.join(f'|{label.pattern}' for label in DATE_LABELS.values()),
+    re.I,
+)
+
+CONFIDENCE_WEIGHTS = {
+    'exam_name': 40,
+    'pdf_link': 15,
+    'application_start': 8,
+    'application_end': 8,
+    'exam_date': 8,
+    'total_vacancies': 11,
+}
+TITLE_BONUS = 10
+
+Link = Tuple[str, str]  # (anchor text, href)
+
+
+def _clean(text: Optional[str]) -> str:
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def looks_like_title(text: str) -> bool:
+    text = _clean(text)
+    if len(text) < 8 or text.lower() in NAV_WORDS or GENERIC_ANCHOR_RE.match(text):
+        return False
+    return len(text.split()) >= 3 and bool(EXAM_WORD_RE.search(text) or YEAR_RE.search(text))
+
+
+def _lower(text: str) -> str:
+    """Lowercase without changing length, so match spans map back onto text"""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        lowered = ''.join(c.lower() if len(c.lower()) == 1 else c for c in text)
+    return lowered
+
+
+def trim_title(text: str) -> str:
+    text = TITLE_PREFIX_RE.sub('', _clean(text), count=1)
+    end = TITLE_END_RE.search(text, 8)
+    if end:
+        text = text[:end.start()]
+    return text.strip(' -–:,.;(|')[:200]
+
+
+class HeuristicParser:
+    """Stateless; one instance can be shared by every page of a crawl"""
+
+    def extract(self, text: str, links: Iterable[Link] = (), titles: Iterable[str] = ()) -> Optional[Dict]:
+        """
+        Extract fields from one block of text
+
+        `links` are the block's (anchor text, href) pairs, `titles` other
+        title candidates (table cells, then page headings), best first.
+        Returns None when no exam name can be found.
+        """
+        text = _clean(text)
+        links = [(_clean(anchor), href) for anchor, href in links if href]
+        pdf_links = [(anchor, href) for anchor, href in links if href.lower().split('?')[0].endswith('.pdf')]
+
+        data: Dict = {'exam_name': self._title(text, pdf_links or links, titles)}
+        if not data['exam_name']:
+            return None
+        if pdf_links:
+            data['pdf_link'] = pdf_links[0][1]
+
+        # One date scan; labels and vacancies work from these spans
+        dates = [(match.start(1), match.end(1), match.group(1)) for match in DATE_RE.finditer(text)]
+        lowered = _lower(text)
+        if dates:
+            self._dates(text, lowered, dates, data)
+
+        vacancies = self._vacancies(lowered, dates)
+        if vacancies:
+            data['total_vacancies'] = vacancies
+
+        data['heuristic_confidence'] = self.confidence(data)
+        return data
+
+    def confidence(self, data: Dict) -> int:
+        score = sum(weight for field, weight in CONFIDENCE_WEIGHTS.items() if data.get(field))
+        name = data.get('exam_name') or ''
+        if EXAM_WORD_RE.search(name) and YEAR_RE.search(name):
+            score += TITLE_BONUS
+        return min(score, 100)
+
+    def parse_element(self, element, headings: Iterable[str] = ()) -> Optional[Dict]:
+        """extract() on a parsel Selector (table row, list item, div)"""
+        text = ' '.join(element.xpath('.//text()[not(ancestor::script or ancestor::style)]').getall())
+        links = [(' '.join(a.xpath('.//text()').getall()), a.attrib.get('href', '')) for a in element.xpath('.//a[@href]')]
+        cells = [' '.join(cell.xpath('.//text()').getall()) for cell in element.xpath('./td | ./th')]
+        return self.extract(text, links, [*cells, *headings])
+
+    def parse_page(self, response, pdf_link: Optional[str] = None) -> Optional[Dict]:
+        """
+        Best block of a notification page
+
+        Candidate blocks are the innermost elements holding a PDF link (tr,
+        li, p, div). On a listing page (several candidates) the block whose
+        link is `pdf_link` wins; if `pdf_link` matches no block the page is
+        not parsed (None, so the AI fallback gets it) rather than pairing the
+        caller's row with another notice. Without `pdf_link` the most
+        confident block wins. A page with at most one candidate is a detail
+        page: its whole <main>/<body> is parsed, titled by its headings
+        (h1-h3).
+        """
+        candidates = response.xpath(
+            '//*[self::tr or self::li or self::p or self::div][.//a[contains(translate(@href, "PDF", "pdf"), ".pdf")]]'
+            '[not(.//*[self::tr or self::li or self::p or self::div][.//a[contains(translate(@href, "PDF", "pdf"), ".pdf")]])]'
+        )
+
+        if len(candidates) > 1:
+            best = None
+            for element in candidates:
+                data = self.parse_element(element)
+                if not data:
+                    continue
+                if pdf_link and data.get('pdf_link') and response.urljoin(data['pdf_link']) == response.urljoin(pdf_link):
+                    return data
+                if best is None or data['heuristic_confidence'] > best['heuristic_confidence']:
+                    best = data
+            return None if pdf_link else best
+
+        headings = [_clean(h) for h in response.xpath('//h1//text() | //h2//text() | //h3//text()').getall()]
+        body = response.xpath('//main') or response.xpath('//body')
+        return self.parse_element(body[0], headings) if body else None
+
+    # ========================================================================
+    # FIELD HELPERS
+    # ========================================================================
+
+    def _title(self, text: str, links: List[Link], titles: Iterable[str]) -> Optional[str]:
+        candidates = [anchor for anchor, _ in links]
+        candidates.extend(titles)
+        candidates.extend(sentence for sentence in re.split(r'(?<=[.!?|])\s+(?=[A-Z])', text)
+                          if EXAM_WORD_RE.search(sentence))
+        for candidate in candidates:
+            if looks_like_title(candidate):
+                title = trim_title(candidate)
+                if looks_like_title(title):
+                    return title
+        return None
+
+    @staticmethod
+    def _dates(text: str, lowered: str, dates: List[Tuple[int, int, str]], data: Dict):
+        """Fill date fields from labelled dates, the rest is notification_date"""
+        claimed = set()
+        application = APPLICATION_RANGE_RE.search(lowered)
+        if application:
+            data['application_start'] = text[application.start(1):application.end(1)]
+            data['application_end'] = text[application.start(2):application.end(2)]
+            claimed.update({application.start(1), application.start(2)})
+
+        for label in LABEL_RE.finditer(lowered):
+            field = label.lastgroup
+            if field in data:
+                continue
+            for start, _, value in dates:
+                if start >= label.end() + LABEL_WINDOW:
+                    break
+                if start >= label.end() and start not in claimed:
+                    data[field] = value
+                    claimed.add(start)
+                    break
+
+        for start, _, value in dates:
+            if start not in claimed:
+                data['notification_date'] = value
+                break
+
+    @staticmethod
+    def _vacancies(lowered: str, dates: List[Tuple[int, int, str]]) -> Optional[int]:
+        if 'vacanc' not in lowered and 'post' not in lowered:
+            return None
+        text = lowered
+        if dates:
+            # Blank out dates (same length, so nothing shifts)
+            chars = list(text)
+            for start, end, _ in dates:
+                chars[start:end] = ' ' * (end - start)
+            text = ''.join(chars)
+        for match in VACANCY_RE.finditer(text):
+            digits = (match.group(1) or match.group(2)).replace(',', '')
+            if digits.isdigit() and 0 < int(digits) < 1_000_000 and not YEAR_RE.fullmatch(digits):
+                return int(digits)
+        return None
@@ -0,0 +1,160 @@
+"""
+Token-budgeted text windowing for AI parsing input
+
+Instead of sending the first N characters of a page (navigation menus,
+then a cut-off dates table), pages are split into blocks, each block is
+scored by how much it looks like notification content, and the best
+blocks are kept, in document order, within a token budget.
+
+SCORING (per block):
+- dates (dd/mm/yyyy, yyyy-mm-dd, "5 July 2026")  → 3 points each
+- exam keywords (last date, vacancy, examination, ...) → 2 points each
+- other numbers → 1 point each
+divided by (tokens + 8): density, not length, wins, and the constant
+keeps two-word blocks like "2026" from outranking a real dates row.
+
+ASSUMPTIONS:
+- ~4 characters per token (no tokenizer dependency); good enough for a
+  budget, not for billing (billing uses provider-reported usage)
+- Block boundaries are newlines; html_text_blocks() produces them from
+  block-level HTML elements
+
+HANDLES:
+- Pages under budget: returned whole (only whitespace normalized)
+- Repeated blocks (menus in header and footer): kept once
+- Single huge block (no newlines): split at sentence boundaries
+- A block larger than the whole budget: truncated
+"""
+
+import re
+from typing import List, NamedTuple
+
+CHARS_PER_TOKEN = 4
+
+DATE_RE = re.compile(
+    r'\b\d{1,2}[./-]\d{1,2}[./-]\d{2,4}\b'
+    r'|\b\d{4}-\d{2}-\d{2}\b'
+    r'|\b\d{1,2}(?:st|nd|rd|th)?\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?,?\s+\d{4}\b',
+    re.I,
+)
+NUMBER_RE = re.compile(r'\b\d[\d,]*\b')
+KEYWORD_RE = re.compile(
+    r'\b(?:last\s+date|closing\s+date|opening\s+date|start\s+date|important\s+dates?|'
+    r'exam(?:ination)?\s+date|notification|vacanc(?:y|ies)|posts?|recruitment|'
+    r'examination|eligibility|age\s+limit|application|apply|fee|admit\s+card|result)\b',
+    re.I,
+)
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?;])\s+')
+
+# Blocks longer than this (chars) are split at sentence boundaries
+MAX_BLOCK_CHARS = 600
+
+# HTML elements whose text is one block (nearest one wins)
+BLOCK_TAGS = frozenset({
+    'p', 'div', 'li', 'tr', 'dt', 'dd', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'section', 'article', 'header', 'footer', 'nav', 'aside', 'main',
+    'blockquote', 'pre', 'caption', 'form', 'table', 'ul', 'ol', 'body',
+})
+SKIP_TAGS = frozenset({'script', 'style', 'noscript', 'template'})
+
+
+class Window(NamedTuple):
+    text: str
+    raw_tokens: int
+    tokens: int
+    blocks_kept: int
+    blocks_total: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.raw_tokens - self.tokens
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def score_block(block: str) -> float:
+    dates = len(DATE_RE.findall(block))
+    numbers = len(NUMBER_RE.findall(DATE_RE.sub(' ', block)))
+    keywords = len(KEYWORD_RE.findall(block))
+    return (3 * dates + 2 * keywords + numbers) / (estimate_tokens(block) + 8)
+
+
+def split_blocks(text: str) -> List[str]:
+    """Whitespace-normalized, de-duplicated blocks in document order"""
+    blocks, seen = [], set()
+    for line in (text or '').splitlines():
+        line = re.sub(r'\s+', ' ', line).strip()
+        if not line:
+            continue
+        parts = SENTENCE_SPLIT.split(line) if len(line) > MAX_BLOCK_CHARS else [line]
+        for part in parts:
+            if part and part not in seen:
+                seen.add(part)
+                blocks.append(part)
+    return blocks
+
+
+def select_window(text: str, max_tokens: int) -> Window:
+    """
+    Best-scoring blocks of `text` within `max_tokens`, in document order
+
+    Blocks are taken by descending score; zero-score blocks only fill
+    budget that is left over, earliest first.
+    """
+    raw = re.sub(r'\s+', ' ', text or '').strip()
+    raw_tokens = estimate_tokens(raw)
+    blocks = split_blocks(text)
+    if raw_tokens <= max_tokens:
+        return Window(raw, raw_tokens, raw_tokens, len(blocks), len(blocks))
+
+    budget = max_tokens * CHARS_PER_TOKEN
+    ranked = sorted(range(len(blocks)), key=lambda i: (-score_block(blocks[i]), i))
+    kept, used = set(), 0
+    for i in ranked:
+        cost = len(blocks[i]) + 1  # joining space
+        if used + cost <= budget:
+            kept.add(i)
+            used += cost
+        elif not kept:
+            # First choice alone is over budget: keep its head
+            blocks[i] = blocks[i][:budget - 1]
+            kept.add(i)
+            used = budget
+            break
+
+    selected = ' '.join(blocks[i] for i in sorted(kept))
+    tokens = estimate_tokens(selected)
+    return Window(selected, raw_tokens, tokens, len(kept), len(blocks))
+
+
+def html_text_blocks(selector) -> str:
+    """
+    Page text with one line per block-level element (Scrapy Selector/Response)
+
+    Inline markup stays inside its block, so "Last date: <b>05/07/2026</b>"
+    remains one line, and script/style text is dropped.
+    """
+    root = getattr(selector, 'selector', selector).root
+    lines, current, owner = [], [], None
+    for text_node in root.xpath('//body//text()'):
+        parent = text_node.getparent()
+        element = parent if text_node.is_text else parent.getparent()
+        if element is None or element.tag in SKIP_TAGS or any(
+                ancestor.tag in SKIP_TAGS for ancestor in element.iterancestors()):
+            continue
+
+        block = element
+        while block is not None and block.tag not in BLOCK_TAGS:
+            block = block.getparent()
+        if block is not owner and current:
+            lines.append(' '.join(current))
+            current = []
+        owner = block
+        stripped = str(text_node).strip()
+        if stripped:
+            current.append(stripped)
+    if current:
+        lines.append(' '.join(current))
+    return '\n'.join(lines)